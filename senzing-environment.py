@@ -5,19 +5,30 @@
 # -----------------------------------------------------------------------------
 
 import argparse
+import base64
+import concurrent.futures
 import configparser
+import errno
+import fcntl
+import hashlib
+import io
 import json
 import linecache
 import logging
 import os
+import random
 import re
 import shutil
 import signal
 import socket
 import stat
 import string
+import struct
+import subprocess
 import sys
+import tempfile
 import time
+import urllib.request
 from urllib.parse import urlparse, urlunparse
 
 __all__ = []
@@ -26,8 +37,39 @@ __date__ = '2020-04-23'
 __updated__ = '2021-03-17'
 
 SENZING_PRODUCT_ID = "5015"  # See https://github.com/Senzing/knowledge-base/blob/master/lists/senzing-product-ids.md
+SENZING_DOCKER_PORT_PGBOUNCER = 6432  # Must match SENZING_DOCKER_PORT_PGBOUNCER in docker-environment-vars.sh
+DOCKER_BIN_MANIFEST = ".senzing-environment-manifest.json"  # Content hashes of generated docker-bin files.
+FICLONE = 0x40049409  # Linux ioctl request number for a reflink clone. See ioctl_ficlone(2).
+
+# Files in <project>/docker-etc that are generated from <project>/etc rather than copied.
+# See project_modify_G2Module_ini().  All other files are cloned or copied from <project>/etc.
+
+docker_etc_modified_files = [
+    "G2Module.ini",
+]
+
+# PostgreSQL instances added by --database-cluster, beyond the "core" instance.
+# "port" must match SENZING_DOCKER_PORT_POSTGRES_* in docker-environment-vars.sh.
+# "tables" are assigned to the instance in the [HYBRID] section of G2Module.ini.
+
+postgres_cluster_instances = {
+    "res": {
+        "cluster": "C1",
+        "port": 5433,
+        "tables": ["RES_FEAT_EKEY", "RES_FEAT_LKEY", "RES_FEAT_STAT"],
+    },
+    "libfeat": {
+        "cluster": "C2",
+        "port": 5434,
+        "tables": ["LIB_FEAT", "LIB_FEAT_HKEY"],
+    },
+}
 log_format = '%(asctime)s %(message)s'
 
+# Queue types for SENZING_RABBITMQ_QUEUE.  See senzing-rabbitmq.sh.
+
+rabbitmq_queue_types = ["classic", "lazy", "quorum"]
+
 # Lists from https://www.ietf.org/rfc/rfc1738.txt
 
 safe_character_list = ['$', '-', '_', '.', '+', '!', '*', '(', ')', ',', '"'] + list(string.ascii_letters)
@@ -38,6 +80,61 @@ reserved_character_list = [';', ',', '/', '?', ':', '@', '=', '&']
 # 1) Command line options, 2) Environment variables, 3) Configuration files, 4) Default values
 
 configuration_locator = {
+    "backup_id": {
+        "default": None,
+        "env": "SENZING_BACKUP_ID",
+        "cli": "backup-id"
+    },
+    "backup_keep_count": {
+        "default": 10,
+        "env": "SENZING_BACKUP_KEEP_COUNT",
+        "cli": "backup-keep-count"
+    },
+    "backup_keep_days": {
+        "default": 0,
+        "env": "SENZING_BACKUP_KEEP_DAYS",
+        "cli": "backup-keep-days"
+    },
+    "benchmark_loaders": {
+        "default": None,
+        "env": "SENZING_BENCHMARK_LOADERS",
+        "cli": "benchmark-loaders"
+    },
+    "benchmark_records": {
+        "default": 100000,
+        "env": "SENZING_BENCHMARK_RECORDS",
+        "cli": "benchmark-records"
+    },
+    "benchmark_report": {
+        "default": None,
+        "env": "SENZING_BENCHMARK_REPORT",
+        "cli": "benchmark-report"
+    },
+    "benchmark_sample_period_in_seconds": {
+        "default": 5,
+        "env": "SENZING_BENCHMARK_SAMPLE_PERIOD_IN_SECONDS",
+        "cli": "benchmark-sample-period-in-seconds"
+    },
+    "benchmark_seed": {
+        "default": 0,
+        "env": "SENZING_BENCHMARK_SEED",
+        "cli": "benchmark-seed"
+    },
+    "benchmark_timeout_in_seconds": {
+        "default": 3600,
+        "env": "SENZING_BENCHMARK_TIMEOUT_IN_SECONDS",
+        "cli": "benchmark-timeout-in-seconds"
+    },
+    "database_cluster": {
+        "default": False,
+        "env": "SENZING_DATABASE_CLUSTER",
+        "cli": "database-cluster"
+    },
+    "database_pooler": {
+        "default": False,
+        "env": "SENZING_DATABASE_POOLER",
+        "cli": "database-pooler"
+    },
     "debug": {
         "default": False,
         "env": "SENZING_DEBUG",
@@ -48,11 +145,71 @@ configuration_locator = {
         "env": "SENZING_DOCKER_HOST_IP_ADDR",
         "cli": "docker-host-ip-addr"
     },
+    "docker_registry_mirror": {
+        "default": False,
+        "env": "SENZING_DOCKER_REGISTRY_MIRROR",
+        "cli": "docker-registry-mirror"
+    },
     "g2_database_url": {
         "default": "sqlite3://na:na@/var/opt/senzing/sqlite/G2C.db",
         "env": "SENZING_DATABASE_URL",
         "cli": "database-url"
     },
+    "generate_records_count": {
+        "default": 100000,
+        "env": "SENZING_GENERATE_RECORDS_COUNT",
+        "cli": "generate-records-count"
+    },
+    "generate_records_data_sources": {
+        "default": "TEST",
+        "env": "SENZING_GENERATE_RECORDS_DATA_SOURCES",
+        "cli": "generate-records-data-sources"
+    },
+    "generate_records_duplicate_rate": {
+        "default": 0.1,
+        "env": "SENZING_GENERATE_RECORDS_DUPLICATE_RATE",
+        "cli": "generate-records-duplicate-rate"
+    },
+    "generate_records_output": {
+        "default": "-",
+        "env": "SENZING_GENERATE_RECORDS_OUTPUT",
+        "cli": "generate-records-output"
+    },
+    "generate_records_overlap_rate": {
+        "default": 0.0,
+        "env": "SENZING_GENERATE_RECORDS_OVERLAP_RATE",
+        "cli": "generate-records-overlap-rate"
+    },
+    "generate_records_rabbitmq": {
+        "default": False,
+        "env": "SENZING_GENERATE_RECORDS_RABBITMQ",
+        "cli": "generate-records-rabbitmq"
+    },
+    "generate_records_ranges": {
+        "default": None,
+        "env": "SENZING_GENERATE_RECORDS_RANGES",
+        "cli": "generate-records-ranges"
+    },
+    "generate_records_seed": {
+        "default": 0,
+        "env": "SENZING_GENERATE_RECORDS_SEED",
+        "cli": "generate-records-seed"
+    },
+    "overwrite_edited": {
+        "default": False,
+        "env": "SENZING_OVERWRITE_EDITED",
+        "cli": "overwrite-edited"
+    },
+    "postgres_memory_in_mb": {
+        "default": None,
+        "env": "SENZING_POSTGRES_MEMORY_IN_MB",
+        "cli": "postgres-memory-in-mb"
+    },
+    "project_workers": {
+        "default": None,
+        "env": "SENZING_PROJECT_WORKERS",
+        "cli": "project-workers"
+    },
     "project_name": {
         "default": "senzing",
         "env": "SENZING_PROJECT_NAME",
@@ -63,6 +220,36 @@ configuration_locator = {
         "env": "SENZING_PROJECT_DIR",
         "cli": "project-dir"
     },
+    "projects_file": {
+        "default": None,
+        "env": "SENZING_PROJECTS_FILE",
+        "cli": "projects-file"
+    },
+    "rabbitmq_dir": {
+        "default": None,
+        "env": "SENZING_RABBITMQ_DIR",
+        "cli": "rabbitmq-dir"
+    },
+    "rabbitmq_memory_in_mb": {
+        "default": None,
+        "env": "SENZING_RABBITMQ_MEMORY_IN_MB",
+        "cli": "rabbitmq-memory-in-mb"
+    },
+    "rabbitmq_queue_type": {
+        "default": "classic",
+        "env": "SENZING_RABBITMQ_QUEUE_TYPE",
+        "cli": "rabbitmq-queue-type"
+    },
+    "rabbitmq_shards": {
+        "default": 1,
+        "env": "SENZING_RABBITMQ_SHARDS",
+        "cli": "rabbitmq-shards"
+    },
+    "services": {
+        "default": "senzing-api-server.sh senzing-webapp.sh senzing-stream-loader.sh",
+        "env": "SENZING_SERVICES",
+        "cli": "services"
+    },
     "sleep_time_in_seconds": {
         "default": 0,
         "env": "SENZING_SLEEP_TIME_IN_SECONDS",
@@ -73,6 +260,46 @@ configuration_locator = {
         "env": "SENZING_SQL_CONNECTION",
         "cli": "sql-connection"
     },
+    "stream_loader_delay_on_error_in_seconds": {
+        "default": 60,
+        "env": "SENZING_STREAM_LOADER_DELAY_ON_ERROR_IN_SECONDS",
+        "cli": "stream-loader-delay-on-error-in-seconds"
+    },
+    "stream_loader_monitoring_period_in_seconds": {
+        "default": 600,
+        "env": "SENZING_STREAM_LOADER_MONITORING_PERIOD_IN_SECONDS",
+        "cli": "stream-loader-monitoring-period-in-seconds"
+    },
+    "stream_loader_prefetch_count": {
+        "default": 50,
+        "env": "SENZING_STREAM_LOADER_PREFETCH_COUNT",
+        "cli": "stream-loader-prefetch-count"
+    },
+    "stream_loader_threads_per_process": {
+        "default": None,
+        "env": "SENZING_STREAM_LOADER_THREADS_PER_PROCESS",
+        "cli": "stream-loader-threads-per-process"
+    },
+    "stream_producer_input": {
+        "default": None,
+        "env": "SENZING_STREAM_PRODUCER_INPUT",
+        "cli": "stream-producer-input"
+    },
+    "stream_producer_ranges": {
+        "default": None,
+        "env": "SENZING_STREAM_PRODUCER_RANGES",
+        "cli": "stream-producer-ranges"
+    },
+    "stream_producer_record_max": {
+        "default": 5000,
+        "env": "SENZING_STREAM_PRODUCER_RECORD_MAX",
+        "cli": "stream-producer-record-max"
+    },
+    "stream_producer_record_monitor": {
+        "default": 1000,
+        "env": "SENZING_STREAM_PRODUCER_RECORD_MONITOR",
+        "cli": "stream-producer-record-monitor"
+    },
     "subcommand": {
         "default": None,
         "env": "SENZING_SUBCOMMAND",
@@ -100,8 +327,13 @@ def get_parser():
     subcommands = {
         'add-docker-support-linux': {
             "help": 'Update a G2Project to support quickstart.',
-            "argument_aspects": ["support"],
+            "argument_aspects": ["support", "postgres", "rabbitmq", "stream_loader", "stream_producer", "backup", "batch"],
             "arguments": {
+                "--database-cluster": {
+                    "action": "store_true",
+                    "dest": "database_cluster",
+                    "help": "Spread the PostgreSQL database over core, res and libfeat containers. (SENZING_DATABASE_CLUSTER) Default: False",
+                },
                 "--sql-connection": {
                     "dest": "sql_connection",
                     "help": "Override SQL > CONNECTION in G2Module.ini",
@@ -111,7 +343,62 @@ def get_parser():
         },
         'add-docker-support-macos': {
             "help": 'Create a stand-aolne project.',
-            "argument_aspects": ["support"],
+            "argument_aspects": ["support", "postgres", "rabbitmq", "stream_loader", "stream_producer", "backup", "batch"],
+        },
+        'backups-list': {
+            "help": 'List backups in <project>/var/backups.',
+            "argument_aspects": ["project"],
+        },
+        'backups-prune': {
+            "help": 'Import <name>.<epoch> backups made by earlier versions, then remove backups outside the retention policy.',
+            "argument_aspects": ["project", "backup"],
+        },
+        'backups-restore': {
+            "help": 'Restore the files in a backup.',
+            "argument_aspects": ["project"],
+            "arguments": {
+                "--backup-id": {
+                    "dest": "backup_id",
+                    "help": "Backup to restore, as shown by backups-list.",
+                    "metavar": "SENZING_BACKUP_ID",
+                },
+            },
+        },
+        'benchmark-load': {
+            "help": 'Measure loading throughput of a project: bring up the database, RabbitMQ, and stream-loaders, send a synthetic dataset with stream-producer, and write a JSON report.',
+            "argument_aspects": ["project"],
+            "arguments": {
+                "--benchmark-loaders": {
+                    "dest": "benchmark_loaders",
+                    "help": "Number of stream-loader replicas. Default: SENZING_STREAM_LOADER_REPLICAS of the project",
+                    "metavar": "SENZING_BENCHMARK_LOADERS"
+                },
+                "--benchmark-records": {
+                    "dest": "benchmark_records",
+                    "help": "Number of synthetic records sent. Default: 100000",
+                    "metavar": "SENZING_BENCHMARK_RECORDS"
+                },
+                "--benchmark-report": {
+                    "dest": "benchmark_report",
+                    "help": "File the JSON report is written to. Default: <project>/var/benchmark/benchmark-load-<time>.json",
+                    "metavar": "SENZING_BENCHMARK_REPORT"
+                },
+                "--benchmark-sample-period-in-seconds": {
+                    "dest": "benchmark_sample_period_in_seconds",
+                    "help": "Seconds between samples of queue depth and loader logs. Default: 5",
+                    "metavar": "SENZING_BENCHMARK_SAMPLE_PERIOD_IN_SECONDS"
+                },
+                "--benchmark-seed": {
+                    "dest": "benchmark_seed",
+                    "help": "Seed of the synthetic dataset. The same seed and size give the same records. Default: 0",
+                    "metavar": "SENZING_BENCHMARK_SEED"
+                },
+                "--benchmark-timeout-in-seconds": {
+                    "dest": "benchmark_timeout_in_seconds",
+                    "help": "Seconds to wait for all records to be loaded. Default: 3600",
+                    "metavar": "SENZING_BENCHMARK_TIMEOUT_IN_SECONDS"
+                },
+            },
         },
         'docker-host': {
             "help": 'Show information on docker host.',
@@ -123,6 +410,53 @@ def get_parser():
                 },
             },
         },
+        'generate-records': {
+            "help": 'Generate synthetic Senzing records, to a JSON lines file or into the project\'s RabbitMQ queue.',
+            "argument_aspects": ["project"],
+            "arguments": {
+                "--generate-records-count": {
+                    "dest": "generate_records_count",
+                    "help": "Number of records generated. Default: 100000",
+                    "metavar": "SENZING_GENERATE_RECORDS_COUNT"
+                },
+                "--generate-records-data-sources": {
+                    "dest": "generate_records_data_sources",
+                    "help": "Data sources records are spread over. Default: TEST",
+                    "metavar": "SENZING_GENERATE_RECORDS_DATA_SOURCES",
+                    "nargs": "+",
+                },
+                "--generate-records-duplicate-rate": {
+                    "dest": "generate_records_duplicate_rate",
+                    "help": "Fraction of records that are variants of an earlier record's entity, in the same data source. Default: 0.1",
+                    "metavar": "SENZING_GENERATE_RECORDS_DUPLICATE_RATE"
+                },
+                "--generate-records-output": {
+                    "dest": "generate_records_output",
+                    "help": "JSON lines file records are written to. \"-\" writes stdout. Default: -",
+                    "metavar": "SENZING_GENERATE_RECORDS_OUTPUT"
+                },
+                "--generate-records-overlap-rate": {
+                    "dest": "generate_records_overlap_rate",
+                    "help": "Fraction of records that are variants of an earlier record's entity, in another data source. Default: 0.0",
+                    "metavar": "SENZING_GENERATE_RECORDS_OVERLAP_RATE"
+                },
+                "--generate-records-rabbitmq": {
+                    "dest": "generate_records_rabbitmq",
+                    "action": "store_true",
+                    "help": "Send records to the project's RabbitMQ queue through senzing-stream-producer.sh instead of --generate-records-output. (SENZING_GENERATE_RECORDS_RABBITMQ) Default: False"
+                },
+                "--generate-records-ranges": {
+                    "dest": "generate_records_ranges",
+                    "help": "Number of stream-producers records are sent through. Default: SENZING_STREAM_PRODUCER_RANGES of the project",
+                    "metavar": "SENZING_GENERATE_RECORDS_RANGES"
+                },
+                "--generate-records-seed": {
+                    "dest": "generate_records_seed",
+                    "help": "Seed. The same seed and options give the same records. Default: 0",
+                    "metavar": "SENZING_GENERATE_RECORDS_SEED"
+                },
+            },
+        },
         'sleep': {
             "help": 'Do nothing but sleep. For Docker testing.',
             "arguments": {
@@ -133,6 +467,18 @@ def get_parser():
                 },
             },
         },
+        'up': {
+            "help": 'Bring up services in docker-bin, starting independent services concurrently.',
+            "argument_aspects": ["project"],
+            "arguments": {
+                "--services": {
+                    "dest": "services",
+                    "help": "docker-bin scripts to bring up, with their dependencies. Default: senzing-api-server.sh senzing-webapp.sh senzing-stream-loader.sh",
+                    "metavar": "SENZING_SERVICES",
+                    "nargs": "+",
+                },
+            },
+        },
         'version': {
             "help": 'Print version of program.',
         },
@@ -144,6 +490,120 @@ def get_parser():
     # Define argument_aspects.
 
     argument_aspects = {
+        "batch": {
+            "--projects-file": {
+                "dest": "projects_file",
+                "help": "File listing project directories to generate in one run, one per line. \"-\" reads stdin. Overrides --project-dir. (SENZING_PROJECTS_FILE)",
+                "metavar": "SENZING_PROJECTS_FILE"
+            },
+            "--project-workers": {
+                "dest": "project_workers",
+                "help": "Number of projects from --projects-file generated concurrently. (SENZING_PROJECT_WORKERS) Default: <number of CPUs>",
+                "metavar": "SENZING_PROJECT_WORKERS"
+            },
+        },
+        "backup": {
+            "--backup-keep-count": {
+                "dest": "backup_keep_count",
+                "help": "Number of most recent backups of each file or directory to keep. (SENZING_BACKUP_KEEP_COUNT) Default: 10",
+                "metavar": "SENZING_BACKUP_KEEP_COUNT"
+            },
+            "--backup-keep-days": {
+                "dest": "backup_keep_days",
+                "help": "Also keep backups younger than this many days. 0 disables. (SENZING_BACKUP_KEEP_DAYS) Default: 0",
+                "metavar": "SENZING_BACKUP_KEEP_DAYS"
+            },
+        },
+        "project": {
+            "--debug": {
+                "dest": "debug",
+                "action": "store_true",
+                "help": "Enable debugging. (SENZING_DEBUG) Default: False"
+            },
+            "--project-dir": {
+                "dest": "project_dir",
+                "help": "Specify location of G2Project Default: ~/senzing",
+                "metavar": "SENZING_PROJECT_DIR"
+            },
+        },
+        "postgres": {
+            "--database-pooler": {
+                "action": "store_true",
+                "dest": "database_pooler",
+                "help": "Connect Senzing services to PostgreSQL through senzing-pgbouncer.sh. (SENZING_DATABASE_POOLER) Default: False"
+            },
+            "--postgres-memory-in-mb": {
+                "dest": "postgres_memory_in_mb",
+                "help": "Memory available to the PostgreSQL container, used to size its settings. Default: <host memory>",
+                "metavar": "SENZING_POSTGRES_MEMORY_IN_MB"
+            },
+        },
+        "rabbitmq": {
+            "--rabbitmq-dir": {
+                "dest": "rabbitmq_dir",
+                "help": "Directory, e.g. on a dedicated volume, for RabbitMQ data. Default: <project>/var/rabbitmq",
+                "metavar": "SENZING_RABBITMQ_DIR"
+            },
+            "--rabbitmq-memory-in-mb": {
+                "dest": "rabbitmq_memory_in_mb",
+                "help": "Memory available to the RabbitMQ container, used to size its memory and disk limits. Default: <host memory>",
+                "metavar": "SENZING_RABBITMQ_MEMORY_IN_MB"
+            },
+            "--rabbitmq-queue-type": {
+                "dest": "rabbitmq_queue_type",
+                "help": "Type of SENZING_RABBITMQ_QUEUE: classic, lazy, or quorum. Default: classic",
+                "metavar": "SENZING_RABBITMQ_QUEUE_TYPE"
+            },
+            "--rabbitmq-shards": {
+                "dest": "rabbitmq_shards",
+                "help": "Number of queues that stream-producer spreads records over and stream-loader replicas consume. (SENZING_RABBITMQ_SHARDS) Default: 1",
+                "metavar": "SENZING_RABBITMQ_SHARDS"
+            },
+        },
+        "stream_loader": {
+            "--stream-loader-delay-on-error-in-seconds": {
+                "dest": "stream_loader_delay_on_error_in_seconds",
+                "help": "Seconds stream-loader waits before reconnecting after an error. Default: 60",
+                "metavar": "SENZING_STREAM_LOADER_DELAY_ON_ERROR_IN_SECONDS"
+            },
+            "--stream-loader-monitoring-period-in-seconds": {
+                "dest": "stream_loader_monitoring_period_in_seconds",
+                "help": "Seconds between stream-loader monitoring reports. Default: 600",
+                "metavar": "SENZING_STREAM_LOADER_MONITORING_PERIOD_IN_SECONDS"
+            },
+            "--stream-loader-prefetch-count": {
+                "dest": "stream_loader_prefetch_count",
+                "help": "Number of unacknowledged RabbitMQ messages per stream-loader. Default: 50",
+                "metavar": "SENZING_STREAM_LOADER_PREFETCH_COUNT"
+            },
+            "--stream-loader-threads-per-process": {
+                "dest": "stream_loader_threads_per_process",
+                "help": "Number of threads in each stream-loader process. Default: number of CPUs",
+                "metavar": "SENZING_STREAM_LOADER_THREADS_PER_PROCESS"
+            },
+        },
+        "stream_producer": {
+            "--stream-producer-input": {
+                "dest": "stream_producer_input",
+                "help": "Local JSON lines file, or directory of *.json and *.jsonl files, to send instead of SENZING_INPUT_URL. Default: none",
+                "metavar": "SENZING_STREAM_PRODUCER_INPUT"
+            },
+            "--stream-producer-ranges": {
+                "dest": "stream_producer_ranges",
+                "help": "Number of ranges the input is split into, each sent by its own stream-producer. Default: number of RabbitMQ shards",
+                "metavar": "SENZING_STREAM_PRODUCER_RANGES"
+            },
+            "--stream-producer-record-max": {
+                "dest": "stream_producer_record_max",
+                "help": "Maximum number of records sent. 0 sends all records. Default: 5000",
+                "metavar": "SENZING_STREAM_PRODUCER_RECORD_MAX"
+            },
+            "--stream-producer-record-monitor": {
+                "dest": "stream_producer_record_monitor",
+                "help": "Number of records between stream-producer progress messages. Default: 1000",
+                "metavar": "SENZING_STREAM_PRODUCER_RECORD_MONITOR"
+            },
+        },
         "support": {
             "--debug": {
                 "dest": "debug",
@@ -152,9 +612,19 @@ def get_parser():
             },
             "--docker-host-ip-addr": {
                 "dest": "docker_host_ip_addr",
-                "help": "IP address of machine hosting docker containers. Default: <auto-generated>",
+                "help": "IP address of machine hosting docker containers. Default: <address of default route or docker bridge interface>",
                 "metavar": "SENZING_DOCKER_HOST_IP_ADDR"
             },
+            "--docker-registry-mirror": {
+                "dest": "docker_registry_mirror",
+                "action": "store_true",
+                "help": "Pull images through senzing-registry-mirror.sh, a local pull-through cache. (SENZING_DOCKER_REGISTRY_MIRROR) Default: False"
+            },
+            "--overwrite-edited": {
+                "dest": "overwrite_edited",
+                "action": "store_true",
+                "help": "Replace docker-bin files that were edited by hand. A backup is kept. (SENZING_OVERWRITE_EDITED) Default: False"
+            },
             "--project-name": {
                 "dest": "project_name",
                 "help": "A name for the project used as a prefix for artifacts. Default: senzing",
@@ -216,6 +686,21 @@ message_dictionary = {
     "105": "   {0}.{1} doesn't exist",
     "106": "   Removed  {0}.{1}",
     "119": "{0} - Modified. {1}",
+    "130": "{0} - Starting.",
+    "131": "{0} - Up in {1:.1f} seconds.",
+    "132": "Up: {0} service(s) in {1:.1f} seconds.",
+    "133": "{0} - Generated in {1:.2f} seconds",
+    "135": "Generated {0} of {1} projects in {2:.2f} seconds using {3} workers.",
+    "136": "Docker host IP address: {0} from {1}",
+    "140": "PostgreSQL tuned for {0} MB memory, {1} CPU(s), {2} storage: {3}",
+    "141": "SENZING_DATABASE_URL connects through senzing-pgbouncer.sh: {0}",
+    "142": "   Adding   {0}.{1} = {2}",
+    "143": "RabbitMQ tuned for {0} memory, {1} CPU(s), {2} queue: {3}",
+    "144": "Benchmark dataset: {0} records in {1}",
+    "145": "Benchmark at {0:.0f} seconds: {1} published, {2} loaded, {3} in queue.",
+    "146": "Benchmark: {0} records at {1:.1f} records/second. Latency p50: {2:.2f} seconds, p99: {3:.2f} seconds. Time to drain: {4:.1f} seconds.",
+    "147": "Benchmark report: {0}",
+    "148": "Generated {0} records in {1:.1f} seconds ({2:.0f} records/second) to {3}",
     "151": "{0} - Changing permissions from {1:o} to {2:o}",
     "152": "{0} - Changing owner from {1} to {2}",
     "153": "{0} - Changing group from {1} to {2}",
@@ -230,10 +715,21 @@ message_dictionary = {
     "163": "{0} - Already exists.  Left unmodified.",
     "164": "{0} - Copying {1}",
     "165": "{0} - Creating file",
+    "166": "{0} - Unchanged",
+    "167": "{0} - Updating file",
+    "168": "{0} - Removing file no longer generated",
+    "169": "{0} - Synchronized with {1}.  Cloned: {2}  Copied: {3}  Unchanged: {4}  Removed: {5}",
     "170": "---- Environment variables ---------------------------------------------------",
     "171": "  {0} = {1}",
     "172": "  {0} defaults to {1}",
     "173": "  {0} is not set",
+    "180": "{0} - Backup of {1}.  Files: {2}  New objects: {3}",
+    "181": "{0} - Unchanged since backup {1}.  No new backup recorded.",
+    "182": "{0}  {1}  {2}  Files: {3}  Bytes: {4}",
+    "183": "Pruned {0} backups.  Kept {1}.  Removed {2} unreferenced objects, {3} bytes.",
+    "184": "{0} - Restored from backup {1}",
+    "185": "{0} - Imported as backup {1}",
+    "186": "No backups in {0}",
     "190": "---- File --------------------------------------------------------------------",
     "191": "---- Path on workstation: {0}",
     "192": "---- Path inside  docker: {0}",
@@ -255,6 +751,12 @@ message_dictionary = {
     "300": "senzing-" + SENZING_PRODUCT_ID + "{0:04d}W",
     "350": "---- Warnings ----------------------------------------------------------------",
     "352": "Environment variable not set: {0}",
+    "353": "{0} - Skipped. Failed dependencies: {1}",
+    "354": "Connection pooler only supports PostgreSQL. Database scheme: {0}. SENZING_DATABASE_URL connects directly.",
+    "355": "Database cluster only supports PostgreSQL. Database scheme: {0}. G2Module.ini is not clustered.",
+    "356": "{0} - Edited by hand.  Left unmodified.  Use --overwrite-edited to replace it.",
+    "357": "RabbitMQ queue was not empty when the benchmark started. Messages: {0}. They are counted as loaded records.",
+    "358": "RabbitMQ management API not reachable: {0}",
     "499": "{0}",
     "500": "senzing-" + SENZING_PRODUCT_ID + "{0:04d}E",
     "695": "Unknown database scheme '{0}' in database url '{1}'",
@@ -264,6 +766,29 @@ message_dictionary = {
     "699": "{0}",
     "700": "senzing-" + SENZING_PRODUCT_ID + "{0:04d}E",
     "702": "Could not create '{0}' directory. Error: {1}",
+    "703": "{0} - Failed. Return code: {1} Output: {2}",
+    "704": "Unknown service: {0}. Known services: {1}",
+    "705": "Services not brought up: {0}",
+    "706": "Backup not found: {0}.  See backups-list.",
+    "707": "Template {0} for {1} needs variables that were not provided: {2}",
+    "708": "Projects not generated: {0}",
+    "709": "{0} line {1}: {2}",
+    "710": "Cannot determine the IP address of the docker host. Set --docker-host-ip-addr or SENZING_DOCKER_HOST_IP_ADDR.",
+    "711": "Unknown RabbitMQ queue type: {0}. Known queue types: {1}",
+    "712": "Number of RabbitMQ shards must be a positive integer. Shards: {0}",
+    "713": "Number of stream-producer ranges must be a positive integer. Ranges: {0}",
+    "714": "stream-producer input not found: {0}",
+    "715": "Number of benchmark records must be a positive integer. Records: {0}",
+    "716": "Number of benchmark loaders must be a positive integer. Loaders: {0}",
+    "717": "Benchmark sample period must be a positive integer. Seconds: {0}",
+    "718": "Benchmark did not finish in {0} seconds. Loaded {1} of {2} records. Report: {3}",
+    "719": "Number of records generated must be a positive integer. Records: {0}",
+    "720": "Duplicate and overlap rates must be between 0 and 1, and at most 1 together. Duplicate: {0} Overlap: {1}",
+    "721": "An overlap rate needs at least two data sources. Data sources: {0}",
+    "722": "senzing-stream-producer.sh stopped reading before all {0} records were sent. See its logs.",
+    "723": "{0} - Failed after {1:.2f} seconds. {2}",
+    "724": "{0} is interactive and is not started by 'up'. Run it directly: {1}",
+    "725": "--generate-records-rabbitmq sends records through named pipes, which can only be shared with containers on Linux. Platform: {0}",
     "750": "---- Errors ------------------------------------------------------------------",
     "760": "shutil.Error Cannot copy {0} to {1} Error: {2}",
     "761": "OSError: Cannot copy {0} to {1} Error: {2}",
@@ -378,9 +903,24 @@ def get_configuration(args):
     if args.subcommand:
         result['subcommand'] = args.subcommand
 
+    return normalize_configuration(result)
+
+
+def normalize_configuration(result):
+    ''' Convert configuration values given as strings to their types and fill in computed defaults.
+        Used by get_configuration() and for each project in --projects-file.
+    '''
+
     # Special case: Change boolean strings to booleans.
 
-    booleans = ['debug']
+    booleans = [
+        'database_cluster',
+        'database_pooler',
+        'debug',
+        'docker_registry_mirror',
+        'generate_records_rabbitmq',
+        'overwrite_edited',
+    ]
     for boolean in booleans:
         boolean_value = result.get(boolean)
         if isinstance(boolean_value, str):
@@ -390,27 +930,96 @@ def get_configuration(args):
             else:
                 result[boolean] = False
 
+    # Special case: Change space or comma separated strings to lists.
+
+    lists = [
+        'generate_records_data_sources',
+        'services',
+    ]
+    for a_list in lists:
+        list_value = result.get(a_list)
+        if isinstance(list_value, str):
+            result[a_list] = [x for x in re.split(r'[\s,]+', list_value) if x]
+
     # Special case: Remove trailing /
 
     key = "project_dir"
     result[key] = os.path.abspath(result[key])
 
-    # Special case: Host IP address
+    # Special case: Host IP address is discovered later, only by subcommands that need it.
+    # See get_docker_host_ip_addr().
 
-    if not result['docker_host_ip_addr']:
-        my_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        my_socket.connect(("8.8.8.8", 80))
-        result['docker_host_ip_addr'] = my_socket.getsockname()[0]
-        my_socket.close()
+    # Special case: RabbitMQ directory is absolute, if given.
+
+    if result.get('rabbitmq_dir'):
+        result['rabbitmq_dir'] = os.path.abspath(os.path.expanduser(result['rabbitmq_dir']))
+
+    # Special case: Benchmark report is absolute, if given.
+
+    if result.get('benchmark_report'):
+        result['benchmark_report'] = os.path.abspath(os.path.expanduser(result['benchmark_report']))
+
+    # Special case: stream-producer input is absolute, if given.
+
+    if result.get('stream_producer_input'):
+        result['stream_producer_input'] = os.path.abspath(os.path.expanduser(result['stream_producer_input']))
+
+    # Special case: Default stream-loader threads to the number of CPUs.
+
+    if not result.get('stream_loader_threads_per_process'):
+        result['stream_loader_threads_per_process'] = os.cpu_count() or 1
+
+    # Special case: Default project workers to the number of CPUs.
+
+    if not result.get('project_workers'):
+        result['project_workers'] = os.cpu_count() or 1
 
     # Special case: Change integer strings to integers.
 
     integers = [
-        'sleep_time_in_seconds'
+        'backup_keep_count',
+        'benchmark_loaders',
+        'benchmark_records',
+        'benchmark_sample_period_in_seconds',
+        'benchmark_seed',
+        'benchmark_timeout_in_seconds',
+        'generate_records_count',
+        'generate_records_ranges',
+        'generate_records_seed',
+        'backup_keep_days',
+        'postgres_memory_in_mb',
+        'project_workers',
+        'rabbitmq_memory_in_mb',
+        'rabbitmq_shards',
+        'sleep_time_in_seconds',
+        'stream_loader_delay_on_error_in_seconds',
+        'stream_loader_monitoring_period_in_seconds',
+        'stream_loader_prefetch_count',
+        'stream_loader_threads_per_process',
+        'stream_producer_ranges',
+        'stream_producer_record_max',
+        'stream_producer_record_monitor',
     ]
     for integer in integers:
         integer_string = result.get(integer)
-        result[integer] = int(integer_string)
+        if integer_string is not None:
+            result[integer] = int(integer_string)
+
+    # Special case: Change float strings to floats.
+
+    floats = [
+        'generate_records_duplicate_rate',
+        'generate_records_overlap_rate',
+    ]
+    for a_float in floats:
+        float_string = result.get(a_float)
+        if float_string is not None:
+            result[a_float] = float(float_string)
+
+    # Special case: Default stream-producer ranges to one per RabbitMQ shard.
+
+    if not result.get('stream_producer_ranges'):
+        result['stream_producer_ranges'] = result.get('rabbitmq_shards') or 1
 
     return result
 
@@ -425,6 +1034,55 @@ def validate_configuration(config):
 
     subcommand = config.get('subcommand')
 
+    if subcommand in ['add-docker-support-linux', 'add-docker-support-macos']:
+
+        rabbitmq_queue_type = config.get('rabbitmq_queue_type')
+        if rabbitmq_queue_type not in rabbitmq_queue_types:
+            user_error_messages.append(message_error(711, rabbitmq_queue_type, ", ".join(rabbitmq_queue_types)))
+
+        if config.get('rabbitmq_shards') < 1:
+            user_error_messages.append(message_error(712, config.get('rabbitmq_shards')))
+
+        if config.get('stream_producer_ranges') < 1:
+            user_error_messages.append(message_error(713, config.get('stream_producer_ranges')))
+
+        stream_producer_input = config.get('stream_producer_input')
+        if stream_producer_input and not os.path.exists(stream_producer_input):
+            user_error_messages.append(message_error(714, stream_producer_input))
+
+    if subcommand == 'benchmark-load':
+
+        if config.get('benchmark_records') < 1:
+            user_error_messages.append(message_error(715, config.get('benchmark_records')))
+
+        benchmark_loaders = config.get('benchmark_loaders')
+        if benchmark_loaders is not None and benchmark_loaders < 1:
+            user_error_messages.append(message_error(716, benchmark_loaders))
+
+        if config.get('benchmark_sample_period_in_seconds') < 1:
+            user_error_messages.append(message_error(717, config.get('benchmark_sample_period_in_seconds')))
+
+    if subcommand == 'generate-records':
+
+        if config.get('generate_records_count') < 1:
+            user_error_messages.append(message_error(719, config.get('generate_records_count')))
+
+        duplicate_rate = config.get('generate_records_duplicate_rate')
+        overlap_rate = config.get('generate_records_overlap_rate')
+        if min(duplicate_rate, overlap_rate) < 0 or duplicate_rate + overlap_rate > 1:
+            user_error_messages.append(message_error(720, duplicate_rate, overlap_rate))
+
+        data_sources = config.get('generate_records_data_sources')
+        if overlap_rate > 0 and len(set(data_sources)) < 2:
+            user_error_messages.append(message_error(721, " ".join(data_sources)))
+
+        generate_records_ranges = config.get('generate_records_ranges')
+        if generate_records_ranges is not None and generate_records_ranges < 1:
+            user_error_messages.append(message_error(713, generate_records_ranges))
+
+        if config.get('generate_records_rabbitmq') and not sys.platform.startswith("linux"):
+            user_error_messages.append(message_error(725, sys.platform))
+
     if subcommand in ['task1', 'task2']:
 
         if not config.get('senzing_dir'):
@@ -621,6 +1279,30 @@ def get_sql_connection(parsed_database_url):
     return result
 
 
+def get_pgbouncer_database_url(parsed_database_connection, docker_host_ip_addr):
+    ''' Given a parsed database URL, return the normalized URL that connects through senzing-pgbouncer.sh. '''
+
+    scheme = parsed_database_connection.get('scheme')
+    if scheme != 'postgresql':
+        logging.warning(message_warning(354, scheme))
+        return get_g2_database_url(parsed_database_connection)
+
+    pooled_database_connection = dict(parsed_database_connection)
+    pooled_database_connection['hostname'] = docker_host_ip_addr
+    pooled_database_connection['port'] = SENZING_DOCKER_PORT_PGBOUNCER
+    result = get_g2_database_url(pooled_database_connection)
+    logging.info(message_info(141, result))
+    return result
+
+
+def get_cluster_database_connection(parsed_database_connection, instance):
+    ''' Given a parsed "core" database URL, return the parsed URL of a --database-cluster instance. '''
+
+    result = dict(parsed_database_connection)
+    result['port'] = postgres_cluster_instances.get(instance, {}).get("port")
+    return result
+
+
 def get_g2_database_url(parsed_database_connection):
     ''' Given a parsed database URL, transform to the normalized URL. '''
 
@@ -694,6 +1376,54 @@ def exit_silently():
     ''' Exit program. '''
     sys.exit(0)
 
+
+def fsync_directory(directory):
+    ''' Make renames and removals in directory durable. '''
+    file_descriptor = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(file_descriptor)
+    finally:
+        os.close(file_descriptor)
+
+
+def write_file_atomically(filename, content, mode=None, directories=None):
+    ''' Write content, str or bytes, to a temporary file, fsync it, and rename it over filename.
+        A reader sees the old file or the new file, never a partial one.
+        If "directories" is a set, the directory is added to it to be synced later by the caller.
+        Otherwise the directory is synced now.
+    '''
+
+    directory = os.path.dirname(os.path.abspath(filename))
+
+    # Keep the mode of the file being replaced.
+
+    if mode is None:
+        try:
+            mode = stat.S_IMODE(os.stat(filename).st_mode)
+        except FileNotFoundError:
+            mode = 0o644
+
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+
+    file_descriptor, temporary_filename = tempfile.mkstemp(dir=directory, prefix=".{0}.".format(os.path.basename(filename)), suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, 'wb') as file:
+            file.write(content)
+            file.flush()
+            os.fsync(file.fileno())
+        os.chmod(temporary_filename, mode)
+        os.replace(temporary_filename, filename)
+    except BaseException:
+        if os.path.exists(temporary_filename):
+            os.remove(temporary_filename)
+        raise
+
+    if directories is None:
+        fsync_directory(directory)
+    else:
+        directories.add(directory)
+
 # -----------------------------------------------------------------------------
 # Files
 # -----------------------------------------------------------------------------
@@ -719,8 +1449,13 @@ export DATABASE_PORT={database_port}
 export DATABASE_PROTOCOL={database_protocol}
 export DATABASE_USERNAME={database_username}
 export POSTGRES_DIR=${{SENZING_PROJECT_DIR}}/var/postgres
-export RABBITMQ_DIR=${{SENZING_PROJECT_DIR}}/var/rabbitmq
+export POSTGRES_LIBFEAT_DIR=${{SENZING_PROJECT_DIR}}/var/postgres-libfeat
+export POSTGRES_RES_DIR=${{SENZING_PROJECT_DIR}}/var/postgres-res
+export RABBITMQ_DIR={rabbitmq_dir}
 export SENZING_DATABASE_URL={senzing_database_url}
+export SENZING_DATABASE_URL_DIRECT={senzing_database_url_direct}
+export SENZING_DATABASE_URL_LIBFEAT={senzing_database_url_libfeat}
+export SENZING_DATABASE_URL_RES={senzing_database_url_res}
 export SENZING_DATA_DIR=${{SENZING_PROJECT_DIR}}/data
 export SENZING_DATA_VERSION_DIR=${{SENZING_PROJECT_DIR}}/data
 export SENZING_DOCKER_CONTAINER_NAME_DB2_DRIVER_INSTALLER="${{SENZING_PROJECT_NAME}}-db2-driver-installer"
@@ -728,12 +1463,16 @@ export SENZING_DOCKER_CONTAINER_NAME_ENTITY_SEARCH_WEB_APP="${{SENZING_PROJECT_N
 export SENZING_DOCKER_CONTAINER_NAME_INIT_CONTAINER="${{SENZING_PROJECT_NAME}}-init-container"
 export SENZING_DOCKER_CONTAINER_NAME_JUPYTER="${{SENZING_PROJECT_NAME}}-jupyter"
 export SENZING_DOCKER_CONTAINER_NAME_MSSQL_DRIVER_INSTALLER="${{SENZING_PROJECT_NAME}}-mssql-driver-installer"
+export SENZING_DOCKER_CONTAINER_NAME_PGBOUNCER="${{SENZING_PROJECT_NAME}}-pgbouncer"
 export SENZING_DOCKER_CONTAINER_NAME_PHPPGADMIN="${{SENZING_PROJECT_NAME}}-phppgadmin"
 export SENZING_DOCKER_CONTAINER_NAME_PORTAINER="${{SENZING_PROJECT_NAME}}-portainer"
 export SENZING_DOCKER_CONTAINER_NAME_POSTGRES="${{SENZING_PROJECT_NAME}}-postgres"
+export SENZING_DOCKER_CONTAINER_NAME_POSTGRES_LIBFEAT="${{SENZING_PROJECT_NAME}}-postgres-libfeat"
+export SENZING_DOCKER_CONTAINER_NAME_POSTGRES_RES="${{SENZING_PROJECT_NAME}}-postgres-res"
 export SENZING_DOCKER_CONTAINER_NAME_POSTGRESQL_INIT="${{SENZING_PROJECT_NAME}}-postgresql-init"
 export SENZING_DOCKER_CONTAINER_NAME_QUICKSTART="${{SENZING_PROJECT_NAME}}-quickstart"
 export SENZING_DOCKER_CONTAINER_NAME_RABBITMQ="${{SENZING_PROJECT_NAME}}-rabbitmq"
+export SENZING_DOCKER_CONTAINER_NAME_REGISTRY_MIRROR="${{SENZING_PROJECT_NAME}}-registry-mirror"
 export SENZING_DOCKER_CONTAINER_NAME_SENZING_API_SERVER="${{SENZING_PROJECT_NAME}}-api-server"
 export SENZING_DOCKER_CONTAINER_NAME_SENZING_CONSOLE="${{SENZING_PROJECT_NAME}}-console"
 export SENZING_DOCKER_CONTAINER_NAME_SENZING_DEBUG="${{SENZING_PROJECT_NAME}}-debug"
@@ -745,16 +1484,20 @@ export SENZING_DOCKER_CONTAINER_NAME_SWAGGERAPI_SWAGGER_UI="${{SENZING_PROJECT_N
 export SENZING_DOCKER_CONTAINER_NAME_WEB_APP_DEMO="${{SENZING_PROJECT_NAME}}-web-app-demo"
 export SENZING_DOCKER_CONTAINER_NAME_XTERM="${{SENZING_PROJECT_NAME}}-xterm"
 export SENZING_DOCKER_CONTAINER_NAME_YUM="${{SENZING_PROJECT_NAME}}-yum"
+export SENZING_DOCKER_IMAGES_DIR=${{SENZING_PROJECT_DIR}}/var/docker/images
+export SENZING_DOCKER_IMAGES_PARALLELISM=4
 export SENZING_DOCKER_IMAGE_VERSION_APT=latest
 export SENZING_DOCKER_IMAGE_VERSION_DB2_DRIVER_INSTALLER=latest
 export SENZING_DOCKER_IMAGE_VERSION_ENTITY_SEARCH_WEB_APP=latest
 export SENZING_DOCKER_IMAGE_VERSION_INIT_CONTAINER=latest
 export SENZING_DOCKER_IMAGE_VERSION_JUPYTER=latest
+export SENZING_DOCKER_IMAGE_VERSION_PGBOUNCER=1.15.0
 export SENZING_DOCKER_IMAGE_VERSION_PHPPGADMIN=1.0.0
 export SENZING_DOCKER_IMAGE_VERSION_PORTAINER=latest
 export SENZING_DOCKER_IMAGE_VERSION_POSTGRES=11.6
 export SENZING_DOCKER_IMAGE_VERSION_POSTGRESQL_CLIENT=1.0.0
 export SENZING_DOCKER_IMAGE_VERSION_RABBITMQ=3.8.2
+export SENZING_DOCKER_IMAGE_VERSION_REGISTRY=2
 export SENZING_DOCKER_IMAGE_VERSION_SENZING_API_SERVER=latest
 export SENZING_DOCKER_IMAGE_VERSION_SENZING_CONSOLE=latest
 export SENZING_DOCKER_IMAGE_VERSION_SENZING_DEBUG=latest
@@ -768,33 +1511,50 @@ export SENZING_DOCKER_IMAGE_VERSION_XTERM=latest
 export SENZING_DOCKER_IMAGE_VERSION_YUM=latest
 export SENZING_DOCKER_PORT_ENTITY_SEARCH_WEB_APP=8251
 export SENZING_DOCKER_PORT_JUPYTER=9178
+export SENZING_DOCKER_PORT_PGBOUNCER=6432
 export SENZING_DOCKER_PORT_PHPPGADMIN_HTTP=9171
 export SENZING_DOCKER_PORT_PHPPGADMIN_HTTPS=9172
 export SENZING_DOCKER_PORT_PORTAINER=9170
 export SENZING_DOCKER_PORT_POSTGRES=5432
+export SENZING_DOCKER_PORT_POSTGRES_LIBFEAT=5434
+export SENZING_DOCKER_PORT_POSTGRES_RES=5433
 export SENZING_DOCKER_PORT_RABBITMQ=5672
 export SENZING_DOCKER_PORT_RABBITMQ_UI=15672
+export SENZING_DOCKER_PORT_REGISTRY_MIRROR=5000
 export SENZING_DOCKER_PORT_SENZING_API_SERVER=8250
 export SENZING_DOCKER_PORT_SENZING_SQLITE_WEB=9174
 export SENZING_DOCKER_PORT_SENZING_SWAGGERAPI_SWAGGER_UI=9180
 export SENZING_DOCKER_PORT_SSHD=9181
 export SENZING_DOCKER_PORT_XTERM=8254
-export SENZING_DOCKER_REGISTRY_URL=docker.io
+export SENZING_DOCKER_PULL_CACHE_DIR=${{SENZING_PROJECT_DIR}}/var/docker/pulls
+export SENZING_DOCKER_PULL_OFFLINE=false
+export SENZING_DOCKER_PULL_PARALLELISM=4
+export SENZING_DOCKER_PULL_TTL=3600
+export SENZING_DOCKER_REGISTRY_MIRROR={docker_registry_mirror}
+export SENZING_DOCKER_REGISTRY_MIRROR_REMOTE_URL=https://registry-1.docker.io
+export SENZING_DOCKER_REGISTRY_URL={docker_registry_url}
 export SENZING_DOCKER_SOCKET=/var/run/docker.sock
+export SENZING_DOWN_TIMEOUT=10
 export SENZING_ETC_DIR=${{SENZING_PROJECT_DIR}}/docker-etc
 export SENZING_G2_DIR=${{SENZING_PROJECT_DIR}}{senzing_project_dir_suffix}
 export SENZING_HORIZONTAL_RULE="=============================================================================="
 export SENZING_INPUT_URL="https://s3.amazonaws.com/public-read-access/TestDataSets/loadtest-dataset-1M.json"
 export SENZING_LOG_DB2_DRIVER_INSTALLER="${{SENZING_PROJECT_DIR}}/var/log/senzing-db2-driver-installer.log"
+export SENZING_LOG_DOCKER_IMAGES="${{SENZING_PROJECT_DIR}}/var/log/docker-images.log"
+export SENZING_LOG_DOCKER_PULL_LATEST="${{SENZING_PROJECT_DIR}}/var/log/docker-pull-latest.log"
 export SENZING_LOG_INIT_CONTAINER="${{SENZING_PROJECT_DIR}}/var/log/senzing-init-container.log"
 export SENZING_LOG_JUPYTER="${{SENZING_PROJECT_DIR}}/var/log/senzing-jupyter.log"
 export SENZING_LOG_MSSQL_DRIVER_INSTALLER="${{SENZING_PROJECT_DIR}}/var/log/senzing-mssql-driver-installer.log"
+export SENZING_LOG_PGBOUNCER="${{SENZING_PROJECT_DIR}}/var/log/senzing-pgbouncer.log"
 export SENZING_LOG_PHPPGADMIN="${{SENZING_PROJECT_DIR}}/var/log/senzing-phppgadmin.log"
 export SENZING_LOG_PORTAINER="${{SENZING_PROJECT_DIR}}/var/log/portainer.log"
 export SENZING_LOG_POSTGRES="${{SENZING_PROJECT_DIR}}/var/log/postgres.log"
+export SENZING_LOG_POSTGRES_LIBFEAT="${{SENZING_PROJECT_DIR}}/var/log/postgres-libfeat.log"
+export SENZING_LOG_POSTGRES_RES="${{SENZING_PROJECT_DIR}}/var/log/postgres-res.log"
 export SENZING_LOG_POSTGRESQL_INIT="${{SENZING_PROJECT_DIR}}/var/log/senzing-postgresql-init.log"
 export SENZING_LOG_QUICKSTART="${{SENZING_PROJECT_DIR}}/var/log/senzing-quickstart-demo.log"
 export SENZING_LOG_RABBITMQ="${{SENZING_PROJECT_DIR}}/var/log/senzing-rabbitmq.log"
+export SENZING_LOG_REGISTRY_MIRROR="${{SENZING_PROJECT_DIR}}/var/log/senzing-registry-mirror.log"
 export SENZING_LOG_SENZING_API_SERVER="${{SENZING_PROJECT_DIR}}/var/log/senzing-api-server.log"
 export SENZING_LOG_SENZING_CONSOLE="${{SENZING_PROJECT_DIR}}/var/log/senzing-console.log"
 export SENZING_LOG_SENZING_DEBUG="${{SENZING_PROJECT_DIR}}/var/log/senzing-debug.log"
@@ -811,15 +1571,38 @@ export SENZING_MSSQL_PARAMETERS=""
 # export SENZING_NETWORK_PARAMETER="--net senzing-up"
 export SENZING_OPT_IBM_DIR=${{SENZING_PROJECT_DIR}}/docker-db2
 export SENZING_OPT_MICROSOFT_DIR=${{SENZING_PROJECT_DIR}}/opt-microsoft
+export SENZING_PGBOUNCER_DEFAULT_POOL_SIZE=50
+export SENZING_PGBOUNCER_MAX_CLIENT_CONN=1000
+export SENZING_PGBOUNCER_POOL_MODE=transaction
 export SENZING_PORTAINER_DIR=${{SENZING_PROJECT_DIR}}/var/portainer
+export SENZING_POSTGRES_INSTANCES="{postgres_instances}"
+export SENZING_POSTGRES_PARAMETERS="{postgres_parameters}"
 export SENZING_PRIVILEGED_PARAMETER="--privileged"
+export SENZING_RABBITMQ_ERL_ARGS="{rabbitmq_erl_args}"
 export SENZING_RABBITMQ_PASSWORD=bitnami
 export SENZING_RABBITMQ_QUEUE=senzing-rabbitmq-queue
+export SENZING_RABBITMQ_QUEUE_TYPE={rabbitmq_queue_type}
+export SENZING_RABBITMQ_SHARDS={rabbitmq_shards}
 export SENZING_RABBITMQ_USERNAME=user
-export SENZING_RECORD_MAX=5000
+export SENZING_RABBITMQ_USE_EXISTING_ENTITIES={rabbitmq_use_existing_entities}
+export SENZING_READY_PROBE_INTERVAL=0.5
+export SENZING_READY_TIMEOUT=300
+export SENZING_RECORD_MAX={stream_producer_record_max}
+export SENZING_RECORD_MONITOR={stream_producer_record_monitor}
 export SENZING_REFERENCE_URL="http://hub.senzing.com/senzing-environment/reference"
+export SENZING_REGISTRY_MIRROR_DIR=${{SENZING_PROJECT_DIR}}/var/registry-mirror
 export SENZING_SQL_CONNECTION="{sql_connection}"
 export SENZING_SSHD_PASSWORD=passw0rd
+export SENZING_STREAM_LOADER_DATA_SOURCE=TEST
+export SENZING_STREAM_LOADER_DELAY_ON_ERROR_IN_SECONDS={stream_loader_delay_on_error_in_seconds}
+export SENZING_STREAM_LOADER_ENTITY_TYPE=GENERIC
+export SENZING_STREAM_LOADER_MONITORING_PERIOD_IN_SECONDS={stream_loader_monitoring_period_in_seconds}
+export SENZING_STREAM_LOADER_PREFETCH_COUNT={stream_loader_prefetch_count}
+export SENZING_STREAM_LOADER_REPLICAS=1
+export SENZING_STREAM_LOADER_THREADS_PER_PROCESS={stream_loader_threads_per_process}
+export SENZING_STREAM_PRODUCER_INPUT="{stream_producer_input}"
+export SENZING_STREAM_PRODUCER_RANGES={stream_producer_ranges}
+export SENZING_STREAM_PRODUCER_RANGES_DIR=${{SENZING_PROJECT_DIR}}/var/stream-producer/ranges
 export SENZING_SUDO=""
 export SENZING_VAR_DIR=${{SENZING_PROJECT_DIR}}/var
 
@@ -828,6 +1611,7 @@ export POSTGRES_DATABASE=G2
 export SENZING_API_SERVER_URL="http://${{SENZING_DOCKER_HOST_IP_ADDR}}:${{SENZING_DOCKER_PORT_SENZING_API_SERVER}}"
 
 export DOCKER_IMAGE_NAMES_ALL=(
+  "bitnami/pgbouncer:${{SENZING_DOCKER_IMAGE_VERSION_PGBOUNCER}}"
   "bitnami/rabbitmq:${{SENZING_DOCKER_IMAGE_VERSION_RABBITMQ}}"
   "coleifer/sqlite-web:${{SENZING_DOCKER_IMAGE_VERSION_SQLITE_WEB}}"
   "portainer/portainer:${{SENZING_DOCKER_IMAGE_VERSION_PORTAINER}}"
@@ -874,6 +1658,7 @@ export DOCKER_IMAGE_NAMES_DB2=(
 )
 
 export DOCKER_IMAGE_NAMES_POSTGRESQL=(
+  "bitnami/pgbouncer:${{SENZING_DOCKER_IMAGE_VERSION_PGBOUNCER}}"
   "postgres:${{SENZING_DOCKER_IMAGE_VERSION_POSTGRES}}"
   "senzing/phppgadmin:${{SENZING_DOCKER_IMAGE_VERSION_PHPPGADMIN}}"
   "senzing/postgresql-client:${{SENZING_DOCKER_IMAGE_VERSION_POSTGRESQL_CLIENT}}"
@@ -884,6 +1669,7 @@ export DOCKER_IMAGE_NAMES_DB2=(
 )
 
 export DOCKER_IMAGE_NAMES_POSTGRESQL=(
+  "bitnami/pgbouncer:${{SENZING_DOCKER_IMAGE_VERSION_PGBOUNCER}}"
   "postgres:${{SENZING_DOCKER_IMAGE_VERSION_POSTGRES}}"
   "senzing/phppgadmin:${{SENZING_DOCKER_IMAGE_VERSION_PHPPGADMIN}}"
   "senzing/postgresql-client:${{SENZING_DOCKER_IMAGE_VERSION_POSTGRESQL_CLIENT}}"
@@ -961,303 +1747,536 @@ fi
     return 0
 
 
-# def file_docker_images_load():
-#     """#! /usr/bin/env bash
-#
-# SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
-# source ${SCRIPT_DIR}/docker-environment-vars.sh
-#
-# export OUTPUT_DIR=${SENZING_VAR_DIR}/docker/images
-#
-# echo "${SENZING_HORIZONTAL_RULE}"
-# echo "${SENZING_HORIZONTAL_RULE:0:2} Load docker images from ${OUTPUT_DIR}."
-# echo "${SENZING_HORIZONTAL_RULE:0:2} For more information:"
-# echo "${SENZING_HORIZONTAL_RULE:0:2} ${SENZING_REFERENCE_URL}#docker-images-load"
-#
-# for DOCKER_IMAGE_NAME in ${OUTPUT_DIR}/*;
-# do
-#
-#   echo "Loading ${DOCKER_IMAGE_NAME}"
-#   ${SENZING_SUDO} docker load --input ${DOCKER_IMAGE_NAME}
-#
-# done
-#
-# echo "${SENZING_HORIZONTAL_RULE:0:2}"
-# echo "${SENZING_HORIZONTAL_RULE:0:2} Done."
-# echo "${SENZING_HORIZONTAL_RULE}"
-# """
-#     return 0
-
-
-# def file_docker_images_save():
-#     """#! /usr/bin/env bash
-#
-# SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
-# source ${SCRIPT_DIR}/docker-environment-vars.sh
-#
-# SUFFIX=$1
-# SUFFIX_UPPER_CASE=$(echo "${SUFFIX:-ALL}" | tr '[:lower:]' '[:upper:]' )
-# DOCKER_IMAGE_NAMES_STRING="DOCKER_IMAGE_NAMES_${SUFFIX_UPPER_CASE}"
-# eval "DOCKER_IMAGE_NAMES=(\"\${${DOCKER_IMAGE_NAMES_STRING}[@]}\")"
-#
-# echo "${SENZING_HORIZONTAL_RULE}"
-# echo "${SENZING_HORIZONTAL_RULE:0:2} Save docker images for ${SENZING_PROJECT_NAME}."
-# echo "${SENZING_HORIZONTAL_RULE:0:2} For more information:"
-# echo "${SENZING_HORIZONTAL_RULE:0:2} ${SENZING_REFERENCE_URL}#docker-images-save"
-#
-# export OUTPUT_DIR=${SENZING_VAR_DIR}/docker/images
-# mkdir -p ${OUTPUT_DIR}
-#
-# for DOCKER_IMAGE_NAME in ${DOCKER_IMAGE_NAMES[@]};
-# do
-#
-#   DOCKER_OUTPUT_FILENAME=$(echo ${DOCKER_IMAGE_NAME} | tr "/:" "--").tar
-#   DOCKER_OUTPUT_PATHNAME=${OUTPUT_DIR}/${DOCKER_OUTPUT_FILENAME}
-#
-#   echo "Pulling ${DOCKER_IMAGE_NAME} from DockerHub."
-#   ${SENZING_SUDO} docker pull ${DOCKER_IMAGE_NAME}
-#
-#   echo "Creating ${OUTPUT_DIR}/${DOCKER_OUTPUT_FILENAME}"
-#   ${SENZING_SUDO} docker save ${DOCKER_IMAGE_NAME} --output ${DOCKER_OUTPUT_PATHNAME}
-#   chmod +rx ${DOCKER_OUTPUT_PATHNAME}
-#
-# done
-#
-# echo "${SENZING_HORIZONTAL_RULE:0:2}"
-# echo "${SENZING_HORIZONTAL_RULE:0:2} Done."
-# echo "${SENZING_HORIZONTAL_RULE}"
-# """
-#     return 0
-
-
-def file_docker_pull_latest():
+def file_docker_functions():
     """#! /usr/bin/env bash
 
-SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
-source ${SCRIPT_DIR}/docker-environment-vars.sh
-
-echo "${SENZING_HORIZONTAL_RULE}"
-echo "${SENZING_HORIZONTAL_RULE:0:2} Pull ${SENZING_PROJECT_NAME} docker containers for DockerHub."
-echo "${SENZING_HORIZONTAL_RULE:0:2} For more information:"
-echo "${SENZING_HORIZONTAL_RULE:0:2} ${SENZING_REFERENCE_URL}#docker-pull-latest"
+# Functions used by the scripts in docker-bin.
+# Usage: source ${SCRIPT_DIR}/docker-functions.sh
 
-${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/bitnami/rabbitmq:${SENZING_DOCKER_IMAGE_VERSION_RABBITMQ}
-${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/coleifer/sqlite-web:${SENZING_DOCKER_IMAGE_VERSION_SQLITE_WEB}
-${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/portainer/portainer:${SENZING_DOCKER_IMAGE_VERSION_PORTAINER}
-${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/postgres:${SENZING_DOCKER_IMAGE_VERSION_POSTGRES}
-${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/apt:${SENZING_DOCKER_IMAGE_VERSION_APT}
-${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/db2-driver-installer:${SENZING_DOCKER_IMAGE_VERSION_DB2_DRIVER_INSTALLER}
-${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/entity-search-web-app:${SENZING_DOCKER_IMAGE_VERSION_ENTITY_SEARCH_WEB_APP}
-${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/init-container:${SENZING_DOCKER_IMAGE_VERSION_INIT_CONTAINER}
-${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/jupyter:${SENZING_DOCKER_IMAGE_VERSION_JUPYTER}
-${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/phppgadmin:${SENZING_DOCKER_IMAGE_VERSION_PHPPGADMIN}
-${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/postgresql-client:${SENZING_DOCKER_IMAGE_VERSION_POSTGRESQL_CLIENT}
-${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/senzing-api-server:${SENZING_DOCKER_IMAGE_VERSION_SENZING_API_SERVER}
-${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/senzing-console:${SENZING_DOCKER_IMAGE_VERSION_SENZING_CONSOLE}
-${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/senzing-debug:${SENZING_DOCKER_IMAGE_VERSION_SENZING_DEBUG}
-${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/sshd:${SENZING_DOCKER_IMAGE_VERSION_SSHD}
-${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/stream-loader:${SENZING_DOCKER_IMAGE_VERSION_STREAM_LOADER}
-${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/stream-producer:${SENZING_DOCKER_IMAGE_VERSION_STREAM_PRODUCER}
-${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/web-app-demo:${SENZING_DOCKER_IMAGE_VERSION_WEB_APP_DEMO}
-${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/xterm:${SENZING_DOCKER_IMAGE_VERSION_XTERM}
-${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/yum:${SENZING_DOCKER_IMAGE_VERSION_YUM}
-${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/swaggerapi/swagger-ui:${SENZING_DOCKER_IMAGE_VERSION_SWAGGERAPI_SWAGGER_UI}
+# --- Readiness ---------------------------------------------------------------
 
-echo "${SENZING_HORIZONTAL_RULE:0:2}"
-echo "${SENZING_HORIZONTAL_RULE:0:2} Done."
-echo "${SENZING_HORIZONTAL_RULE}"
-"""
-    return 0
+# Wait until ${CONTAINER_NAME} has started and, optionally, a probe succeeds.
+# Usage: wait_for_ready <since> [probe [arguments...]]
+#   <since> is the "date +%s" taken just before "docker run".
 
+function wait_for_ready {
+    READY_SINCE=$1
+    shift
 
-def file_portainer():
-    """#!/usr/bin/env bash
+    if ! wait_for_start ${READY_SINCE}; then
+        ready_failure
+        return 1
+    fi
 
-# --- Functions ---------------------------------------------------------------
+    if [ $# -gt 0 ]; then
+        echo -ne "\\033[2K${CONTAINER_NAME} status: waiting for $1...\\r"
+        if ! wait_for_probe "$@"; then
+            ready_failure
+            return 1
+        fi
+    fi
+    echo -ne "\\033[2K"
+}
 
-function up {
-    echo -ne "\033[2K${CONTAINER_NAME} status: starting...\r"
+# Block on "docker events" until the container reports "start" or "die".
+# Events since <since> are replayed, so a start that already happened is seen.
 
-    if [ "${CONTAINER_VERSION}" == "latest" ]
-    then
-        ${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/portainer/portainer:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
+function wait_for_start {
+    if [ "$(${SENZING_SUDO} docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME} 2>/dev/null)" == "running" ]; then
+        return 0
     fi
 
-    ${SENZING_SUDO} docker run \\
-        --detach \\
-        --name ${CONTAINER_NAME} \\
-        --publish ${CONTAINER_PORT}:9000 \\
-        --restart always \\
-        --volume ${SENZING_DOCKER_SOCKET}:/var/run/docker.sock \\
-        --volume ${SENZING_PORTAINER_DIR}:/data \\
-        ${SENZING_DOCKER_RUN_PARAMETERS_GLOBAL} \\
-        ${SENZING_DOCKER_RUN_PARAMETERS_PORTAINER} \\
-        ${SENZING_NETWORK_PARAMETER} \\
-        ${SENZING_PRIVILEGED_PARAMETER} \\
-        portainer/portainer:${CONTAINER_VERSION} \\
-        >> ${CONTAINER_LOG} 2>&1
+    # "docker events" writes to a named pipe, not a "{FD}" redirection, which needs bash 4.1.
+
+    EVENTS_FIFO=$(mktemp -u "${TMPDIR:-/tmp}/docker-events.XXXXXX")
+    mkfifo ${EVENTS_FIFO}
+    ${SENZING_SUDO} docker events \\
+        --filter container=${CONTAINER_NAME} \\
+        --filter event=die \\
+        --filter event=start \\
+        --format '{{.Action}}' \\
+        --since $1 \\
+        > ${EVENTS_FIFO} 2>/dev/null &
+    EVENTS_PID=$!
+    EVENT_ACTION=""
+    read -r -t ${SENZING_READY_TIMEOUT} EVENT_ACTION < ${EVENTS_FIFO}
+    kill ${EVENTS_PID} >/dev/null 2>&1
+    wait ${EVENTS_PID} 2>/dev/null
+    rm -f ${EVENTS_FIFO}
+
+    [ "${EVENT_ACTION}" == "start" ]
+}
 
-    COUNTER=0
-    COUNTER_NOTICE=5
-    TIME_STRING=".."
-    CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    while [ "${CONTAINER_STATUS}" != "running" ]; do
-        COUNTER=$((${COUNTER}+1))
-        if [ "${COUNTER}" -eq "${COUNTER_NOTICE}" ]; then
-            echo -ne "\033[2K"
-            echo ""
-            echo "To see what is happening behind-the-scenes, view the log at"
-            echo "${CONTAINER_LOG}"
-            echo "and/or run 'docker logs ${CONTAINER_NAME}'"
-            echo ""
+function wait_for_probe {
+    READY_DEADLINE=$((${SECONDS}+${SENZING_READY_TIMEOUT}))
+    until "$@" >/dev/null 2>&1; do
+        if [ ${SECONDS} -ge ${READY_DEADLINE} ]; then
+            return 1
         fi
-        TIME_STRING="${TIME_STRING}."
-        echo -ne "\033[2K${CONTAINER_NAME} status: ${CONTAINER_STATUS}${TIME_STRING}\r"
-        sleep 5
-        CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
+        sleep ${SENZING_READY_PROBE_INTERVAL}
     done
+}
 
-    echo "${SENZING_HORIZONTAL_RULE}"
-    echo "${SENZING_HORIZONTAL_RULE:0:2} ${CONTAINER_NAME} running on http://${SENZING_DOCKER_HOST_IP_ADDR}:${CONTAINER_PORT}"
-    echo "${SENZING_HORIZONTAL_RULE:0:2} Logs:"
-    echo "${SENZING_HORIZONTAL_RULE:0:2}   ${CONTAINER_LOG}"
-    echo "${SENZING_HORIZONTAL_RULE:0:2}   and/or run 'docker logs ${CONTAINER_NAME}'"
-    echo "${SENZING_HORIZONTAL_RULE:0:2} For more information:"
-    echo "${SENZING_HORIZONTAL_RULE:0:2} ${SENZING_REFERENCE_URL}#portainer"
-    echo "${SENZING_HORIZONTAL_RULE}"
+function ready_failure {
+    echo -ne "\\033[2K"
+    echo ""
+    echo "${CONTAINER_NAME} is not ready. (Timeout: ${SENZING_READY_TIMEOUT} seconds)"
+    echo "To see what is happening behind-the-scenes, view the log at"
+    echo "${CONTAINER_LOG}"
+    echo "and/or run 'docker logs ${CONTAINER_NAME}'"
+    echo ""
 }
 
-function down {
-    ${SENZING_SUDO} docker stop ${CONTAINER_NAME} >> ${CONTAINER_LOG} 2>&1
-    ${SENZING_SUDO} docker rm   ${CONTAINER_NAME} >> ${CONTAINER_LOG} 2>&1
+# Report a run-to-completion container that exited with an error.
+# Usage: run_failure <return code>
+
+function run_failure {
+    echo -ne "\\033[2K"
+    echo ""
+    echo "${CONTAINER_NAME} failed. (Return code: $1)"
+    echo "To see what is happening behind-the-scenes, view the log at"
+    echo "${CONTAINER_LOG}"
+    echo ""
 }
 
-function usage {
-    echo "usage: $0 [up | down | restart]"
-    echo "For more information:"
-    echo "${SENZING_REFERENCE_URL}#portainer"
+# --- Probes ------------------------------------------------------------------
+
+function probe_container_tcp {
+    ${SENZING_SUDO} docker exec ${CONTAINER_NAME} bash -c "exec 3<>/dev/tcp/127.0.0.1/$1"
+}
+
+function probe_http {
+    if [ -n "$(command -v curl)" ]; then
+        curl --fail --silent --output /dev/null $1
+    else
+        wget --quiet --output-document=/dev/null $1
+    fi
+}
+
+function probe_postgres {
+    ${SENZING_SUDO} docker exec ${CONTAINER_NAME} pg_isready --host=127.0.0.1 --port=5432 --quiet
+}
+
+# --- Images ------------------------------------------------------------------
+
+# Name of an image in ${SENZING_DOCKER_REGISTRY_URL}.
+# Through the pull-through cache, official images such as "postgres" are "library/postgres".
+# Usage: docker_registry_image <image>:<version>
+
+function docker_registry_image {
+    if [ "${SENZING_DOCKER_REGISTRY_MIRROR}" == "true" ] && [[ "$1" != */* ]]; then
+        echo "${SENZING_DOCKER_REGISTRY_URL}/library/$1"
+    else
+        echo "${SENZING_DOCKER_REGISTRY_URL}/$1"
+    fi
+}
+
+# Pull an image from ${SENZING_DOCKER_REGISTRY_URL}.
+# When that is not docker.io, the image is also tagged with its docker.io name,
+# which is the name "docker run" uses.
+# Usage: docker_pull <image>:<version>
+
+function docker_pull {
+    REGISTRY_IMAGE=$(docker_registry_image $1)
+    ${SENZING_SUDO} docker pull ${REGISTRY_IMAGE} || return 1
+    if [ "${SENZING_DOCKER_REGISTRY_URL}" != "docker.io" ]; then
+        ${SENZING_SUDO} docker tag ${REGISTRY_IMAGE} $1
+    fi
+    docker_pull_cache_save $1
+}
+
+# --- RabbitMQ shards ---------------------------------------------------------
+
+# Name of the queue for a shard.
+# With SENZING_RABBITMQ_SHARDS=1 it is ${SENZING_RABBITMQ_QUEUE}; otherwise shard N is "${SENZING_RABBITMQ_QUEUE}-N".
+# Usage: rabbitmq_shard_queue <shard>
+
+function rabbitmq_shard_queue {
+    if [ "${SENZING_RABBITMQ_SHARDS:-1}" -gt 1 ]; then
+        echo "${SENZING_RABBITMQ_QUEUE}-$1"
+    else
+        echo "${SENZING_RABBITMQ_QUEUE}"
+    fi
+}
+
+# --- Pull freshness ----------------------------------------------------------
+
+# ${SENZING_DOCKER_PULL_CACHE_DIR} has one file per image: "<epoch of last pull> <image id>".
+# It is shared by all scripts, so "restart" soon after a pull does not contact the registry.
+
+function docker_pull_cache_file {
+    echo "${SENZING_DOCKER_PULL_CACHE_DIR}/$(echo $1 | tr "/:" "--")"
+}
+
+function docker_image_id {
+    ${SENZING_SUDO} docker image inspect --format '{{.Id}}' $1 2>/dev/null
+}
+
+function docker_pull_cache_save {
+    PULL_CACHE_FILE=$(docker_pull_cache_file $1)
+    mkdir -p ${SENZING_DOCKER_PULL_CACHE_DIR}
+    echo "$(date +%s) $(docker_image_id $1)" > ${PULL_CACHE_FILE}.$$ && mv ${PULL_CACHE_FILE}.$$ ${PULL_CACHE_FILE}
+}
+
+# Succeeds if $1 was pulled less than ${SENZING_DOCKER_PULL_TTL} seconds ago
+# and the local image is still the one that was pulled.
+
+function docker_pull_is_fresh {
+    PULL_CACHE_FILE=$(docker_pull_cache_file $1)
+    [ -f ${PULL_CACHE_FILE} ] || return 1
+    read -r PULLED_AT PULLED_ID < ${PULL_CACHE_FILE}
+    [ $(($(date +%s) - ${PULLED_AT:-0})) -lt ${SENZING_DOCKER_PULL_TTL} ] || return 1
+    [ -n "${PULLED_ID}" ] && [ "$(docker_image_id $1)" == "${PULLED_ID}" ]
+}
+
+# Pull an image unless it is fresh.
+# With SENZING_DOCKER_PULL_OFFLINE=true the registry is never contacted; local images are used.
+# Usage: docker_pull_cached <image>:<version>
+
+function docker_pull_cached {
+    if [ "${SENZING_DOCKER_PULL_OFFLINE}" == "true" ]; then
+        echo "Offline. Not pulling $1"
+    elif docker_pull_is_fresh $1; then
+        echo "Pulled less than ${SENZING_DOCKER_PULL_TTL} seconds ago. Not pulling $1"
+    else
+        docker_pull $1
+    fi
+}
+
+# --- Jobs --------------------------------------------------------------------
+
+# Wait until fewer than <limit> background jobs are running.
+# Waits on the oldest job rather than "wait -n", which needs bash 4.3 and macOS has bash 3.2.
+# Usage: wait_for_job_slot <limit>
+
+function wait_for_job_slot {
+    while [ "$(jobs -rp | wc -l)" -ge "$1" ]; do
+        wait $(jobs -rp | head -n 1)
+    done
+}
+"""
+    return 0
+
+
+def file_docker_images_load():
+    """#! /usr/bin/env bash
+
+# --- Functions ---------------------------------------------------------------
+
+function sha256 {
+    if command -v sha256sum > /dev/null; then
+        sha256sum "$1" | cut -d ' ' -f 1
+    else
+        shasum -a 256 "$1" | cut -d ' ' -f 1
+    fi
+}
+
+function decompress {
+    case "$1" in
+        *.zst) zstd --quiet --decompress --stdout "$1" ;;
+        *.gz)  gzip --decompress --stdout "$1" ;;
+        *)     return 1 ;;
+    esac
+}
+
+# Rebuild the "docker save" archive of one image from ${BLOBS_DIR}.
+# Every file is checked against its SHA-256 before the archive is given to "docker load".
+
+function load {
+    INDEX_FILE=${IMAGES_DIR}/$(echo $1 | tr "/:" "--").index
+    if [ ! -f ${INDEX_FILE} ]; then
+        echo "${SENZING_HORIZONTAL_RULE:0:2} Missing: $1"
+        return 1
+    fi
+
+    WORK_DIR=$(mktemp -d ${SENZING_DOCKER_IMAGES_DIR}/.work.XXXXXX)
+    while read -r TYPE VALUE RELATIVE_PATH; do
+        [ "${TYPE}" == "image" ] && continue
+        mkdir -p "$(dirname "${WORK_DIR}/${RELATIVE_PATH}")"
+        if [ "${TYPE}" == "link" ]; then
+            ln -s "${VALUE}" "${WORK_DIR}/${RELATIVE_PATH}"
+        elif ! decompress ${BLOBS_DIR}/${VALUE} > "${WORK_DIR}/${RELATIVE_PATH}" 2>> ${SENZING_LOG_DOCKER_IMAGES} \\
+            || [ "$(sha256 "${WORK_DIR}/${RELATIVE_PATH}")" != "${VALUE%%.*}" ]; then
+            echo "${SENZING_HORIZONTAL_RULE:0:2} Corrupt: $1 (${RELATIVE_PATH})"
+            rm -rf ${WORK_DIR}
+            return 1
+        fi
+    done < ${INDEX_FILE}
+
+    if tar -c -C ${WORK_DIR} . | ${SENZING_SUDO} docker load >> ${SENZING_LOG_DOCKER_IMAGES} 2>&1; then
+        echo "${SENZING_HORIZONTAL_RULE:0:2} Loaded:  $1"
+        rm -rf ${WORK_DIR}
+    else
+        echo "${SENZING_HORIZONTAL_RULE:0:2} Failed:  $1"
+        rm -rf ${WORK_DIR}
+        return 1
+    fi
 }
 
 # --- Main --------------------------------------------------------------------
 
 SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
 source ${SCRIPT_DIR}/docker-environment-vars.sh
+source ${SCRIPT_DIR}/docker-functions.sh
 
-CONTAINER_LOG="${SENZING_LOG_PORTAINER}"
-CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_PORTAINER}"
-CONTAINER_PORT="${SENZING_DOCKER_PORT_PORTAINER}"
-CONTAINER_VERSION="${SENZING_DOCKER_IMAGE_VERSION_PORTAINER}"
+BLOBS_DIR=${SENZING_DOCKER_IMAGES_DIR}/blobs
+IMAGES_DIR=${SENZING_DOCKER_IMAGES_DIR}/images
 
-if [ "$1" == "up" ]; then
-    up
-elif [ "$1" == "down" ]; then
-    down
-elif [ "$1" == "restart" ]; then
-    down
-    up
+# Without an argument, load every image in the bundle.
+# With an argument, e.g. "REST", load the images listed in DOCKER_IMAGE_NAMES_REST.
+
+SUFFIX=$1
+if [ -z "${SUFFIX}" ]; then
+    DOCKER_IMAGE_NAMES_STRING="all saved images"
+    DOCKER_IMAGE_NAMES=()
+    for INDEX_FILE in ${IMAGES_DIR}/*.index; do
+        [ -f "${INDEX_FILE}" ] && DOCKER_IMAGE_NAMES+=("$(head -1 ${INDEX_FILE} | cut -d ' ' -f 2)")
+    done
 else
-    usage
+    SUFFIX_UPPER_CASE=$(echo "${SUFFIX}" | tr '[:lower:]' '[:upper:]' )
+    DOCKER_IMAGE_NAMES_STRING="DOCKER_IMAGE_NAMES_${SUFFIX_UPPER_CASE}"
+    eval "DOCKER_IMAGE_NAMES=(\\"\\${${DOCKER_IMAGE_NAMES_STRING}[@]}\\")"
+fi
+
+echo "${SENZING_HORIZONTAL_RULE}"
+echo "${SENZING_HORIZONTAL_RULE:0:2} Load docker images from ${SENZING_DOCKER_IMAGES_DIR}."
+echo "${SENZING_HORIZONTAL_RULE:0:2} Images: ${DOCKER_IMAGE_NAMES_STRING}  Parallelism: ${SENZING_DOCKER_IMAGES_PARALLELISM}"
+echo "${SENZING_HORIZONTAL_RULE:0:2} Logs:"
+echo "${SENZING_HORIZONTAL_RULE:0:2}   ${SENZING_LOG_DOCKER_IMAGES}"
+echo "${SENZING_HORIZONTAL_RULE:0:2} For more information:"
+echo "${SENZING_HORIZONTAL_RULE:0:2} ${SENZING_REFERENCE_URL}#docker-images-load"
+echo "${SENZING_HORIZONTAL_RULE:0:2}"
+
+mkdir -p $(dirname ${SENZING_LOG_DOCKER_IMAGES})
+FAILED_FILE=$(mktemp)
+
+for DOCKER_IMAGE_NAME in ${DOCKER_IMAGE_NAMES[@]};
+do
+    wait_for_job_slot ${SENZING_DOCKER_IMAGES_PARALLELISM}
+    load ${DOCKER_IMAGE_NAME} || echo ${DOCKER_IMAGE_NAME} >> ${FAILED_FILE} &
+done
+wait
+
+FAILURES=$(wc -l < ${FAILED_FILE})
+rm -f ${FAILED_FILE}
+
+echo "${SENZING_HORIZONTAL_RULE:0:2}"
+if [ "${FAILURES}" -gt 0 ]; then
+    echo "${SENZING_HORIZONTAL_RULE:0:2} Done. ${FAILURES} image(s) failed to load."
+    echo "${SENZING_HORIZONTAL_RULE}"
+    exit 1
 fi
+echo "${SENZING_HORIZONTAL_RULE:0:2} Done."
+echo "${SENZING_HORIZONTAL_RULE}"
 """
     return 0
 
 
-def file_postgres():
-    """#!/usr/bin/env bash
+def file_docker_images_save():
+    """#! /usr/bin/env bash
 
 # --- Functions ---------------------------------------------------------------
 
-function up {
-    echo -ne "\033[2K${CONTAINER_NAME} status: starting...\r"
+function sha256 {
+    if command -v sha256sum > /dev/null; then
+        sha256sum "$1" | cut -d ' ' -f 1
+    else
+        shasum -a 256 "$1" | cut -d ' ' -f 1
+    fi
+}
 
-    if [ "${CONTAINER_VERSION}" == "latest" ]
-    then
-        ${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/postgres:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
+function compress {
+    if [ "${COMPRESSION}" == "zst" ]; then
+        zstd --quiet --threads=0 --stdout
+    else
+        gzip --stdout
     fi
+}
 
-    ${SENZING_SUDO} docker run \\
-        --detach \\
-        --env POSTGRES_DB=${POSTGRES_DATABASE} \\
-        --env POSTGRES_PASSWORD=${DATABASE_PASSWORD} \\
-        --env POSTGRES_USERNAME=${DATABASE_USERNAME} \\
-        --name ${CONTAINER_NAME} \\
-        --publish ${CONTAINER_PORT}:5432 \\
-        --restart always \\
-        --volume ${POSTGRES_DIR}:/var/lib/postgresql/data \\
-        ${SENZING_DOCKER_RUN_PARAMETERS_GLOBAL} \\
-        ${SENZING_DOCKER_RUN_PARAMETERS_POSTGRES} \\
-        ${SENZING_NETWORK_PARAMETER} \\
-        ${SENZING_PRIVILEGED_PARAMETER} \\
-        postgres:${CONTAINER_VERSION} \\
-        >> ${CONTAINER_LOG} 2>&1
+# Save one image.  Each file of its "docker save" archive is stored once in ${BLOBS_DIR},
+# compressed and named by its SHA-256, so layers shared by several images are stored once.
+# ${IMAGES_DIR}/<image>.index lists the files needed to rebuild the archive.
+# Usage: save <image> <job number>
+#   Blobs are written under a temporary name made of the script PID ($$) and <job number>, then renamed.
+
+function save {
+    DOCKER_IMAGE=$1
+    JOB_NUMBER=$2
+    INDEX_FILE=${IMAGES_DIR}/$(echo $1 | tr "/:" "--").index
+    WORK_DIR=$(mktemp -d ${SENZING_DOCKER_IMAGES_DIR}/.work.XXXXXX)
+
+    if ! ${SENZING_SUDO} docker image inspect ${DOCKER_IMAGE} > /dev/null 2>&1 \\
+        && ! docker_pull ${DOCKER_IMAGE} >> ${SENZING_LOG_DOCKER_IMAGES} 2>&1; then
+        echo "${SENZING_HORIZONTAL_RULE:0:2} Failed:  $1 (pull)"
+        rm -rf ${WORK_DIR}
+        return 1
+    fi
+
+    if ! ${SENZING_SUDO} docker save ${DOCKER_IMAGE} 2>> ${SENZING_LOG_DOCKER_IMAGES} | tar -x -C ${WORK_DIR}; then
+        echo "${SENZING_HORIZONTAL_RULE:0:2} Failed:  $1 (save)"
+        rm -rf ${WORK_DIR}
+        return 1
+    fi
 
-    COUNTER=0
-    COUNTER_NOTICE=5
-    TIME_STRING=".."
-    CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    while [ "${CONTAINER_STATUS}" != "running" ]; do
-        COUNTER=$((${COUNTER}+1))
-        if [ "${COUNTER}" -eq "${COUNTER_NOTICE}" ]; then
-            echo -ne "\033[2K"
-            echo ""
-            echo "To see what is happening behind-the-scenes, view the log at"
-            echo "${CONTAINER_LOG}"
-            echo "and/or run 'docker logs ${CONTAINER_NAME}'"
-            echo ""
+    NEW_BLOBS=0
+    echo "image $1 ." > ${WORK_DIR}.index
+    while IFS= read -r -d '' FILE; do
+        RELATIVE_PATH=${FILE#${WORK_DIR}/}
+        if [ -L "${FILE}" ]; then
+            echo "link $(readlink "${FILE}") ${RELATIVE_PATH}" >> ${WORK_DIR}.index
+            continue
         fi
-        TIME_STRING="${TIME_STRING}."
-        echo -ne "\033[2K${CONTAINER_NAME} status: ${CONTAINER_STATUS}${TIME_STRING}\r"
-        sleep 5
-        CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    done
+        BLOB=$(sha256 "${FILE}").${COMPRESSION}
+        if [ ! -f ${BLOBS_DIR}/${BLOB} ]; then
+            TEMPORARY_BLOB=${BLOBS_DIR}/.${BLOB}.$$.${JOB_NUMBER}
+            compress < "${FILE}" > ${TEMPORARY_BLOB} && mv ${TEMPORARY_BLOB} ${BLOBS_DIR}/${BLOB}
+            NEW_BLOBS=$((NEW_BLOBS + 1))
+        fi
+        echo "file ${BLOB} ${RELATIVE_PATH}" >> ${WORK_DIR}.index
+    done < <(find ${WORK_DIR} ! -type d -print0)
 
+    mv ${WORK_DIR}.index ${INDEX_FILE}
+    rm -rf ${WORK_DIR}
+    echo "${SENZING_HORIZONTAL_RULE:0:2} Saved:   $1  New blobs: ${NEW_BLOBS}"
+}
+
+# --- Main --------------------------------------------------------------------
+
+SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
+source ${SCRIPT_DIR}/docker-environment-vars.sh
+source ${SCRIPT_DIR}/docker-functions.sh
+
+SUFFIX=$1
+SUFFIX_UPPER_CASE=$(echo "${SUFFIX:-ALL}" | tr '[:lower:]' '[:upper:]' )
+DOCKER_IMAGE_NAMES_STRING="DOCKER_IMAGE_NAMES_${SUFFIX_UPPER_CASE}"
+eval "DOCKER_IMAGE_NAMES=(\\"\\${${DOCKER_IMAGE_NAMES_STRING}[@]}\\")"
+
+BLOBS_DIR=${SENZING_DOCKER_IMAGES_DIR}/blobs
+IMAGES_DIR=${SENZING_DOCKER_IMAGES_DIR}/images
+
+# zstd is preferred.  Without it, gzip is used.
+
+if command -v zstd > /dev/null; then
+    export COMPRESSION=zst
+else
+    export COMPRESSION=gz
+fi
+
+echo "${SENZING_HORIZONTAL_RULE}"
+echo "${SENZING_HORIZONTAL_RULE:0:2} Save docker images for ${SENZING_PROJECT_NAME} to ${SENZING_DOCKER_IMAGES_DIR}."
+echo "${SENZING_HORIZONTAL_RULE:0:2} Images: ${DOCKER_IMAGE_NAMES_STRING}  Parallelism: ${SENZING_DOCKER_IMAGES_PARALLELISM}  Compression: ${COMPRESSION}"
+echo "${SENZING_HORIZONTAL_RULE:0:2} Logs:"
+echo "${SENZING_HORIZONTAL_RULE:0:2}   ${SENZING_LOG_DOCKER_IMAGES}"
+echo "${SENZING_HORIZONTAL_RULE:0:2} For more information:"
+echo "${SENZING_HORIZONTAL_RULE:0:2} ${SENZING_REFERENCE_URL}#docker-images-save"
+echo "${SENZING_HORIZONTAL_RULE:0:2}"
+
+mkdir -p ${BLOBS_DIR} ${IMAGES_DIR} $(dirname ${SENZING_LOG_DOCKER_IMAGES})
+FAILED_FILE=$(mktemp)
+JOB_NUMBER=0
+
+for DOCKER_IMAGE_NAME in ${DOCKER_IMAGE_NAMES[@]};
+do
+    wait_for_job_slot ${SENZING_DOCKER_IMAGES_PARALLELISM}
+    JOB_NUMBER=$((JOB_NUMBER + 1))
+    save ${DOCKER_IMAGE_NAME} ${JOB_NUMBER} || echo ${DOCKER_IMAGE_NAME} >> ${FAILED_FILE} &
+done
+wait
+
+FAILURES=$(wc -l < ${FAILED_FILE})
+rm -f ${FAILED_FILE}
+
+echo "${SENZING_HORIZONTAL_RULE:0:2}"
+echo "${SENZING_HORIZONTAL_RULE:0:2} Bundle size: $(du -sh ${SENZING_DOCKER_IMAGES_DIR} | cut -f 1)"
+if [ "${FAILURES}" -gt 0 ]; then
+    echo "${SENZING_HORIZONTAL_RULE:0:2} Done. ${FAILURES} image(s) failed to save."
     echo "${SENZING_HORIZONTAL_RULE}"
-    echo "${SENZING_HORIZONTAL_RULE:0:2} ${CONTAINER_NAME} listening on ${SENZING_DOCKER_HOST_IP_ADDR}:${CONTAINER_PORT}"
-    echo "${SENZING_HORIZONTAL_RULE:0:2} Username: ${DATABASE_USERNAME} Password: ${DATABASE_PASSWORD}"
-    echo "${SENZING_HORIZONTAL_RULE:0:2} Logs:"
-    echo "${SENZING_HORIZONTAL_RULE:0:2}   ${CONTAINER_LOG}"
-    echo "${SENZING_HORIZONTAL_RULE:0:2}   and/or run 'docker logs ${CONTAINER_NAME}'"
-    echo "${SENZING_HORIZONTAL_RULE:0:2} For more information:"
-    echo "${SENZING_HORIZONTAL_RULE:0:2} ${SENZING_REFERENCE_URL}#postgres"
-    echo "${SENZING_HORIZONTAL_RULE}"
+    exit 1
+fi
+echo "${SENZING_HORIZONTAL_RULE:0:2} Done."
+echo "${SENZING_HORIZONTAL_RULE}"
+"""
+    return 0
+
+
+def file_docker_pull_latest():
+    """#! /usr/bin/env bash
+
+# --- Functions ---------------------------------------------------------------
+
+function remote_digest {
+    ${SENZING_SUDO} docker buildx imagetools inspect $1 2>/dev/null | awk '/^Digest:/ {print $2; exit}'
 }
 
-function down {
-    ${SENZING_SUDO} docker stop ${CONTAINER_NAME} >> ${CONTAINER_LOG} 2>&1
-    ${SENZING_SUDO} docker rm   ${CONTAINER_NAME} >> ${CONTAINER_LOG} 2>&1
+function is_current {
+    REMOTE_DIGEST="$(remote_digest $1)"
+    if [ -z "${REMOTE_DIGEST}" ]; then
+        return 1
+    fi
+    ${SENZING_SUDO} docker image inspect --format '{{range .RepoDigests}}{{println .}}{{end}}' $1 2>/dev/null | grep --quiet "@${REMOTE_DIGEST}$"
 }
 
-function usage {
-    echo "usage: $0 [up | down | restart]"
-    echo "For more information:"
-    echo "${SENZING_REFERENCE_URL}#postgres"
+function pull {
+    DOCKER_IMAGE=$(docker_registry_image $1)
+    if is_current ${DOCKER_IMAGE}; then
+        docker_pull_cache_save $1
+        echo "${SENZING_HORIZONTAL_RULE:0:2} Current: $1"
+    elif docker_pull $1 >> ${SENZING_LOG_DOCKER_PULL_LATEST} 2>&1; then
+        echo "${SENZING_HORIZONTAL_RULE:0:2} Pulled:  $1"
+    else
+        echo "${SENZING_HORIZONTAL_RULE:0:2} Failed:  $1"
+        return 1
+    fi
 }
 
 # --- Main --------------------------------------------------------------------
 
 SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
 source ${SCRIPT_DIR}/docker-environment-vars.sh
+source ${SCRIPT_DIR}/docker-functions.sh
 
-CONTAINER_LOG="${SENZING_LOG_POSTGRES}"
-CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_POSTGRES}"
-CONTAINER_PORT="${SENZING_DOCKER_PORT_POSTGRES}"
-CONTAINER_VERSION="${SENZING_DOCKER_IMAGE_VERSION_POSTGRES}"
+SUFFIX=$1
+SUFFIX_UPPER_CASE=$(echo "${SUFFIX:-ALL}" | tr '[:lower:]' '[:upper:]' )
+DOCKER_IMAGE_NAMES_STRING="DOCKER_IMAGE_NAMES_${SUFFIX_UPPER_CASE}"
+eval "DOCKER_IMAGE_NAMES=(\\"\\${${DOCKER_IMAGE_NAMES_STRING}[@]}\\")"
 
-if [ "$1" == "up" ]; then
-    up
-elif [ "$1" == "down" ]; then
-    down
-elif [ "$1" == "restart" ]; then
-    down
-    up
-else
-    usage
+echo "${SENZING_HORIZONTAL_RULE}"
+echo "${SENZING_HORIZONTAL_RULE:0:2} Pull ${SENZING_PROJECT_NAME} docker containers for DockerHub."
+echo "${SENZING_HORIZONTAL_RULE:0:2} Images: ${DOCKER_IMAGE_NAMES_STRING}  Parallelism: ${SENZING_DOCKER_PULL_PARALLELISM}"
+echo "${SENZING_HORIZONTAL_RULE:0:2} Logs:"
+echo "${SENZING_HORIZONTAL_RULE:0:2}   ${SENZING_LOG_DOCKER_PULL_LATEST}"
+echo "${SENZING_HORIZONTAL_RULE:0:2} For more information:"
+echo "${SENZING_HORIZONTAL_RULE:0:2} ${SENZING_REFERENCE_URL}#docker-pull-latest"
+echo "${SENZING_HORIZONTAL_RULE:0:2}"
+
+# Pull images with a bounded pool of background jobs.
+# Images whose local digest matches the registry digest are not pulled.
+
+FAILED_FILE=$(mktemp)
+
+for DOCKER_IMAGE_NAME in ${DOCKER_IMAGE_NAMES[@]};
+do
+    wait_for_job_slot ${SENZING_DOCKER_PULL_PARALLELISM}
+    pull ${DOCKER_IMAGE_NAME} || echo ${DOCKER_IMAGE_NAME} >> ${FAILED_FILE} &
+done
+wait
+
+FAILURES=$(wc -l < ${FAILED_FILE})
+rm -f ${FAILED_FILE}
+
+echo "${SENZING_HORIZONTAL_RULE:0:2}"
+if [ "${FAILURES}" -gt 0 ]; then
+    echo "${SENZING_HORIZONTAL_RULE:0:2} Done. ${FAILURES} image(s) failed to pull."
+    echo "${SENZING_HORIZONTAL_RULE}"
+    exit 1
 fi
+echo "${SENZING_HORIZONTAL_RULE:0:2} Done."
+echo "${SENZING_HORIZONTAL_RULE}"
 """
     return 0
 
 
-def file_senzing_api_server():
+def file_portainer():
     """#!/usr/bin/env bash
 
 # --- Functions ---------------------------------------------------------------
@@ -1267,71 +2286,33 @@ function up {
 
     if [ "${CONTAINER_VERSION}" == "latest" ]
     then
-        ${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/senzing-api-server:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
+        docker_pull_cached portainer/portainer:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
     fi
 
+    READY_SINCE=$(date +%s)
     ${SENZING_SUDO} docker run \\
         --detach \\
-        --env SENZING_DATABASE_URL=${SENZING_DATABASE_URL} \\
-        --interactive \\
         --name ${CONTAINER_NAME} \\
-        --publish ${CONTAINER_PORT}:${SENZING_DOCKER_PORT_SENZING_API_SERVER} \\
+        --publish ${CONTAINER_PORT}:9000 \\
         --restart always \\
-        --tty \\
-        --user $(id -u):$(id -g) \\
-        --volume ${SENZING_DATA_VERSION_DIR}:/opt/senzing/data \\
-        --volume ${SENZING_ETC_DIR}:/etc/opt/senzing \\
-        --volume ${SENZING_G2_DIR}:/opt/senzing/g2 \\
-        --volume ${SENZING_OPT_IBM_DIR}:/opt/IBM \\
-        --volume ${SENZING_OPT_MICROSOFT_DIR}:/opt/microsoft \\
-        --volume ${SENZING_VAR_DIR}:/var/opt/senzing \\
+        --volume ${SENZING_DOCKER_SOCKET}:/var/run/docker.sock \\
+        --volume ${SENZING_PORTAINER_DIR}:/data \\
         ${SENZING_DOCKER_RUN_PARAMETERS_GLOBAL} \\
-        ${SENZING_DOCKER_RUN_PARAMETERS_SENZING_API_SERVER} \\
+        ${SENZING_DOCKER_RUN_PARAMETERS_PORTAINER} \\
         ${SENZING_NETWORK_PARAMETER} \\
-        ${SENZING_MSSQL_PARAMETERS} \\
         ${SENZING_PRIVILEGED_PARAMETER} \\
-        senzing/senzing-api-server:${CONTAINER_VERSION} \\
-            -httpPort ${SENZING_DOCKER_PORT_SENZING_API_SERVER} \\
-            -bindAddr all \\
-            -iniFile /etc/opt/senzing/G2Module.ini \\
-            -allowedOrigins "*" \\
-            -enableAdmin \\
+        portainer/portainer:${CONTAINER_VERSION} \\
         >> ${CONTAINER_LOG} 2>&1
 
-    COUNTER=0
-    COUNTER_NOTICE=5
-    TIME_STRING=".."
-    CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    while [ "${CONTAINER_STATUS}" != "running" ]; do
-        COUNTER=$((${COUNTER}+1))
-        if [ "${COUNTER}" -eq "${COUNTER_NOTICE}" ]; then
-            echo -ne "\033[2K"
-            echo ""
-            echo "To see what is happening behind-the-scenes, view the log at"
-            echo "${CONTAINER_LOG}"
-            echo "and/or run 'docker logs ${CONTAINER_NAME}'"
-            echo ""
-        fi
-        TIME_STRING="${TIME_STRING}."
-        echo -ne "\033[2K${CONTAINER_NAME} status: ${CONTAINER_STATUS}${TIME_STRING}\r"
-        sleep 5
-        CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    done
-    sleep 10
+    wait_for_ready ${READY_SINCE} || return 1
 
     echo "${SENZING_HORIZONTAL_RULE}"
     echo "${SENZING_HORIZONTAL_RULE:0:2} ${CONTAINER_NAME} running on http://${SENZING_DOCKER_HOST_IP_ADDR}:${CONTAINER_PORT}"
-    echo "${SENZING_HORIZONTAL_RULE:0:2} Try http://${SENZING_DOCKER_HOST_IP_ADDR}:${CONTAINER_PORT}/heartbeat"
-    echo "${SENZING_HORIZONTAL_RULE:0:2} Mount information: (Format: in container > on host)"
-    echo "${SENZING_HORIZONTAL_RULE:0:2}   /etc/opt/senzing  > ${SENZING_ETC_DIR}"
-    echo "${SENZING_HORIZONTAL_RULE:0:2}   /opt/senzing/data > ${SENZING_DATA_VERSION_DIR}"
-    echo "${SENZING_HORIZONTAL_RULE:0:2}   /opt/senzing/g2   > ${SENZING_G2_DIR}"
-    echo "${SENZING_HORIZONTAL_RULE:0:2}   /var/opt/senzing  > ${SENZING_VAR_DIR}"
     echo "${SENZING_HORIZONTAL_RULE:0:2} Logs:"
     echo "${SENZING_HORIZONTAL_RULE:0:2}   ${CONTAINER_LOG}"
     echo "${SENZING_HORIZONTAL_RULE:0:2}   and/or run 'docker logs ${CONTAINER_NAME}'"
     echo "${SENZING_HORIZONTAL_RULE:0:2} For more information:"
-    echo "${SENZING_HORIZONTAL_RULE:0:2} ${SENZING_REFERENCE_URL}#senzing-api-server"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} ${SENZING_REFERENCE_URL}#portainer"
     echo "${SENZING_HORIZONTAL_RULE}"
 }
 
@@ -1343,18 +2324,19 @@ function down {
 function usage {
     echo "usage: $0 [up | down | restart]"
     echo "For more information:"
-    echo "${SENZING_REFERENCE_URL}#senzing-api-server"
+    echo "${SENZING_REFERENCE_URL}#portainer"
 }
 
 # --- Main --------------------------------------------------------------------
 
 SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
 source ${SCRIPT_DIR}/docker-environment-vars.sh
+source ${SCRIPT_DIR}/docker-functions.sh
 
-CONTAINER_LOG="${SENZING_LOG_SENZING_API_SERVER}"
-CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_SENZING_API_SERVER}"
-CONTAINER_PORT="${SENZING_DOCKER_PORT_SENZING_API_SERVER}"
-CONTAINER_VERSION="${SENZING_DOCKER_IMAGE_VERSION_SENZING_API_SERVER}"
+CONTAINER_LOG="${SENZING_LOG_PORTAINER}"
+CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_PORTAINER}"
+CONTAINER_PORT="${SENZING_DOCKER_PORT_PORTAINER}"
+CONTAINER_VERSION="${SENZING_DOCKER_IMAGE_VERSION_PORTAINER}"
 
 if [ "$1" == "up" ]; then
     up
@@ -1370,11 +2352,255 @@ fi
     return 0
 
 
-def file_senzing_console():
+def file_postgres():
+    """#!/usr/bin/env bash
+
+# --- Functions ---------------------------------------------------------------
+
+# SENZING_POSTGRES_INSTANCES lists the PostgreSQL containers to run.
+# "core" holds the Senzing database.  With a clustered G2Module.ini,
+# "res" and "libfeat" hold the tables listed in its [HYBRID] section.
+
+function select_instance {
+    case $1 in
+        core)
+            CONTAINER_DIR="${POSTGRES_DIR}"
+            CONTAINER_LOG="${SENZING_LOG_POSTGRES}"
+            CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_POSTGRES}"
+            CONTAINER_PORT="${SENZING_DOCKER_PORT_POSTGRES}"
+            ;;
+        libfeat)
+            CONTAINER_DIR="${POSTGRES_LIBFEAT_DIR}"
+            CONTAINER_LOG="${SENZING_LOG_POSTGRES_LIBFEAT}"
+            CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_POSTGRES_LIBFEAT}"
+            CONTAINER_PORT="${SENZING_DOCKER_PORT_POSTGRES_LIBFEAT}"
+            ;;
+        res)
+            CONTAINER_DIR="${POSTGRES_RES_DIR}"
+            CONTAINER_LOG="${SENZING_LOG_POSTGRES_RES}"
+            CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_POSTGRES_RES}"
+            CONTAINER_PORT="${SENZING_DOCKER_PORT_POSTGRES_RES}"
+            ;;
+        *)
+            echo "Unknown PostgreSQL instance: $1"
+            return 1
+            ;;
+    esac
+}
+
+function up {
+    select_instance core
+
+    if [ "${CONTAINER_VERSION}" == "latest" ]
+    then
+        echo -ne "\033[2K${CONTAINER_NAME} status: pulling...\r"
+        docker_pull_cached postgres:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
+    fi
+
+    # Start all instances, then wait for each.
+
+    READY_SINCE=$(date +%s)
+    for INSTANCE in ${SENZING_POSTGRES_INSTANCES};
+    do
+        select_instance ${INSTANCE} || return 1
+        echo -ne "\033[2K${CONTAINER_NAME} status: starting...\r"
+        up_instance
+    done
+
+    for INSTANCE in ${SENZING_POSTGRES_INSTANCES};
+    do
+        select_instance ${INSTANCE}
+        wait_for_ready ${READY_SINCE} probe_postgres || return 1
+    done
+
+    echo "${SENZING_HORIZONTAL_RULE}"
+    for INSTANCE in ${SENZING_POSTGRES_INSTANCES};
+    do
+        select_instance ${INSTANCE}
+        echo "${SENZING_HORIZONTAL_RULE:0:2} ${CONTAINER_NAME} listening on ${SENZING_DOCKER_HOST_IP_ADDR}:${CONTAINER_PORT}"
+    done
+    echo "${SENZING_HORIZONTAL_RULE:0:2} Username: ${DATABASE_USERNAME} Password: ${DATABASE_PASSWORD}"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} Logs:"
+    for INSTANCE in ${SENZING_POSTGRES_INSTANCES};
+    do
+        select_instance ${INSTANCE}
+        echo "${SENZING_HORIZONTAL_RULE:0:2}   ${CONTAINER_LOG}"
+    done
+    echo "${SENZING_HORIZONTAL_RULE:0:2}   and/or run 'docker logs ${SENZING_DOCKER_CONTAINER_NAME_POSTGRES}'"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} For more information:"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} ${SENZING_REFERENCE_URL}#postgres"
+    echo "${SENZING_HORIZONTAL_RULE}"
+}
+
+function up_instance {
+    ${SENZING_SUDO} docker run \\
+        --detach \\
+        --env POSTGRES_DB=${POSTGRES_DATABASE} \\
+        --env POSTGRES_PASSWORD=${DATABASE_PASSWORD} \\
+        --env POSTGRES_USERNAME=${DATABASE_USERNAME} \\
+        --name ${CONTAINER_NAME} \\
+        --publish ${CONTAINER_PORT}:5432 \\
+        --restart always \\
+        --shm-size 1g \\
+        --volume ${CONTAINER_DIR}:/var/lib/postgresql/data \\
+        ${SENZING_DOCKER_RUN_PARAMETERS_GLOBAL} \\
+        ${SENZING_DOCKER_RUN_PARAMETERS_POSTGRES} \\
+        ${SENZING_NETWORK_PARAMETER} \\
+        ${SENZING_PRIVILEGED_PARAMETER} \\
+        postgres:${CONTAINER_VERSION} \\
+        ${SENZING_POSTGRES_PARAMETERS} \\
+        >> ${CONTAINER_LOG} 2>&1
+}
+
+# Bring down every instance that exists, whatever the current SENZING_POSTGRES_INSTANCES.
+
+function down {
+    EXISTING_CONTAINERS=" $(${SENZING_SUDO} docker ps --all --filter "name=^${SENZING_DOCKER_CONTAINER_NAME_POSTGRES}(-res|-libfeat)?$" --format '{{.Names}}' | tr '\\n' ' ') "
+    for INSTANCE in core libfeat res;
+    do
+        select_instance ${INSTANCE}
+        if [[ "${EXISTING_CONTAINERS}" == *" ${CONTAINER_NAME} "* ]]; then
+            down_instance &
+        fi
+    done
+    wait
+}
+
+function down_instance {
+    ${SENZING_SUDO} docker stop ${CONTAINER_NAME} >> ${CONTAINER_LOG} 2>&1
+    ${SENZING_SUDO} docker rm   ${CONTAINER_NAME} >> ${CONTAINER_LOG} 2>&1
+}
+
+function usage {
+    echo "usage: $0 [up | down | restart]"
+    echo "For more information:"
+    echo "${SENZING_REFERENCE_URL}#postgres"
+}
+
+# --- Main --------------------------------------------------------------------
+
+SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
+source ${SCRIPT_DIR}/docker-environment-vars.sh
+source ${SCRIPT_DIR}/docker-functions.sh
+
+CONTAINER_VERSION="${SENZING_DOCKER_IMAGE_VERSION_POSTGRES}"
+
+if [ "$1" == "up" ]; then
+    up
+elif [ "$1" == "down" ]; then
+    down
+elif [ "$1" == "restart" ]; then
+    down
+    up
+else
+    usage
+fi
+"""
+    return 0
+
+
+def file_senzing_api_server():
+    """#!/usr/bin/env bash
+
+# --- Functions ---------------------------------------------------------------
+
+function up {
+    echo -ne "\033[2K${CONTAINER_NAME} status: starting...\r"
+
+    if [ "${CONTAINER_VERSION}" == "latest" ]
+    then
+        docker_pull_cached senzing/senzing-api-server:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
+    fi
+
+    READY_SINCE=$(date +%s)
+    ${SENZING_SUDO} docker run \\
+        --detach \\
+        --env SENZING_DATABASE_URL=${SENZING_DATABASE_URL} \\
+        --interactive \\
+        --name ${CONTAINER_NAME} \\
+        --publish ${CONTAINER_PORT}:${SENZING_DOCKER_PORT_SENZING_API_SERVER} \\
+        --restart always \\
+        --tty \\
+        --user $(id -u):$(id -g) \\
+        --volume ${SENZING_DATA_VERSION_DIR}:/opt/senzing/data \\
+        --volume ${SENZING_ETC_DIR}:/etc/opt/senzing \\
+        --volume ${SENZING_G2_DIR}:/opt/senzing/g2 \\
+        --volume ${SENZING_OPT_IBM_DIR}:/opt/IBM \\
+        --volume ${SENZING_OPT_MICROSOFT_DIR}:/opt/microsoft \\
+        --volume ${SENZING_VAR_DIR}:/var/opt/senzing \\
+        ${SENZING_DOCKER_RUN_PARAMETERS_GLOBAL} \\
+        ${SENZING_DOCKER_RUN_PARAMETERS_SENZING_API_SERVER} \\
+        ${SENZING_NETWORK_PARAMETER} \\
+        ${SENZING_MSSQL_PARAMETERS} \\
+        ${SENZING_PRIVILEGED_PARAMETER} \\
+        senzing/senzing-api-server:${CONTAINER_VERSION} \\
+            -httpPort ${SENZING_DOCKER_PORT_SENZING_API_SERVER} \\
+            -bindAddr all \\
+            -iniFile /etc/opt/senzing/G2Module.ini \\
+            -allowedOrigins "*" \\
+            -enableAdmin \\
+        >> ${CONTAINER_LOG} 2>&1
+
+    wait_for_ready ${READY_SINCE} probe_http http://${SENZING_DOCKER_HOST_IP_ADDR}:${CONTAINER_PORT}/heartbeat || return 1
+
+    echo "${SENZING_HORIZONTAL_RULE}"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} ${CONTAINER_NAME} running on http://${SENZING_DOCKER_HOST_IP_ADDR}:${CONTAINER_PORT}"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} Try http://${SENZING_DOCKER_HOST_IP_ADDR}:${CONTAINER_PORT}/heartbeat"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} Mount information: (Format: in container > on host)"
+    echo "${SENZING_HORIZONTAL_RULE:0:2}   /etc/opt/senzing  > ${SENZING_ETC_DIR}"
+    echo "${SENZING_HORIZONTAL_RULE:0:2}   /opt/senzing/data > ${SENZING_DATA_VERSION_DIR}"
+    echo "${SENZING_HORIZONTAL_RULE:0:2}   /opt/senzing/g2   > ${SENZING_G2_DIR}"
+    echo "${SENZING_HORIZONTAL_RULE:0:2}   /var/opt/senzing  > ${SENZING_VAR_DIR}"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} Logs:"
+    echo "${SENZING_HORIZONTAL_RULE:0:2}   ${CONTAINER_LOG}"
+    echo "${SENZING_HORIZONTAL_RULE:0:2}   and/or run 'docker logs ${CONTAINER_NAME}'"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} For more information:"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} ${SENZING_REFERENCE_URL}#senzing-api-server"
+    echo "${SENZING_HORIZONTAL_RULE}"
+}
+
+function down {
+    ${SENZING_SUDO} docker stop ${CONTAINER_NAME} >> ${CONTAINER_LOG} 2>&1
+    ${SENZING_SUDO} docker rm   ${CONTAINER_NAME} >> ${CONTAINER_LOG} 2>&1
+}
+
+function usage {
+    echo "usage: $0 [up | down | restart]"
+    echo "For more information:"
+    echo "${SENZING_REFERENCE_URL}#senzing-api-server"
+}
+
+# --- Main --------------------------------------------------------------------
+
+SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
+source ${SCRIPT_DIR}/docker-environment-vars.sh
+source ${SCRIPT_DIR}/docker-functions.sh
+
+CONTAINER_LOG="${SENZING_LOG_SENZING_API_SERVER}"
+CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_SENZING_API_SERVER}"
+CONTAINER_PORT="${SENZING_DOCKER_PORT_SENZING_API_SERVER}"
+CONTAINER_VERSION="${SENZING_DOCKER_IMAGE_VERSION_SENZING_API_SERVER}"
+
+if [ "$1" == "up" ]; then
+    up
+elif [ "$1" == "down" ]; then
+    down
+elif [ "$1" == "restart" ]; then
+    down
+    up
+else
+    usage
+fi
+"""
+    return 0
+
+
+def file_senzing_console():
     """#!/usr/bin/env bash
 
 SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
 source ${SCRIPT_DIR}/docker-environment-vars.sh
+source ${SCRIPT_DIR}/docker-functions.sh
 
 CONTAINER_LOG="${SENZING_LOG_SENZING_CONSOLE}"
 CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_SENZING_CONSOLE}"
@@ -1384,7 +2610,7 @@ echo -ne "\033[2K${CONTAINER_NAME} status: starting...\r"
 
 if [ "${CONTAINER_VERSION}" == "latest" ]
 then
-    ${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/senzing-console:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
+    docker_pull_cached senzing/senzing-console:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
 fi
 
 echo "${SENZING_HORIZONTAL_RULE}"
@@ -1429,7 +2655,7 @@ function up {
 
     if [ "${CONTAINER_VERSION}" == "latest" ]
     then
-        ${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/db2-driver-installer:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
+        docker_pull_cached senzing/db2-driver-installer:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
     fi
 
     mv ${SENZING_OPT_IBM_DIR} ${SENZING_OPT_IBM_DIR}.$(date +%s) || true
@@ -1446,26 +2672,6 @@ function up {
         senzing/db2-driver-installer:${CONTAINER_VERSION} \\
         >> ${CONTAINER_LOG} 2>&1
 
-    COUNTER=0
-    COUNTER_NOTICE=5
-    TIME_STRING=".."
-    CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    while [ "${CONTAINER_STATUS}" != "running" ]; do
-        COUNTER=$((${COUNTER}+1))
-        if [ "${COUNTER}" -eq "${COUNTER_NOTICE}" ]; then
-            echo -ne "\033[2K"
-            echo ""
-            echo "To see what is happening behind-the-scenes, view the log at"
-            echo "${CONTAINER_LOG}"
-            echo "and/or run 'docker logs ${CONTAINER_NAME}'"
-            echo ""
-        fi
-        TIME_STRING="${TIME_STRING}."
-        echo -ne "\033[2K${CONTAINER_NAME} status: ${CONTAINER_STATUS}${TIME_STRING}\r"
-        sleep 5
-        CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    done
-
     sudo -p "sudo access is required to change file ownership.  Please enter your password:  " docker info >> /dev/null 2>&1
     sudo chown -R $(id -u):$(id -g) ${SENZING_OPT_IBM_DIR}
 
@@ -1494,6 +2700,7 @@ function usage {
 
 SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
 source ${SCRIPT_DIR}/docker-environment-vars.sh
+source ${SCRIPT_DIR}/docker-functions.sh
 
 CONTAINER_LOG="${SENZING_LOG_DB2_DRIVER_INSTALLER}"
 CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_DB2_DRIVER_INSTALLER}"
@@ -1523,9 +2730,10 @@ function up {
 
     if [ "${CONTAINER_VERSION}" == "latest" ]
     then
-        ${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/senzing-debug:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
+        docker_pull_cached senzing/senzing-debug:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
     fi
 
+    READY_SINCE=$(date +%s)
     ${SENZING_SUDO} docker run \\
         --cap-add=ALL \\
         --detach \\
@@ -1548,25 +2756,7 @@ function up {
         senzing/senzing-debug:${CONTAINER_VERSION} \\
         >> ${CONTAINER_LOG} 2>&1
 
-    COUNTER=0
-    COUNTER_NOTICE=5
-    TIME_STRING=".."
-    CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    while [ "${CONTAINER_STATUS}" != "running" ]; do
-        COUNTER=$((${COUNTER}+1))
-        if [ "${COUNTER}" -eq "${COUNTER_NOTICE}" ]; then
-            echo -ne "\033[2K"
-            echo ""
-            echo "To see what is happening behind-the-scenes, view the log at"
-            echo "${CONTAINER_LOG}"
-            echo "and/or run 'docker logs ${CONTAINER_NAME}'"
-            echo ""
-        fi
-        TIME_STRING="${TIME_STRING}."
-        echo -ne "\033[2K${CONTAINER_NAME} status: ${CONTAINER_STATUS}${TIME_STRING}\r"
-        sleep 5
-        CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    done
+    wait_for_ready ${READY_SINCE} || return 1
 
     echo "${SENZING_HORIZONTAL_RULE}"
     echo "${SENZING_HORIZONTAL_RULE:0:2} ${CONTAINER_NAME} is running."
@@ -1600,6 +2790,7 @@ function usage {
 
 SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
 source ${SCRIPT_DIR}/docker-environment-vars.sh
+source ${SCRIPT_DIR}/docker-functions.sh
 
 CONTAINER_LOG="${SENZING_LOG_SENZING_DEBUG}"
 CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_SENZING_DEBUG}"
@@ -1622,6 +2813,23 @@ fi
 def file_senzing_down():
     """#!/usr/bin/env bash
 
+# --- Functions ---------------------------------------------------------------
+
+function down {
+    CONTAINER_NAME=$1
+    CONTAINER_LOG=$2
+    CONTAINER_MODE=$3
+    if [ "${CONTAINER_MODE}" == "force" ]; then
+        ${SENZING_SUDO} docker rm --force ${CONTAINER_NAME} >> ${CONTAINER_LOG} 2>&1
+    else
+        ${SENZING_SUDO} docker stop --time ${SENZING_DOWN_TIMEOUT} ${CONTAINER_NAME} >> ${CONTAINER_LOG} 2>&1
+        ${SENZING_SUDO} docker rm ${CONTAINER_NAME} >> ${CONTAINER_LOG} 2>&1
+    fi
+    echo "${SENZING_HORIZONTAL_RULE:0:2} Down: ${CONTAINER_NAME}"
+}
+
+# --- Main --------------------------------------------------------------------
+
 SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
 source ${SCRIPT_DIR}/docker-environment-vars.sh
 
@@ -1631,39 +2839,62 @@ echo "${SENZING_HORIZONTAL_RULE:0:2} For more information:"
 echo "${SENZING_HORIZONTAL_RULE:0:2} ${SENZING_REFERENCE_URL}#senzing-down"
 echo "${SENZING_HORIZONTAL_RULE:0:2}"
 
+# Format: "container name;log file;mode"
+#   mode "stop":  docker stop with a grace period of SENZING_DOWN_TIMEOUT seconds, then docker rm.
+#   mode "force": docker rm --force.  For services without state to flush.
+
 DOCKER_CONTAINERS=(
-    "${SENZING_DOCKER_CONTAINER_NAME_DB2_DRIVER_INSTALLER};${SENZING_LOG_DB2_DRIVER_INSTALLER}"
-    "${SENZING_DOCKER_CONTAINER_NAME_ENTITY_SEARCH_WEB_APP};${SENZING_LOG_WEBAPP}"
-    "${SENZING_DOCKER_CONTAINER_NAME_INIT_CONTAINER};${SENZING_LOG_INIT_CONTAINER}"
-    "${SENZING_DOCKER_CONTAINER_NAME_JUPYTER};${SENZING_LOG_JUPYTER}"
-    "${SENZING_DOCKER_CONTAINER_NAME_MSSQL_DRIVER_INSTALLER};${SENZING_LOG_MSSQL_DRIVER_INSTALLER}"
-    "${SENZING_DOCKER_CONTAINER_NAME_PHPPGADMIN};${SENZING_LOG_PHPPGADMIN}"
-    "${SENZING_DOCKER_CONTAINER_NAME_PORTAINER};${SENZING_LOG_PORTAINER}"
-    "${SENZING_DOCKER_CONTAINER_NAME_POSTGRESQL_INIT};${SENZING_LOG_POSTGRESQL_INIT}"
-    "${SENZING_DOCKER_CONTAINER_NAME_POSTGRES};${SENZING_LOG_POSTGRES}"
-    "${SENZING_DOCKER_CONTAINER_NAME_QUICKSTART};${SENZING_LOG_QUICKSTART}"
-    "${SENZING_DOCKER_CONTAINER_NAME_RABBITMQ};${SENZING_LOG_RABBITMQ}"
-    "${SENZING_DOCKER_CONTAINER_NAME_SENZING_API_SERVER};${SENZING_LOG_SENZING_API_SERVER}"
-    "${SENZING_DOCKER_CONTAINER_NAME_SENZING_DEBUG};${SENZING_LOG_SENZING_DEBUG}"
-    "${SENZING_DOCKER_CONTAINER_NAME_SQLITE_WEB};${SENZING_LOG_SQLITE_WEB}"
-    "${SENZING_DOCKER_CONTAINER_NAME_SSHD};${SENZING_LOG_SSHD}"
-    "${SENZING_DOCKER_CONTAINER_NAME_STREAM_LOADER};${SENZING_LOG_STREAM_LOADER}"
-    "${SENZING_DOCKER_CONTAINER_NAME_STREAM_PRODUCER};${SENZING_LOG_STREAM_PRODUCER}"
-    "${SENZING_DOCKER_CONTAINER_NAME_SWAGGERAPI_SWAGGER_UI};${SENZING_LOG_SWAGGERAPI_SWAGGER_UI}"
-    "${SENZING_DOCKER_CONTAINER_NAME_WEB_APP_DEMO};${SENZING_LOG_WEB_APP_DEMO}"
-    "${SENZING_DOCKER_CONTAINER_NAME_XTERM};${SENZING_LOG_XTERM}"
-    "${SENZING_DOCKER_CONTAINER_NAME_YUM};${SENZING_LOG_YUM}"
+    "${SENZING_DOCKER_CONTAINER_NAME_DB2_DRIVER_INSTALLER};${SENZING_LOG_DB2_DRIVER_INSTALLER};force"
+    "${SENZING_DOCKER_CONTAINER_NAME_ENTITY_SEARCH_WEB_APP};${SENZING_LOG_WEBAPP};force"
+    "${SENZING_DOCKER_CONTAINER_NAME_INIT_CONTAINER};${SENZING_LOG_INIT_CONTAINER};force"
+    "${SENZING_DOCKER_CONTAINER_NAME_JUPYTER};${SENZING_LOG_JUPYTER};stop"
+    "${SENZING_DOCKER_CONTAINER_NAME_MSSQL_DRIVER_INSTALLER};${SENZING_LOG_MSSQL_DRIVER_INSTALLER};force"
+    "${SENZING_DOCKER_CONTAINER_NAME_PGBOUNCER};${SENZING_LOG_PGBOUNCER};force"
+    "${SENZING_DOCKER_CONTAINER_NAME_PHPPGADMIN};${SENZING_LOG_PHPPGADMIN};force"
+    "${SENZING_DOCKER_CONTAINER_NAME_PORTAINER};${SENZING_LOG_PORTAINER};force"
+    "${SENZING_DOCKER_CONTAINER_NAME_POSTGRESQL_INIT};${SENZING_LOG_POSTGRESQL_INIT};force"
+    "${SENZING_DOCKER_CONTAINER_NAME_POSTGRES};${SENZING_LOG_POSTGRES};stop"
+    "${SENZING_DOCKER_CONTAINER_NAME_POSTGRES_LIBFEAT};${SENZING_LOG_POSTGRES_LIBFEAT};stop"
+    "${SENZING_DOCKER_CONTAINER_NAME_POSTGRES_RES};${SENZING_LOG_POSTGRES_RES};stop"
+    "${SENZING_DOCKER_CONTAINER_NAME_QUICKSTART};${SENZING_LOG_QUICKSTART};force"
+    "${SENZING_DOCKER_CONTAINER_NAME_RABBITMQ};${SENZING_LOG_RABBITMQ};stop"
+    "${SENZING_DOCKER_CONTAINER_NAME_REGISTRY_MIRROR};${SENZING_LOG_REGISTRY_MIRROR};stop"
+    "${SENZING_DOCKER_CONTAINER_NAME_SENZING_API_SERVER};${SENZING_LOG_SENZING_API_SERVER};force"
+    "${SENZING_DOCKER_CONTAINER_NAME_SENZING_DEBUG};${SENZING_LOG_SENZING_DEBUG};force"
+    "${SENZING_DOCKER_CONTAINER_NAME_SQLITE_WEB};${SENZING_LOG_SQLITE_WEB};force"
+    "${SENZING_DOCKER_CONTAINER_NAME_SSHD};${SENZING_LOG_SSHD};force"
+    "${SENZING_DOCKER_CONTAINER_NAME_STREAM_LOADER};${SENZING_LOG_STREAM_LOADER};stop"
+    "${SENZING_DOCKER_CONTAINER_NAME_STREAM_PRODUCER};${SENZING_LOG_STREAM_PRODUCER};force"
+    "${SENZING_DOCKER_CONTAINER_NAME_SWAGGERAPI_SWAGGER_UI};${SENZING_LOG_SWAGGERAPI_SWAGGER_UI};force"
+    "${SENZING_DOCKER_CONTAINER_NAME_WEB_APP_DEMO};${SENZING_LOG_WEB_APP_DEMO};force"
+    "${SENZING_DOCKER_CONTAINER_NAME_XTERM};${SENZING_LOG_XTERM};force"
+    "${SENZING_DOCKER_CONTAINER_NAME_YUM};${SENZING_LOG_YUM};force"
 )
 
+# Find the containers that exist with a single query.
+# Names are kept one per line, not in an associative array, so bash 3.2 (macOS) works.
+
+EXISTING_CONTAINERS="$(${SENZING_SUDO} docker ps --all --filter "name=^${SENZING_PROJECT_NAME}-" --format '{{.Names}}')"
+
+# Add stream-loader replicas beyond the first.  See "senzing-stream-loader.sh --replicas".
+
+for EXISTING_CONTAINER in ${EXISTING_CONTAINERS};
+do
+    if [[ ${EXISTING_CONTAINER} =~ ^${SENZING_DOCKER_CONTAINER_NAME_STREAM_LOADER}-([0-9]+)$ ]]; then
+        DOCKER_CONTAINERS+=("${EXISTING_CONTAINER};${SENZING_LOG_STREAM_LOADER%.log}-${BASH_REMATCH[1]}.log;stop")
+    fi
+done
+
+# Bring down existing containers in parallel.
+
 for DOCKER_CONTAINER in ${DOCKER_CONTAINERS[@]};
 do
     IFS=";" read -r -a CONTAINER_DATA <<< "${DOCKER_CONTAINER}"
-    CONTAINER_NAME="${CONTAINER_DATA[0]}                           "
-    CONTAINER_LOG="${CONTAINER_DATA[1]}"
-    ${SENZING_SUDO} docker stop ${CONTAINER_NAME} >> ${CONTAINER_LOG} 2>&1
-    ${SENZING_SUDO} docker rm   ${CONTAINER_NAME} >> ${CONTAINER_LOG} 2>&1
-    echo "${SENZING_HORIZONTAL_RULE:0:2} Down: ${CONTAINER_NAME}"
+    if printf '%s\n' "${EXISTING_CONTAINERS}" | grep -qxF "${CONTAINER_DATA[0]}"; then
+        down ${CONTAINER_DATA[0]} ${CONTAINER_DATA[1]} ${CONTAINER_DATA[2]} &
+    fi
 done
+wait
 
 echo "${SENZING_HORIZONTAL_RULE:0:2}"
 echo "${SENZING_HORIZONTAL_RULE:0:2} Done."
@@ -1675,6 +2906,137 @@ echo "${SENZING_HORIZONTAL_RULE}"
 def file_senzing_info():
     """#!/usr/bin/env bash
 
+# --- Functions ---------------------------------------------------------------
+
+function usage {{
+    echo "usage: senzing-info.sh [--json] [--watch]"
+}}
+
+function container_state {{
+
+    # State of container $1 in CONTAINER_STATES.  Empty if it does not exist.
+
+    printf "%s\\n" "${{CONTAINER_STATES}}" | awk -F ";" -v name="$1" '$1 == name {{ print $2 }}'
+}}
+
+function query_container_states {{
+
+    # One "docker ps" query for the state of every project container.
+    # "name;state" lines are kept in a string, not in an associative array, so bash 3.2 (macOS) works.
+
+    CONTAINER_STATES="$(${{SENZING_SUDO}} docker ps --all --filter "name=^${{SENZING_PROJECT_NAME}}-" --format '{{{{.Names}}}};{{{{.State}}}}' 2>/dev/null)"
+
+    # Report stream-loader replicas and stream-producer shards beyond the first after the first.
+
+    REPORT_CONTAINERS=()
+    for DOCKER_CONTAINER in ${{DOCKER_CONTAINERS[@]}};
+    do
+        REPORT_CONTAINERS+=("${{DOCKER_CONTAINER}}")
+        IFS=";" read -r -a CONTAINER_DATA <<< "${{DOCKER_CONTAINER}}"
+        if [ "${{CONTAINER_DATA[0]}}" == "${{SENZING_DOCKER_CONTAINER_NAME_STREAM_LOADER}}" ] || [ "${{CONTAINER_DATA[0]}}" == "${{SENZING_DOCKER_CONTAINER_NAME_STREAM_PRODUCER}}" ]; then
+            for CONTAINER_NAME in $(printf "%s\\n" "${{CONTAINER_STATES}}" | cut -d ";" -f 1 | grep "^${{CONTAINER_DATA[0]}}-[0-9]*$" | sort --version-sort);
+            do
+                REPORT_CONTAINERS+=("${{CONTAINER_NAME}};${{CONTAINER_DATA[1]}};${{CONTAINER_DATA[2]}}")
+            done
+        fi
+    done
+}}
+
+function query_queue_depths {{
+
+    # Messages waiting in each shard of SENZING_RABBITMQ_QUEUE.  Empty if RabbitMQ is not running.
+
+    QUEUE_DEPTHS=()
+    if [ "$(container_state ${{SENZING_DOCKER_CONTAINER_NAME_RABBITMQ}})" != "running" ]; then
+        return
+    fi
+    while read -r QUEUE_NAME QUEUE_MESSAGES; do
+        QUEUE_DEPTHS+=("${{QUEUE_NAME}};${{QUEUE_MESSAGES}}")
+    done < <(${{SENZING_SUDO}} docker exec ${{SENZING_DOCKER_CONTAINER_NAME_RABBITMQ}} rabbitmqctl list_queues --quiet --no-table-headers name messages 2>/dev/null \\
+        | grep -E "^${{SENZING_RABBITMQ_QUEUE}}(-[0-9]+)?\\s" \\
+        | sort --version-sort)
+}}
+
+function print_table {{
+    echo "${{SENZING_HORIZONTAL_RULE}}"
+    echo "${{SENZING_HORIZONTAL_RULE:0:2}} senzing-info.sh {environment_version} ({environment_updated})"
+    if [ -n "${{SENZING_VERSION_API}}" ]; then
+        echo "${{SENZING_HORIZONTAL_RULE:0:2}} senzing api: ${{SENZING_VERSION_API}}  data: ${{SENZING_VERSION_DATA}}"
+    fi
+    echo "${{SENZING_HORIZONTAL_RULE:0:2}}"
+
+    for DOCKER_CONTAINER in ${{REPORT_CONTAINERS[@]}};
+    do
+        IFS=";" read -r -a CONTAINER_DATA <<< "${{DOCKER_CONTAINER}}"
+        CONTAINER_NAME="${{CONTAINER_DATA[0]}}"
+        CONTAINER_PORT="${{CONTAINER_DATA[1]}}"
+        CONTAINER_VERSION="${{CONTAINER_DATA[2]}}"
+        if [ "$(container_state ${{CONTAINER_NAME}})" == "running" ]; then
+            printf "${{SENZING_HORIZONTAL_RULE:0:2}} %-${{COLUMN_WIDTH}}s   ${{GREEN}}up${{NC}} http://${{SENZING_DOCKER_HOST_IP_ADDR}}:${{CONTAINER_PORT}}   ${{CONTAINER_VERSION}}\\n" ${{CONTAINER_NAME}}
+        else
+            printf "${{SENZING_HORIZONTAL_RULE:0:2}} %-${{COLUMN_WIDTH}}s ${{RED}}down${{NC}} http://${{SENZING_DOCKER_HOST_IP_ADDR}}:${{CONTAINER_PORT}}   ${{CONTAINER_VERSION}}\\n" ${{CONTAINER_NAME}}
+        fi
+    done
+
+    if [ ${{#QUEUE_DEPTHS[@]}} -gt 0 ]; then
+        echo "${{SENZING_HORIZONTAL_RULE:0:2}}"
+        echo "${{SENZING_HORIZONTAL_RULE:0:2}} Queue depth:"
+        for QUEUE_DEPTH in ${{QUEUE_DEPTHS[@]}};
+        do
+            IFS=";" read -r QUEUE_NAME QUEUE_MESSAGES <<< "${{QUEUE_DEPTH}}"
+            printf "${{SENZING_HORIZONTAL_RULE:0:2}}   %-${{COLUMN_WIDTH}}s %12s\\n" ${{QUEUE_NAME}} ${{QUEUE_MESSAGES}}
+        done
+    fi
+
+    echo "${{SENZING_HORIZONTAL_RULE:0:2}}"
+    echo "${{SENZING_HORIZONTAL_RULE:0:2}} For more information:"
+    echo "${{SENZING_HORIZONTAL_RULE:0:2}} ${{SENZING_REFERENCE_URL}}#senzing-info"
+    echo "${{SENZING_HORIZONTAL_RULE}}"
+}}
+
+function print_json {{
+    SEPARATOR=""
+    printf '{{"project": "%s", "environment_version": "{environment_version}", "senzing_api": "%s", "senzing_data": "%s", "containers": [' \\
+        "${{SENZING_PROJECT_NAME}}" "${{SENZING_VERSION_API}}" "${{SENZING_VERSION_DATA}}"
+    for DOCKER_CONTAINER in ${{REPORT_CONTAINERS[@]}};
+    do
+        IFS=";" read -r -a CONTAINER_DATA <<< "${{DOCKER_CONTAINER}}"
+        CONTAINER_NAME="${{CONTAINER_DATA[0]}}"
+        CONTAINER_STATE="$(container_state ${{CONTAINER_NAME}})"
+        CONTAINER_STATE="${{CONTAINER_STATE:-absent}}"
+        CONTAINER_STATUS="down"
+        if [ "${{CONTAINER_STATE}}" == "running" ]; then
+            CONTAINER_STATUS="up"
+        fi
+        printf '%s{{"name": "%s", "status": "%s", "state": "%s", "url": "http://%s:%s", "image": "%s"}}' \\
+            "${{SEPARATOR}}" "${{CONTAINER_NAME}}" "${{CONTAINER_STATUS}}" "${{CONTAINER_STATE}}" \\
+            "${{SENZING_DOCKER_HOST_IP_ADDR}}" "${{CONTAINER_DATA[1]}}" "${{CONTAINER_DATA[2]}}"
+        SEPARATOR=", "
+    done
+    printf '], "queues": ['
+    SEPARATOR=""
+    for QUEUE_DEPTH in ${{QUEUE_DEPTHS[@]}};
+    do
+        IFS=";" read -r QUEUE_NAME QUEUE_MESSAGES <<< "${{QUEUE_DEPTH}}"
+        printf '%s{{"name": "%s", "messages": %s}}' "${{SEPARATOR}}" "${{QUEUE_NAME}}" "${{QUEUE_MESSAGES}}"
+        SEPARATOR=", "
+    done
+    printf ']}}\\n'
+}}
+
+function print_report {{
+    query_container_states
+    query_queue_depths
+    if [ "${{OUTPUT_JSON}}" == "true" ]; then
+        print_json
+    else
+        if [ "${{WATCH}}" == "true" ] && [ -t 1 ]; then
+            printf '\\033[H\\033[2J'
+        fi
+        print_table
+    fi
+}}
+
 # --- Main --------------------------------------------------------------------
 
 SCRIPT_DIR="$( cd "$( dirname "${{BASH_SOURCE[0]}}" )" >/dev/null 2>&1 && pwd )"
@@ -1682,6 +3044,24 @@ PROJECT_DIR="$(dirname ${{SCRIPT_DIR}})"
 
 source ${{SCRIPT_DIR}}/docker-environment-vars.sh
 
+OUTPUT_JSON="false"
+WATCH="false"
+for ARGUMENT in "$@";
+do
+    case ${{ARGUMENT}} in
+        --json)
+            OUTPUT_JSON="true"
+            ;;
+        --watch)
+            WATCH="true"
+            ;;
+        *)
+            usage
+            exit 1
+            ;;
+    esac
+done
+
 RED='\033[0;31m'
 GREEN='\033[0;32m'
 NC='\033[0m' # No Color
@@ -1693,9 +3073,12 @@ DOCKER_CONTAINERS=(
     "${{SENZING_DOCKER_CONTAINER_NAME_SENZING_API_SERVER}};${{SENZING_DOCKER_PORT_SENZING_API_SERVER}};senzing/senzing-api-server:${{SENZING_DOCKER_IMAGE_VERSION_SENZING_API_SERVER}}"
     "${{SENZING_DOCKER_CONTAINER_NAME_SENZING_DEBUG}};----;senzing/senzing-debug:${{SENZING_DOCKER_IMAGE_VERSION_SENZING_DEBUG}}"
     "${{SENZING_DOCKER_CONTAINER_NAME_JUPYTER}};${{SENZING_DOCKER_PORT_JUPYTER}};senzing/jupyter:${{SENZING_DOCKER_IMAGE_VERSION_JUPYTER}}"
+    "${{SENZING_DOCKER_CONTAINER_NAME_PGBOUNCER}};${{SENZING_DOCKER_PORT_PGBOUNCER}};bitnami/pgbouncer:${{SENZING_DOCKER_IMAGE_VERSION_PGBOUNCER}}"
     "${{SENZING_DOCKER_CONTAINER_NAME_PHPPGADMIN}};${{SENZING_DOCKER_PORT_PHPPGADMIN_HTTP}};senzing/phppgadmin:${{SENZING_DOCKER_IMAGE_VERSION_PHPPGADMIN}}"
     "${{SENZING_DOCKER_CONTAINER_NAME_PORTAINER}};${{SENZING_DOCKER_PORT_PORTAINER}};portainer/portainer:${{SENZING_DOCKER_IMAGE_VERSION_PORTAINER}}"
     "${{SENZING_DOCKER_CONTAINER_NAME_POSTGRES}};${{SENZING_DOCKER_PORT_POSTGRES}};postgres:${{SENZING_DOCKER_IMAGE_VERSION_POSTGRES}}"
+    "${{SENZING_DOCKER_CONTAINER_NAME_POSTGRES_LIBFEAT}};${{SENZING_DOCKER_PORT_POSTGRES_LIBFEAT}};postgres:${{SENZING_DOCKER_IMAGE_VERSION_POSTGRES}}"
+    "${{SENZING_DOCKER_CONTAINER_NAME_POSTGRES_RES}};${{SENZING_DOCKER_PORT_POSTGRES_RES}};postgres:${{SENZING_DOCKER_IMAGE_VERSION_POSTGRES}}"
     "${{SENZING_DOCKER_CONTAINER_NAME_QUICKSTART}};${{SENZING_DOCKER_PORT_ENTITY_SEARCH_WEB_APP}};senzing/web-app-demo:${{SENZING_DOCKER_IMAGE_VERSION_WEB_APP_DEMO}}"
     "${{SENZING_DOCKER_CONTAINER_NAME_SQLITE_WEB}};${{SENZING_DOCKER_PORT_SENZING_SQLITE_WEB}};coleifer/sqlite-web:${{SENZING_DOCKER_IMAGE_VERSION_SQLITE_WEB}}"
     "${{SENZING_DOCKER_CONTAINER_NAME_SSHD}};${{SENZING_DOCKER_PORT_SSHD}};senzing/sshd:${{SENZING_DOCKER_IMAGE_VERSION_SSHD}}"
@@ -1706,10 +3089,9 @@ DOCKER_CONTAINERS=(
     "${{SENZING_DOCKER_CONTAINER_NAME_WEB_APP_DEMO}};${{SENZING_DOCKER_PORT_ENTITY_SEARCH_WEB_APP}};senzing/web-app-demo:${{SENZING_DOCKER_IMAGE_VERSION_WEB_APP_DEMO}}"
     "${{SENZING_DOCKER_CONTAINER_NAME_XTERM}};${{SENZING_DOCKER_PORT_XTERM}};senzing/xterm:${{SENZING_DOCKER_IMAGE_VERSION_XTERM}}"
     "${{SENZING_DOCKER_CONTAINER_NAME_RABBITMQ}};${{SENZING_DOCKER_PORT_RABBITMQ_UI}};bitnami/rabbitmq:${{SENZING_DOCKER_IMAGE_VERSION_RABBITMQ}}"
+    "${{SENZING_DOCKER_CONTAINER_NAME_REGISTRY_MIRROR}};${{SENZING_DOCKER_PORT_REGISTRY_MIRROR}};registry:${{SENZING_DOCKER_IMAGE_VERSION_REGISTRY}}"
 )
 
-echo "${{SENZING_HORIZONTAL_RULE}}"
-echo "${{SENZING_HORIZONTAL_RULE:0:2}} senzing-info.sh {environment_version} ({environment_updated})"
 if [[ ( -n "$(command -v jq)" ) ]]; then
 
     G2_BUILD_VERSION_FILE=${{PROJECT_DIR}}/g2BuildVersion.json
@@ -1719,27 +3101,31 @@ if [[ ( -n "$(command -v jq)" ) ]]; then
 
     SENZING_VERSION_API=$(jq --raw-output ".VERSION" ${{G2_BUILD_VERSION_FILE}})
     SENZING_VERSION_DATA=$(jq --raw-output ".DATA_VERSION" ${{G2_BUILD_VERSION_FILE}})
-    echo "${{SENZING_HORIZONTAL_RULE:0:2}} senzing api: ${{SENZING_VERSION_API}}  data: ${{SENZING_VERSION_DATA}}"
 fi
-echo "${{SENZING_HORIZONTAL_RULE:0:2}}"
 
-for DOCKER_CONTAINER in ${{DOCKER_CONTAINERS[@]}};
-do
-    IFS=";" read -r -a CONTAINER_DATA <<< "${{DOCKER_CONTAINER}}"
-    CONTAINER_NAME="${{CONTAINER_DATA[0]}}                           "
-    CONTAINER_PORT="${{CONTAINER_DATA[1]}}"
-    CONTAINER_VERSION="${{CONTAINER_DATA[2]}}"
-    if [ "$( docker container inspect -f '{{{{.State.Status}}}}' ${{CONTAINER_NAME}} 2>/dev/null )" == "running" ]; then
-        printf "${{SENZING_HORIZONTAL_RULE:0:2}} %-${{COLUMN_WIDTH}}s   ${{GREEN}}up${{NC}} http://${{SENZING_DOCKER_HOST_IP_ADDR}}:${{CONTAINER_PORT}}   ${{CONTAINER_VERSION}}\\n" ${{CONTAINER_NAME}}
-    else
-        printf "${{SENZING_HORIZONTAL_RULE:0:2}} %-${{COLUMN_WIDTH}}s ${{RED}}down${{NC}} http://${{SENZING_DOCKER_HOST_IP_ADDR}}:${{CONTAINER_PORT}}   ${{CONTAINER_VERSION}}\\n" ${{CONTAINER_NAME}}
-    fi
-done
+print_report
+
+# In watch mode, refresh only when a project container changes state.
+
+if [ "${{WATCH}}" == "true" ]; then
+    while read -r EVENT_CONTAINER_NAME; do
+
+        # Coalesce bursts of events into a single refresh.
+        # The timeout is a whole second, because bash 3.2 (macOS) has no fractional timeouts.
 
-echo "${{SENZING_HORIZONTAL_RULE:0:2}}"
-echo "${{SENZING_HORIZONTAL_RULE:0:2}} For more information:"
-echo "${{SENZING_HORIZONTAL_RULE:0:2}} ${{SENZING_REFERENCE_URL}}#senzing-info"
-echo "${{SENZING_HORIZONTAL_RULE}}"
+        while read -r -t 1 EVENT_CONTAINER_NAME; do
+            :
+        done
+        print_report
+    done < <(${{SENZING_SUDO}} docker events \\
+        --filter "type=container" \\
+        --filter "event=create" \\
+        --filter "event=start" \\
+        --filter "event=die" \\
+        --filter "event=destroy" \\
+        --format '{{{{.Actor.Attributes.name}}}}' \\
+        | grep --line-buffered "^${{SENZING_PROJECT_NAME}}-")
+fi
 """
     return 0
 
@@ -1754,7 +3140,7 @@ function up {
 
     if [ "${CONTAINER_VERSION}" == "latest" ]
     then
-        ${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/init-container:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
+        docker_pull_cached senzing/init-container:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
     fi
 
     ${SENZING_SUDO} docker run \\
@@ -1776,7 +3162,8 @@ function up {
         ${SENZING_MSSQL_PARAMETERS} \\
         ${SENZING_PRIVILEGED_PARAMETER} \\
         senzing/init-container:${CONTAINER_VERSION} \\
-        >> ${CONTAINER_LOG} 2>&1
+        >> ${CONTAINER_LOG} 2>&1 \\
+        || { run_failure $?; return 1; }
 
     echo "${SENZING_HORIZONTAL_RULE}"
     echo "${SENZING_HORIZONTAL_RULE:0:2} ${CONTAINER_NAME} has completed."
@@ -1803,6 +3190,7 @@ function usage {
 
 SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
 source ${SCRIPT_DIR}/docker-environment-vars.sh
+source ${SCRIPT_DIR}/docker-functions.sh
 
 CONTAINER_LOG="${SENZING_LOG_INIT_CONTAINER}"
 CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_INIT_CONTAINER}"
@@ -1834,9 +3222,10 @@ function up {
 
     if [ "${CONTAINER_VERSION}" == "latest" ]
     then
-        ${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/jupyter:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
+        docker_pull_cached senzing/jupyter:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
     fi
 
+    READY_SINCE=$(date +%s)
     ${SENZING_SUDO} docker run \\
         --detach \\
         --env SENZING_SQL_CONNECTION=${SENZING_SQL_CONNECTION} \\
@@ -1860,25 +3249,7 @@ function up {
         senzing/jupyter:${CONTAINER_VERSION} start.sh jupyter notebook --NotebookApp.token='' \\
         >> ${CONTAINER_LOG} 2>&1
 
-    COUNTER=0
-    COUNTER_NOTICE=5
-    TIME_STRING=".."
-    CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    while [ "${CONTAINER_STATUS}" != "running" ]; do
-        COUNTER=$((${COUNTER}+1))
-        if [ "${COUNTER}" -eq "${COUNTER_NOTICE}" ]; then
-            echo -ne "\033[2K"
-            echo ""
-            echo "To see what is happening behind-the-scenes, view the log at"
-            echo "${CONTAINER_LOG}"
-            echo "and/or run 'docker logs ${CONTAINER_NAME}'"
-            echo ""
-        fi
-        TIME_STRING="${TIME_STRING}."
-        echo -ne "\033[2K${CONTAINER_NAME} status: ${CONTAINER_STATUS}${TIME_STRING}\r"
-        sleep 5
-        CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    done
+    wait_for_ready ${READY_SINCE} || return 1
 
     echo "${SENZING_HORIZONTAL_RULE}"
     echo "${SENZING_HORIZONTAL_RULE:0:2} ${CONTAINER_NAME} running on http://${SENZING_DOCKER_HOST_IP_ADDR}:${CONTAINER_PORT}"
@@ -1911,6 +3282,7 @@ function usage {
 
 SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
 source ${SCRIPT_DIR}/docker-environment-vars.sh
+source ${SCRIPT_DIR}/docker-functions.sh
 
 CONTAINER_LOG="${SENZING_LOG_JUPYTER}"
 CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_JUPYTER}"
@@ -1941,7 +3313,7 @@ function up {
 
     if [ "${CONTAINER_VERSION}" == "latest" ]
     then
-        ${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/apt:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
+        docker_pull_cached senzing/apt:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
     fi
 
     mv ${SENZING_OPT_MICROSOFT_DIR} ${SENZING_OPT_MICROSOFT_DIR}.$(date +%s) || true
@@ -1959,26 +3331,6 @@ function up {
         senzing/apt:${CONTAINER_VERSION} -y install msodbcsql17 \\
         >> ${CONTAINER_LOG} 2>&1
 
-    COUNTER=0
-    COUNTER_NOTICE=5
-    TIME_STRING=".."
-    CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    while [ "${CONTAINER_STATUS}" != "running" ]; do
-        COUNTER=$((${COUNTER}+1))
-        if [ "${COUNTER}" -eq "${COUNTER_NOTICE}" ]; then
-            echo -ne "\033[2K"
-            echo ""
-            echo "To see what is happening behind-the-scenes, view the log at"
-            echo "${CONTAINER_LOG}"
-            echo "and/or run 'docker logs ${CONTAINER_NAME}'"
-            echo ""
-        fi
-        TIME_STRING="${TIME_STRING}."
-        echo -ne "\033[2K${CONTAINER_NAME} status: ${CONTAINER_STATUS}${TIME_STRING}\r"
-        sleep 5
-        CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    done
-
     sudo -p "sudo access is required to change file ownership.  Please enter your password:  " docker info >> /dev/null 2>&1
     sudo chown -R $(id -u):$(id -g) ${SENZING_OPT_MICROSOFT_DIR}
 
@@ -2007,6 +3359,7 @@ function usage {
 
 SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
 source ${SCRIPT_DIR}/docker-environment-vars.sh
+source ${SCRIPT_DIR}/docker-functions.sh
 
 CONTAINER_LOG="${SENZING_LOG_MSSQL_DRIVER_INSTALLER}"
 CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_MSSQL_DRIVER_INSTALLER}"
@@ -2026,7 +3379,7 @@ fi
     return 0
 
 
-def file_senzing_phppgadmin():
+def file_senzing_pgbouncer():
     """#!/usr/bin/env bash
 
 # --- Functions ---------------------------------------------------------------
@@ -2036,19 +3389,104 @@ function up {
 
     if [ "${CONTAINER_VERSION}" == "latest" ]
     then
-        ${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/phppgadmin:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
+        docker_pull_cached bitnami/pgbouncer:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
     fi
 
+    READY_SINCE=$(date +%s)
     ${SENZING_SUDO} docker run \\
         --detach \\
-        --env PHP_PG_ADMIN_AJAX_REFRESH=3 \\
-        --env PHP_PG_ADMIN_AUTO_COMPLETE="default on" \\
-        --env PHP_PG_ADMIN_DEFAULT_LANG=auto \\
-        --env PHP_PG_ADMIN_EXTRA_LOGIN_SECURITY=false \\
-        --env PHP_PG_ADMIN_HELP_BASE=http://www.postgresql.org/docs/%s/interactive/ \\
-        --env PHP_PG_ADMIN_LEFT_WIDTH=200 \\
-        --env PHP_PG_ADMIN_MAX_CHARS=50 \\
-        --env PHP_PG_ADMIN_MAX_ROWS=30 \\
+        --env PGBOUNCER_DATABASE=${DATABASE_DATABASE} \\
+        --env PGBOUNCER_DEFAULT_POOL_SIZE=${SENZING_PGBOUNCER_DEFAULT_POOL_SIZE} \\
+        --env PGBOUNCER_MAX_CLIENT_CONN=${SENZING_PGBOUNCER_MAX_CLIENT_CONN} \\
+        --env PGBOUNCER_POOL_MODE=${SENZING_PGBOUNCER_POOL_MODE} \\
+        --env POSTGRESQL_DATABASE=${DATABASE_DATABASE} \\
+        --env POSTGRESQL_HOST=${DATABASE_HOST} \\
+        --env POSTGRESQL_PASSWORD=${DATABASE_PASSWORD} \\
+        --env POSTGRESQL_PORT=${DATABASE_PORT} \\
+        --env POSTGRESQL_USERNAME=${DATABASE_USERNAME} \\
+        --name ${CONTAINER_NAME} \\
+        --publish ${CONTAINER_PORT}:6432 \\
+        --restart always \\
+        ${SENZING_DOCKER_RUN_PARAMETERS_GLOBAL} \\
+        ${SENZING_DOCKER_RUN_PARAMETERS_PGBOUNCER} \\
+        ${SENZING_NETWORK_PARAMETER} \\
+        ${SENZING_PRIVILEGED_PARAMETER} \\
+        bitnami/pgbouncer:${CONTAINER_VERSION} \\
+        >> ${CONTAINER_LOG} 2>&1
+
+    wait_for_ready ${READY_SINCE} probe_container_tcp 6432 || return 1
+
+    echo "${SENZING_HORIZONTAL_RULE}"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} ${CONTAINER_NAME} listening on ${SENZING_DOCKER_HOST_IP_ADDR}:${CONTAINER_PORT}"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} Pooling ${DATABASE_HOST}:${DATABASE_PORT}/${DATABASE_DATABASE} (Pool mode: ${SENZING_PGBOUNCER_POOL_MODE})"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} Logs:"
+    echo "${SENZING_HORIZONTAL_RULE:0:2}   ${CONTAINER_LOG}"
+    echo "${SENZING_HORIZONTAL_RULE:0:2}   and/or run 'docker logs ${CONTAINER_NAME}'"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} For more information:"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} ${SENZING_REFERENCE_URL}#senzing-pgbouncer"
+    echo "${SENZING_HORIZONTAL_RULE}"
+}
+
+function down {
+    ${SENZING_SUDO} docker stop ${CONTAINER_NAME} >> ${CONTAINER_LOG} 2>&1
+    ${SENZING_SUDO} docker rm   ${CONTAINER_NAME} >> ${CONTAINER_LOG} 2>&1
+}
+
+function usage {
+    echo "usage: $0 [up | down | restart]"
+    echo "For more information:"
+    echo "${SENZING_REFERENCE_URL}#senzing-pgbouncer"
+}
+
+# --- Main --------------------------------------------------------------------
+
+SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
+source ${SCRIPT_DIR}/docker-environment-vars.sh
+source ${SCRIPT_DIR}/docker-functions.sh
+
+CONTAINER_LOG="${SENZING_LOG_PGBOUNCER}"
+CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_PGBOUNCER}"
+CONTAINER_PORT="${SENZING_DOCKER_PORT_PGBOUNCER}"
+CONTAINER_VERSION="${SENZING_DOCKER_IMAGE_VERSION_PGBOUNCER}"
+
+if [ "$1" == "up" ]; then
+    up
+elif [ "$1" == "down" ]; then
+    down
+elif [ "$1" == "restart" ]; then
+    down
+    up
+else
+    usage
+fi
+"""
+    return 0
+
+
+def file_senzing_phppgadmin():
+    """#!/usr/bin/env bash
+
+# --- Functions ---------------------------------------------------------------
+
+function up {
+    echo -ne "\033[2K${CONTAINER_NAME} status: starting...\r"
+
+    if [ "${CONTAINER_VERSION}" == "latest" ]
+    then
+        docker_pull_cached senzing/phppgadmin:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
+    fi
+
+    READY_SINCE=$(date +%s)
+    ${SENZING_SUDO} docker run \\
+        --detach \\
+        --env PHP_PG_ADMIN_AJAX_REFRESH=3 \\
+        --env PHP_PG_ADMIN_AUTO_COMPLETE="default on" \\
+        --env PHP_PG_ADMIN_DEFAULT_LANG=auto \\
+        --env PHP_PG_ADMIN_EXTRA_LOGIN_SECURITY=false \\
+        --env PHP_PG_ADMIN_HELP_BASE=http://www.postgresql.org/docs/%s/interactive/ \\
+        --env PHP_PG_ADMIN_LEFT_WIDTH=200 \\
+        --env PHP_PG_ADMIN_MAX_CHARS=50 \\
+        --env PHP_PG_ADMIN_MAX_ROWS=30 \\
         --env PHP_PG_ADMIN_MIN_PASSWORD_LENGTH=1 \\
         --env PHP_PG_ADMIN_OWNED_ONLY=false \\
         --env PHP_PG_ADMIN_SERVER_DEFAULT_DB=template1 \\
@@ -2077,25 +3515,7 @@ function up {
         senzing/phppgadmin:${CONTAINER_VERSION} \\
         >> ${CONTAINER_LOG} 2>&1
 
-    COUNTER=0
-    COUNTER_NOTICE=5
-    TIME_STRING=".."
-    CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    while [ "${CONTAINER_STATUS}" != "running" ]; do
-        COUNTER=$((${COUNTER}+1))
-        if [ "${COUNTER}" -eq "${COUNTER_NOTICE}" ]; then
-            echo -ne "\033[2K"
-            echo ""
-            echo "To see what is happening behind-the-scenes, view the log at"
-            echo "${CONTAINER_LOG}"
-            echo "and/or run 'docker logs ${CONTAINER_NAME}'"
-            echo ""
-        fi
-        TIME_STRING="${TIME_STRING}."
-        echo -ne "\033[2K${CONTAINER_NAME} status: ${CONTAINER_STATUS}${TIME_STRING}\r"
-        sleep 5
-        CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    done
+    wait_for_ready ${READY_SINCE} || return 1
 
     echo "${SENZING_HORIZONTAL_RULE}"
     echo "${SENZING_HORIZONTAL_RULE:0:2} ${CONTAINER_NAME} running on http://${SENZING_DOCKER_HOST_IP_ADDR}:${CONTAINER_PORT}"
@@ -2122,6 +3542,7 @@ function usage {
 
 SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
 source ${SCRIPT_DIR}/docker-environment-vars.sh
+source ${SCRIPT_DIR}/docker-functions.sh
 
 CONTAINER_LOG="${SENZING_LOG_PHPPGADMIN}"
 CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_PHPPGADMIN}"
@@ -2152,22 +3573,28 @@ function up {
 
     if [ "${CONTAINER_VERSION}" == "latest" ]
     then
-        ${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/postgresql-client:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
+        docker_pull_cached senzing/postgresql-client:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
     fi
 
-    ${SENZING_SUDO} docker run \\
-        --env SENZING_DATABASE_URL=${SENZING_DATABASE_URL} \\
-        --env SENZING_SQL_FILE="/opt/senzing/g2/resources/schema/g2core-schema-postgresql-create.sql" \\
-        --name ${CONTAINER_NAME} \\
-        --rm \\
-        --user $(id -u):$(id -g) \\
-        --volume ${SENZING_G2_DIR}:/opt/senzing/g2 \\
-        ${SENZING_DOCKER_RUN_PARAMETERS_GLOBAL} \\
-        ${SENZING_DOCKER_RUN_PARAMETERS_POSTGRESQL_CLIENT} \\
-        ${SENZING_NETWORK_PARAMETER} \\
-        ${SENZING_PRIVILEGED_PARAMETER} \\
-        senzing/postgresql-client:${CONTAINER_VERSION} \\
-        >> ${CONTAINER_LOG} 2>&1
+    # Create the schema in the core database and, if clustered, in the res and libfeat databases.
+
+    for DATABASE_URL in ${SENZING_DATABASE_URL_DIRECT} ${SENZING_DATABASE_URL_RES} ${SENZING_DATABASE_URL_LIBFEAT};
+    do
+        ${SENZING_SUDO} docker run \\
+            --env SENZING_DATABASE_URL=${DATABASE_URL} \\
+            --env SENZING_SQL_FILE="/opt/senzing/g2/resources/schema/g2core-schema-postgresql-create.sql" \\
+            --name ${CONTAINER_NAME} \\
+            --rm \\
+            --user $(id -u):$(id -g) \\
+            --volume ${SENZING_G2_DIR}:/opt/senzing/g2 \\
+            ${SENZING_DOCKER_RUN_PARAMETERS_GLOBAL} \\
+            ${SENZING_DOCKER_RUN_PARAMETERS_POSTGRESQL_CLIENT} \\
+            ${SENZING_NETWORK_PARAMETER} \\
+            ${SENZING_PRIVILEGED_PARAMETER} \\
+            senzing/postgresql-client:${CONTAINER_VERSION} \\
+            >> ${CONTAINER_LOG} 2>&1 \\
+            || { run_failure $?; return 1; }
+    done
 
     echo "${SENZING_HORIZONTAL_RULE}"
     echo "${SENZING_HORIZONTAL_RULE:0:2} ${CONTAINER_NAME} has completed."
@@ -2194,6 +3621,7 @@ function usage {
 
 SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
 source ${SCRIPT_DIR}/docker-environment-vars.sh
+source ${SCRIPT_DIR}/docker-functions.sh
 
 CONTAINER_LOG="${SENZING_LOG_POSTGRESQL_INIT}"
 CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_POSTGRESQL_INIT}"
@@ -2223,9 +3651,10 @@ function up {
 
     if [ "${CONTAINER_VERSION}" == "latest" ]
     then
-        ${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/web-app-demo:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
+        docker_pull_cached senzing/web-app-demo:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
     fi
 
+    READY_SINCE=$(date +%s)
     ${SENZING_SUDO} docker run \\
         --detach \\
         --env SENZING_DATABASE_URL=${SENZING_DATABASE_URL} \\
@@ -2248,25 +3677,7 @@ function up {
         senzing/web-app-demo:${CONTAINER_VERSION} \\
         >> ${CONTAINER_LOG} 2>&1
 
-    COUNTER=0
-    COUNTER_NOTICE=5
-    TIME_STRING=".."
-    CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    while [ "${CONTAINER_STATUS}" != "running" ]; do
-        COUNTER=$((${COUNTER}+1))
-        if [ "${COUNTER}" -eq "${COUNTER_NOTICE}" ]; then
-            echo -ne "\033[2K"
-            echo ""
-            echo "To see what is happening behind-the-scenes, view the log at"
-            echo "${CONTAINER_LOG}"
-            echo "and/or run 'docker logs ${CONTAINER_NAME}'"
-            echo ""
-        fi
-        TIME_STRING="${TIME_STRING}."
-        echo -ne "\033[2K${CONTAINER_NAME} status: ${CONTAINER_STATUS}${TIME_STRING}\r"
-        sleep 5
-        CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    done
+    wait_for_ready ${READY_SINCE} probe_http http://${SENZING_DOCKER_HOST_IP_ADDR}:${SENZING_DOCKER_PORT_SENZING_API_SERVER}/heartbeat || return 1
 
     echo "${SENZING_HORIZONTAL_RULE}"
     echo "${SENZING_HORIZONTAL_RULE:0:2} ${CONTAINER_NAME} running on http://${SENZING_DOCKER_HOST_IP_ADDR}:${CONTAINER_PORT}"
@@ -2298,6 +3709,7 @@ function usage {
 
 SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
 source ${SCRIPT_DIR}/docker-environment-vars.sh
+source ${SCRIPT_DIR}/docker-functions.sh
 
 CONTAINER_LOG="${SENZING_LOG_QUICKSTART}"
 CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_QUICKSTART}"
@@ -2331,12 +3743,14 @@ function up {
 
     if [ "${CONTAINER_VERSION}" == "latest" ]
     then
-        ${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/bitnami/rabbitmq:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
+        docker_pull_cached bitnami/rabbitmq:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
     fi
 
+    READY_SINCE=$(date +%s)
     ${SENZING_SUDO} docker run \\
         --detach \\
         --env RABBITMQ_PASSWORD=${SENZING_RABBITMQ_PASSWORD} \\
+        --env RABBITMQ_SERVER_ADDITIONAL_ERL_ARGS="${SENZING_RABBITMQ_ERL_ARGS}" \\
         --env RABBITMQ_USERNAME=${SENZING_RABBITMQ_USERNAME} \\
         --interactive \\
         --name ${CONTAINER_NAME} \\
@@ -2352,30 +3766,13 @@ function up {
         bitnami/rabbitmq:${CONTAINER_VERSION} \\
         >> ${CONTAINER_LOG} 2>&1
 
-    COUNTER=0
-    COUNTER_NOTICE=5
-    TIME_STRING=".."
-    CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    while [ "${CONTAINER_STATUS}" != "running" ]; do
-        COUNTER=$((${COUNTER}+1))
-        if [ "${COUNTER}" -eq "${COUNTER_NOTICE}" ]; then
-            echo -ne "\033[2K"
-            echo ""
-            echo "To see what is happening behind-the-scenes, view the log at"
-            echo "${CONTAINER_LOG}"
-            echo "and/or run 'docker logs ${CONTAINER_NAME}'"
-            echo ""
-        fi
-        TIME_STRING="${TIME_STRING}."
-        echo -ne "\033[2K${CONTAINER_NAME} status: ${CONTAINER_STATUS}${TIME_STRING}\r"
-        sleep 5
-        CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    done
-    sleep 10
+    wait_for_ready ${READY_SINCE} probe_container_tcp 5672 || return 1
+    configure_queue
 
     echo "${SENZING_HORIZONTAL_RULE}"
     echo "${SENZING_HORIZONTAL_RULE:0:2} ${CONTAINER_NAME} running on http://${SENZING_DOCKER_HOST_IP_ADDR}:${CONTAINER_PORT}"
     echo "${SENZING_HORIZONTAL_RULE:0:2} Username: ${SENZING_RABBITMQ_USERNAME} Password: ${SENZING_RABBITMQ_PASSWORD}"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} Queue: ${SENZING_RABBITMQ_QUEUE} (Type: ${SENZING_RABBITMQ_QUEUE_TYPE}  Shards: ${SENZING_RABBITMQ_SHARDS})"
     echo "${SENZING_HORIZONTAL_RULE:0:2} Mount information: (Format: in container > on host)"
     echo "${SENZING_HORIZONTAL_RULE:0:2}   /bitnami  > ${RABBITMQ_DIR}"
     echo "${SENZING_HORIZONTAL_RULE:0:2} Logs:"
@@ -2386,6 +3783,30 @@ function up {
     echo "${SENZING_HORIZONTAL_RULE}"
 }
 
+# Lazy queues keep messages on disk rather than in memory, so long queues do not raise the memory alarm.
+# Quorum queues are declared here, one per shard.  Producers and loaders then use them as they are
+# (SENZING_RABBITMQ_USE_EXISTING_ENTITIES=True) rather than re-declaring them without "x-queue-type".
+
+function configure_queue {
+    if [ "${SENZING_RABBITMQ_QUEUE_TYPE}" == "lazy" ]; then
+        ${SENZING_SUDO} docker exec ${CONTAINER_NAME} rabbitmqctl set_policy senzing-lazy "^${SENZING_RABBITMQ_QUEUE}" '{"queue-mode":"lazy"}' --apply-to queues >> ${CONTAINER_LOG} 2>&1
+    elif [ "${SENZING_RABBITMQ_QUEUE_TYPE}" == "quorum" ]; then
+        for SHARD in $(seq 1 ${SENZING_RABBITMQ_SHARDS});
+        do
+            wait_for_probe declare_queue $(rabbitmq_shard_queue ${SHARD}) '{"durable":true,"arguments":{"x-queue-type":"quorum"}}'
+        done
+    fi
+}
+
+function declare_queue {
+    QUEUE_URL="http://${SENZING_DOCKER_HOST_IP_ADDR}:${CONTAINER_PORT}/api/queues/%2F/$1"
+    if [ -n "$(command -v curl)" ]; then
+        curl --fail --silent --user ${SENZING_RABBITMQ_USERNAME}:${SENZING_RABBITMQ_PASSWORD} --request PUT --header "content-type: application/json" --data "$2" ${QUEUE_URL}
+    else
+        wget --quiet --output-document=/dev/null --user=${SENZING_RABBITMQ_USERNAME} --password=${SENZING_RABBITMQ_PASSWORD} --method=PUT --header="content-type: application/json" --body-data="$2" ${QUEUE_URL}
+    fi
+}
+
 function down {
     ${SENZING_SUDO} docker stop ${CONTAINER_NAME} >> ${CONTAINER_LOG} 2>&1
     ${SENZING_SUDO} docker rm   ${CONTAINER_NAME} >> ${CONTAINER_LOG} 2>&1
@@ -2401,6 +3822,7 @@ function usage {
 
 SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
 source ${SCRIPT_DIR}/docker-environment-vars.sh
+source ${SCRIPT_DIR}/docker-functions.sh
 
 CONTAINER_LOG="${SENZING_LOG_RABBITMQ}"
 CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_RABBITMQ}"
@@ -2421,6 +3843,108 @@ fi
     return 0
 
 
+def file_senzing_registry_mirror():
+    """#!/usr/bin/env bash
+
+# --- Functions ---------------------------------------------------------------
+
+function up {
+    echo -ne "\033[2K${CONTAINER_NAME} status: starting...\r"
+
+    mkdir -p ${SENZING_REGISTRY_MIRROR_DIR}
+
+    # The mirror's own image always comes from docker.io.
+
+    if [ "${CONTAINER_VERSION}" == "latest" ]
+    then
+        ${SENZING_SUDO} docker pull registry:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
+    fi
+
+    READY_SINCE=$(date +%s)
+    ${SENZING_SUDO} docker run \\
+        --detach \\
+        --env REGISTRY_PROXY_REMOTEURL=${SENZING_DOCKER_REGISTRY_MIRROR_REMOTE_URL} \\
+        --name ${CONTAINER_NAME} \\
+        --publish ${CONTAINER_PORT}:5000 \\
+        --restart always \\
+        --volume ${SENZING_REGISTRY_MIRROR_DIR}:/var/lib/registry \\
+        ${SENZING_DOCKER_RUN_PARAMETERS_GLOBAL} \\
+        ${SENZING_DOCKER_RUN_PARAMETERS_REGISTRY_MIRROR} \\
+        ${SENZING_NETWORK_PARAMETER} \\
+        registry:${CONTAINER_VERSION} \\
+        >> ${CONTAINER_LOG} 2>&1
+
+    wait_for_ready ${READY_SINCE} probe_http http://localhost:${CONTAINER_PORT}/v2/ || return 1
+
+    prewarm
+
+    echo "${SENZING_HORIZONTAL_RULE}"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} ${CONTAINER_NAME} caching ${SENZING_DOCKER_REGISTRY_MIRROR_REMOTE_URL} on localhost:${CONTAINER_PORT}"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} Pre-warmed: $((${#DOCKER_IMAGE_NAMES_ALL[@]} - ${PREWARM_FAILURES})) of ${#DOCKER_IMAGE_NAMES_ALL[@]} images"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} Mount information: (Format: in container > on host)"
+    echo "${SENZING_HORIZONTAL_RULE:0:2}   /var/lib/registry > ${SENZING_REGISTRY_MIRROR_DIR}"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} Logs:"
+    echo "${SENZING_HORIZONTAL_RULE:0:2}   ${CONTAINER_LOG}"
+    echo "${SENZING_HORIZONTAL_RULE:0:2}   and/or run 'docker logs ${CONTAINER_NAME}'"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} For more information:"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} ${SENZING_REFERENCE_URL}#senzing-registry-mirror"
+    echo "${SENZING_HORIZONTAL_RULE}"
+}
+
+# Pull every image in DOCKER_IMAGE_NAMES_ALL through the mirror so later pulls are served from its cache.
+# Failures are counted in PREWARM_FAILURES, but do not stop the mirror.
+
+function prewarm {
+    FAILED_FILE=$(mktemp)
+    for DOCKER_IMAGE_NAME in ${DOCKER_IMAGE_NAMES_ALL[@]};
+    do
+        wait_for_job_slot ${SENZING_DOCKER_PULL_PARALLELISM}
+        docker_pull ${DOCKER_IMAGE_NAME} >> ${CONTAINER_LOG} 2>&1 || echo ${DOCKER_IMAGE_NAME} >> ${FAILED_FILE} &
+    done
+    wait
+    PREWARM_FAILURES=$(wc -l < ${FAILED_FILE})
+    rm -f ${FAILED_FILE}
+}
+
+function down {
+    ${SENZING_SUDO} docker stop ${CONTAINER_NAME} >> ${CONTAINER_LOG} 2>&1
+    ${SENZING_SUDO} docker rm   ${CONTAINER_NAME} >> ${CONTAINER_LOG} 2>&1
+}
+
+function usage {
+    echo "usage: $0 [up | down | restart | prewarm]"
+    echo "For more information:"
+    echo "${SENZING_REFERENCE_URL}#senzing-registry-mirror"
+}
+
+# --- Main --------------------------------------------------------------------
+
+SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
+source ${SCRIPT_DIR}/docker-environment-vars.sh
+source ${SCRIPT_DIR}/docker-functions.sh
+
+CONTAINER_LOG="${SENZING_LOG_REGISTRY_MIRROR}"
+CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_REGISTRY_MIRROR}"
+CONTAINER_PORT="${SENZING_DOCKER_PORT_REGISTRY_MIRROR}"
+CONTAINER_VERSION="${SENZING_DOCKER_IMAGE_VERSION_REGISTRY}"
+
+if [ "$1" == "up" ]; then
+    up
+elif [ "$1" == "down" ]; then
+    down
+elif [ "$1" == "restart" ]; then
+    down
+    up
+elif [ "$1" == "prewarm" ]; then
+    prewarm
+    echo "Pre-warmed: $((${#DOCKER_IMAGE_NAMES_ALL[@]} - ${PREWARM_FAILURES})) of ${#DOCKER_IMAGE_NAMES_ALL[@]} images"
+else
+    usage
+fi
+"""
+    return 0
+
+
 def file_senzing_sqlite_web():
     """#!/usr/bin/env bash
 
@@ -2431,9 +3955,10 @@ function up {
 
     if [ "${CONTAINER_VERSION}" == "latest" ]
     then
-        ${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/coleifer/sqlite-web:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
+        docker_pull_cached coleifer/sqlite-web:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
     fi
 
+    READY_SINCE=$(date +%s)
     ${SENZING_SUDO} docker run \\
         --detach \\
         --env SQLITE_DATABASE=${DATABASE_DATABASE} \\
@@ -2451,25 +3976,7 @@ function up {
         coleifer/sqlite-web:${CONTAINER_VERSION} \\
         >> ${CONTAINER_LOG} 2>&1
 
-    COUNTER=0
-    COUNTER_NOTICE=5
-    TIME_STRING=".."
-    CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    while [ "${CONTAINER_STATUS}" != "running" ]; do
-        COUNTER=$((${COUNTER}+1))
-        if [ "${COUNTER}" -eq "${COUNTER_NOTICE}" ]; then
-            echo -ne "\033[2K"
-            echo ""
-            echo "To see what is happening behind-the-scenes, view the log at"
-            echo "${CONTAINER_LOG}"
-            echo "and/or run 'docker logs ${CONTAINER_NAME}'"
-            echo ""
-        fi
-        TIME_STRING="${TIME_STRING}."
-        echo -ne "\033[2K${CONTAINER_NAME} status: ${CONTAINER_STATUS}${TIME_STRING}\r"
-        sleep 5
-        CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    done
+    wait_for_ready ${READY_SINCE} || return 1
 
     echo "${SENZING_HORIZONTAL_RULE}"
     echo "${SENZING_HORIZONTAL_RULE:0:2} ${CONTAINER_NAME} running on http://${SENZING_DOCKER_HOST_IP_ADDR}:${CONTAINER_PORT}"
@@ -2498,6 +4005,7 @@ function usage {
 
 SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
 source ${SCRIPT_DIR}/docker-environment-vars.sh
+source ${SCRIPT_DIR}/docker-functions.sh
 
 CONTAINER_LOG="${SENZING_LOG_SQLITE_WEB}"
 CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_SQLITE_WEB}"
@@ -2528,9 +4036,10 @@ function up {
 
     if [ "${CONTAINER_VERSION}" == "latest" ]
     then
-        ${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/sshd:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
+        docker_pull_cached senzing/sshd:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
     fi
 
+    READY_SINCE=$(date +%s)
     ${SENZING_SUDO} docker run \\
         --detach \\
         --env ROOT_PASSWORD=${SENZING_SSHD_PASSWORD} \\
@@ -2554,25 +4063,7 @@ function up {
         senzing/sshd:${CONTAINER_VERSION} \\
         >> ${CONTAINER_LOG} 2>&1
 
-    COUNTER=0
-    COUNTER_NOTICE=5
-    TIME_STRING=".."
-    CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    while [ "${CONTAINER_STATUS}" != "running" ]; do
-        COUNTER=$((${COUNTER}+1))
-        if [ "${COUNTER}" -eq "${COUNTER_NOTICE}" ]; then
-            echo -ne "\033[2K"
-            echo ""
-            echo "To see what is happening behind-the-scenes, view the log at"
-            echo "${CONTAINER_LOG}"
-            echo "and/or run 'docker logs ${CONTAINER_NAME}'"
-            echo ""
-        fi
-        TIME_STRING="${TIME_STRING}."
-        echo -ne "\033[2K${CONTAINER_NAME} status: ${CONTAINER_STATUS}${TIME_STRING}\r"
-        sleep 5
-        CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    done
+    wait_for_ready ${READY_SINCE} || return 1
 
     echo "${SENZING_HORIZONTAL_RULE}"
     echo "${SENZING_HORIZONTAL_RULE:0:2} ${CONTAINER_NAME} is running."
@@ -2607,6 +4098,7 @@ function usage {
 
 SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
 source ${SCRIPT_DIR}/docker-environment-vars.sh
+source ${SCRIPT_DIR}/docker-functions.sh
 
 CONTAINER_LOG="${SENZING_LOG_SSHD}"
 CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_SSHD}"
@@ -2632,27 +4124,83 @@ def file_senzing_stream_loader():
 
 # --- Functions ---------------------------------------------------------------
 
+# Replica 1 keeps the unsuffixed container name and log file.
+# Replica N > 1 is named "...-stream-loader-N" and logs to "...-stream-loader-N.log".
+# Replicas are bound to shards round-robin: replica N consumes shard ((N - 1) % SENZING_RABBITMQ_SHARDS) + 1.
+
+function select_replica {
+    if [ $1 -eq 1 ]; then
+        CONTAINER_LOG="${SENZING_LOG_STREAM_LOADER}"
+        CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_STREAM_LOADER}"
+    else
+        CONTAINER_LOG="${SENZING_LOG_STREAM_LOADER%.log}-$1.log"
+        CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_STREAM_LOADER}-$1"
+    fi
+    CONTAINER_QUEUE=$(rabbitmq_shard_queue $(( ($1 - 1) % ${SENZING_RABBITMQ_SHARDS} + 1 )))
+}
+
 function up {
-    echo -ne "\033[2K${CONTAINER_NAME} status: starting...\r"
+    select_replica 1
 
     if [ "${CONTAINER_VERSION}" == "latest" ]
     then
-        ${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/stream-loader:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
+        echo -ne "\033[2K${CONTAINER_NAME} status: pulling...\r"
+        docker_pull_cached senzing/stream-loader:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
     fi
 
+    # Start all replicas, then wait for each.
+
+    READY_SINCE=$(date +%s)
+    for REPLICA in $(seq 1 ${SENZING_STREAM_LOADER_REPLICAS});
+    do
+        select_replica ${REPLICA}
+        echo -ne "\033[2K${CONTAINER_NAME} status: starting...\r"
+        up_replica
+    done
+
+    for REPLICA in $(seq 1 ${SENZING_STREAM_LOADER_REPLICAS});
+    do
+        select_replica ${REPLICA}
+        wait_for_ready ${READY_SINCE} || return 1
+    done
+
+    echo "${SENZING_HORIZONTAL_RULE}"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} ${SENZING_DOCKER_CONTAINER_NAME_STREAM_LOADER} is running. (Replicas: ${SENZING_STREAM_LOADER_REPLICAS}  Shards: ${SENZING_RABBITMQ_SHARDS})"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} Mount information: (Format: in container > on host)"
+    echo "${SENZING_HORIZONTAL_RULE:0:2}   /etc/opt/senzing  > ${SENZING_ETC_DIR}"
+    echo "${SENZING_HORIZONTAL_RULE:0:2}   /opt/senzing/data > ${SENZING_DATA_VERSION_DIR}"
+    echo "${SENZING_HORIZONTAL_RULE:0:2}   /opt/senzing/g2   > ${SENZING_G2_DIR}"
+    echo "${SENZING_HORIZONTAL_RULE:0:2}   /var/opt/senzing  > ${SENZING_VAR_DIR}"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} Logs:"
+    for REPLICA in $(seq 1 ${SENZING_STREAM_LOADER_REPLICAS});
+    do
+        select_replica ${REPLICA}
+        echo "${SENZING_HORIZONTAL_RULE:0:2}   ${CONTAINER_LOG}"
+    done
+    echo "${SENZING_HORIZONTAL_RULE:0:2}   and/or run 'docker logs ${SENZING_DOCKER_CONTAINER_NAME_STREAM_LOADER}'"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} For more information:"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} ${SENZING_REFERENCE_URL}#senzing-stream-loader"
+    echo "${SENZING_HORIZONTAL_RULE}"
+}
+
+function up_replica {
     ${SENZING_SUDO} docker run \\
         --detach \\
         --env LC_CTYPE="en_us.utf8" \\
         --env SENZING_DATABASE_URL=${SENZING_DATABASE_URL} \\
-        --env SENZING_DATA_SOURCE=TEST \\
-        --env SENZING_ENTITY_TYPE=GENERIC \\
+        --env SENZING_DATA_SOURCE=${SENZING_STREAM_LOADER_DATA_SOURCE} \\
+        --env SENZING_ENTITY_TYPE=${SENZING_STREAM_LOADER_ENTITY_TYPE} \\
+        --env SENZING_MONITORING_PERIOD_IN_SECONDS=${SENZING_STREAM_LOADER_MONITORING_PERIOD_IN_SECONDS} \\
         --env SENZING_RABBITMQ_HOST=${SENZING_DOCKER_HOST_IP_ADDR} \\
         --env SENZING_RABBITMQ_PASSWORD=${SENZING_RABBITMQ_PASSWORD} \\
         --env SENZING_RABBITMQ_PORT=${SENZING_DOCKER_PORT_RABBITMQ} \\
-        --env SENZING_RABBITMQ_QUEUE=${SENZING_RABBITMQ_QUEUE} \\
+        --env SENZING_RABBITMQ_PREFETCH_COUNT=${SENZING_STREAM_LOADER_PREFETCH_COUNT} \\
+        --env SENZING_RABBITMQ_QUEUE=${CONTAINER_QUEUE} \\
+        --env SENZING_RABBITMQ_RECONNECT_DELAY_IN_SECONDS=${SENZING_STREAM_LOADER_DELAY_ON_ERROR_IN_SECONDS} \\
         --env SENZING_RABBITMQ_USERNAME=${SENZING_RABBITMQ_USERNAME} \\
-        --env SENZING_RABBITMQ_USE_EXISTING_ENTITIES="False" \\
+        --env SENZING_RABBITMQ_USE_EXISTING_ENTITIES=${SENZING_RABBITMQ_USE_EXISTING_ENTITIES} \\
         --env SENZING_SUBCOMMAND=rabbitmq \\
+        --env SENZING_THREADS_PER_PROCESS=${SENZING_STREAM_LOADER_THREADS_PER_PROCESS} \\
         --interactive \\
         --name ${CONTAINER_NAME} \\
         --restart always \\
@@ -2671,49 +4219,30 @@ function up {
         ${SENZING_PRIVILEGED_PARAMETER} \\
         senzing/stream-loader:${CONTAINER_VERSION} \\
         >> ${CONTAINER_LOG} 2>&1
+}
 
-    COUNTER=0
-    COUNTER_NOTICE=5
-    TIME_STRING=".."
-    CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    while [ "${CONTAINER_STATUS}" != "running" ]; do
-        COUNTER=$((${COUNTER}+1))
-        if [ "${COUNTER}" -eq "${COUNTER_NOTICE}" ]; then
-            echo -ne "\033[2K"
-            echo ""
-            echo "To see what is happening behind-the-scenes, view the log at"
-            echo "${CONTAINER_LOG}"
-            echo "and/or run 'docker logs ${CONTAINER_NAME}'"
-            echo ""
+# Bring down every replica that exists, whatever the current replica count.
+
+function down {
+    for CONTAINER_NAME in $(${SENZING_SUDO} docker ps --all --filter "name=^${SENZING_DOCKER_CONTAINER_NAME_STREAM_LOADER}(-[0-9]+)?$" --format '{{.Names}}');
+    do
+        REPLICA=${CONTAINER_NAME#${SENZING_DOCKER_CONTAINER_NAME_STREAM_LOADER}-}
+        if [ "${CONTAINER_NAME}" == "${SENZING_DOCKER_CONTAINER_NAME_STREAM_LOADER}" ]; then
+            REPLICA=1
         fi
-        TIME_STRING="${TIME_STRING}."
-        echo -ne "\033[2K${CONTAINER_NAME} status: ${CONTAINER_STATUS}${TIME_STRING}\r"
-        sleep 5
-        CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
+        select_replica ${REPLICA}
+        down_replica &
     done
-
-    echo "${SENZING_HORIZONTAL_RULE}"
-    echo "${SENZING_HORIZONTAL_RULE:0:2} ${CONTAINER_NAME} is running."
-    echo "${SENZING_HORIZONTAL_RULE:0:2} Mount information: (Format: in container > on host)"
-    echo "${SENZING_HORIZONTAL_RULE:0:2}   /etc/opt/senzing  > ${SENZING_ETC_DIR}"
-    echo "${SENZING_HORIZONTAL_RULE:0:2}   /opt/senzing/data > ${SENZING_DATA_VERSION_DIR}"
-    echo "${SENZING_HORIZONTAL_RULE:0:2}   /opt/senzing/g2   > ${SENZING_G2_DIR}"
-    echo "${SENZING_HORIZONTAL_RULE:0:2}   /var/opt/senzing  > ${SENZING_VAR_DIR}"
-    echo "${SENZING_HORIZONTAL_RULE:0:2} Logs:"
-    echo "${SENZING_HORIZONTAL_RULE:0:2}   ${CONTAINER_LOG}"
-    echo "${SENZING_HORIZONTAL_RULE:0:2}   and/or run 'docker logs ${CONTAINER_NAME}'"
-    echo "${SENZING_HORIZONTAL_RULE:0:2} For more information:"
-    echo "${SENZING_HORIZONTAL_RULE:0:2} ${SENZING_REFERENCE_URL}#senzing-stream-loader"
-    echo "${SENZING_HORIZONTAL_RULE}"
+    wait
 }
 
-function down {
+function down_replica {
     ${SENZING_SUDO} docker stop ${CONTAINER_NAME} >> ${CONTAINER_LOG} 2>&1
     ${SENZING_SUDO} docker rm   ${CONTAINER_NAME} >> ${CONTAINER_LOG} 2>&1
 }
 
 function usage {
-    echo "usage: $0 [up | down | restart]"
+    echo "usage: $0 [up | down | restart] [--replicas N]"
     echo "For more information:"
     echo "${SENZING_REFERENCE_URL}#senzing-stream-loader"
 }
@@ -2722,11 +4251,26 @@ function usage {
 
 SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
 source ${SCRIPT_DIR}/docker-environment-vars.sh
+source ${SCRIPT_DIR}/docker-functions.sh
 
-CONTAINER_LOG="${SENZING_LOG_STREAM_LOADER}"
-CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_STREAM_LOADER}"
 CONTAINER_VERSION="${SENZING_DOCKER_IMAGE_VERSION_STREAM_LOADER}"
 
+if [ "$2" == "--replicas" ]; then
+    SENZING_STREAM_LOADER_REPLICAS=$3
+fi
+
+if ! [[ "${SENZING_STREAM_LOADER_REPLICAS}" =~ ^[1-9][0-9]*$ ]]; then
+    echo "Number of replicas must be a positive integer. Replicas: ${SENZING_STREAM_LOADER_REPLICAS}"
+    exit 1
+fi
+
+# Every shard needs at least one replica.
+
+if [ "${SENZING_STREAM_LOADER_REPLICAS}" -lt "${SENZING_RABBITMQ_SHARDS}" ]; then
+    echo "Replicas raised from ${SENZING_STREAM_LOADER_REPLICAS} to ${SENZING_RABBITMQ_SHARDS}, one per shard."
+    SENZING_STREAM_LOADER_REPLICAS=${SENZING_RABBITMQ_SHARDS}
+fi
+
 if [ "$1" == "up" ]; then
     up
 elif [ "$1" == "down" ]; then
@@ -2745,75 +4289,210 @@ def file_senzing_stream_producer():
 
 # --- Functions ---------------------------------------------------------------
 
+# The input is split into SENZING_STREAM_PRODUCER_RANGES ranges, each sent by its own container.
+# Range 1 keeps the unsuffixed container name and log file.
+# Range N > 1 is sent by "...-stream-producer-N", which logs to "...-stream-producer-N.log".
+# Ranges are sent to RabbitMQ shards round-robin: range N goes to shard ((N - 1) % SENZING_RABBITMQ_SHARDS) + 1.
+
+function select_range {
+    if [ $1 -eq 1 ]; then
+        CONTAINER_LOG="${SENZING_LOG_STREAM_PRODUCER}"
+        CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_STREAM_PRODUCER}"
+    else
+        CONTAINER_LOG="${SENZING_LOG_STREAM_PRODUCER%.log}-$1.log"
+        CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_STREAM_PRODUCER}-$1"
+    fi
+    CONTAINER_QUEUE=$(rabbitmq_shard_queue $(( ($1 - 1) % ${SENZING_RABBITMQ_SHARDS} + 1 )))
+
+    # SENZING_INPUT_URL: records 1 to SENZING_RECORD_MAX are split into contiguous record ranges.
+    # Local input: each range is a file of whole lines, and SENZING_RECORD_MAX is shared out between them.
+
+    CONTAINER_RECORD_MIN=""
+    CONTAINER_RECORD_MAX=""
+    CONTAINER_VOLUME=""
+    if [ -z "${SENZING_STREAM_PRODUCER_INPUT}" ]; then
+        CONTAINER_INPUT_URL=${SENZING_INPUT_URL}
+        if [ ${RANGES} -gt 1 ]; then
+            CONTAINER_RECORD_MIN=$(( ($1 - 1) * ${SENZING_RECORD_MAX} / ${RANGES} + 1 ))
+            CONTAINER_RECORD_MAX=$(( $1 * ${SENZING_RECORD_MAX} / ${RANGES} ))
+        elif [ ${SENZING_RECORD_MAX} -gt 0 ]; then
+            CONTAINER_RECORD_MAX=${SENZING_RECORD_MAX}
+        fi
+    else
+        CONTAINER_INPUT_URL="file:///input/$(basename ${RANGE_FILES[$(($1 - 1))]})"
+        CONTAINER_VOLUME="$(dirname ${RANGE_FILES[$(($1 - 1))]}):/input:ro"
+        if [ ${SENZING_RECORD_MAX} -gt 0 ]; then
+            CONTAINER_RECORD_MAX=$(( (${SENZING_RECORD_MAX} + ${RANGES} - 1) / ${RANGES} ))
+        fi
+    fi
+}
+
+# Split local input into SENZING_STREAM_PRODUCER_RANGES files of about the same number of bytes,
+# cut at line boundaries, in SENZING_STREAM_PRODUCER_RANGES_DIR.
+# The split is reused while the input files and number of ranges are unchanged.
+# A single input file sent as one range is used in place.
+# Named pipes, e.g. from "senzing-environment.py generate-records --generate-records-rabbitmq", are ranges already.
+
+function prepare_ranges {
+    RANGE_FILES=($(find ${SENZING_STREAM_PRODUCER_INPUT} -type p -name "*.json" | sort))
+    if [ ${#RANGE_FILES[@]} -gt 0 ]; then
+        RANGES=${#RANGE_FILES[@]}
+        return 0
+    fi
+
+    INPUT_FILES=($(find ${SENZING_STREAM_PRODUCER_INPUT} -type f \\( -name "*.json" -o -name "*.jsonl" -o -path ${SENZING_STREAM_PRODUCER_INPUT} \\) | sort))
+    if [ ${#INPUT_FILES[@]} -eq 0 ]; then
+        echo "No *.json or *.jsonl files in ${SENZING_STREAM_PRODUCER_INPUT}"
+        return 1
+    fi
+
+    if [ ${#INPUT_FILES[@]} -eq 1 ] && [ ${SENZING_STREAM_PRODUCER_RANGES} -eq 1 ]; then
+        RANGE_FILES=(${INPUT_FILES[0]})
+        RANGES=1
+        return 0
+    fi
+
+    # GNU stat (Linux) and BSD stat (macOS) take different options.
+
+    if stat --version > /dev/null 2>&1; then
+        STAMP="$(stat --format '%n %s %Y' ${INPUT_FILES[@]}) ${SENZING_STREAM_PRODUCER_RANGES}"
+    else
+        STAMP="$(stat -f '%N %z %m' ${INPUT_FILES[@]}) ${SENZING_STREAM_PRODUCER_RANGES}"
+    fi
+    if [ "$(cat ${SENZING_STREAM_PRODUCER_RANGES_DIR}/.stamp 2>/dev/null)" != "${STAMP}" ]; then
+        echo -ne "\\033[2K${SENZING_DOCKER_CONTAINER_NAME_STREAM_PRODUCER} status: splitting input...\\r"
+        rm -rf ${SENZING_STREAM_PRODUCER_RANGES_DIR}
+        mkdir -p ${SENZING_STREAM_PRODUCER_RANGES_DIR}
+
+        # awk ends every line with a newline, so a file without a trailing newline
+        # does not merge its last record with the first record of the next file.
+        # Unlike "split --number=l/N", it works with the awk and split of macOS.
+
+        INPUT_BYTES=$(cat ${INPUT_FILES[@]} | wc -c)
+        LC_ALL=C awk \\
+            -v bytes=${INPUT_BYTES} \\
+            -v directory=${SENZING_STREAM_PRODUCER_RANGES_DIR} \\
+            -v ranges=${SENZING_STREAM_PRODUCER_RANGES} \\
+            'BEGIN {
+                range = 1
+                filename = sprintf("%s/range-%04d.json", directory, range)
+            }
+            {
+                if (written >= range * bytes / ranges && range < ranges) {
+                    close(filename)
+                    range++
+                    filename = sprintf("%s/range-%04d.json", directory, range)
+                }
+                print > filename
+                written += length($0) + 1
+            }' ${INPUT_FILES[@]}
+        echo "${STAMP}" > ${SENZING_STREAM_PRODUCER_RANGES_DIR}/.stamp
+    fi
+
+    RANGE_FILES=($(ls ${SENZING_STREAM_PRODUCER_RANGES_DIR}/range-*.json 2>/dev/null))
+    RANGES=${#RANGE_FILES[@]}
+    if [ ${RANGES} -eq 0 ]; then
+        echo "No records in ${SENZING_STREAM_PRODUCER_INPUT}"
+        return 1
+    fi
+}
+
 function up {
-    echo -ne "\033[2K${CONTAINER_NAME} status: starting...\r"
+    RANGES=${SENZING_STREAM_PRODUCER_RANGES}
+    if [ -n "${SENZING_STREAM_PRODUCER_INPUT}" ]; then
+        prepare_ranges || return 1
+    elif [ ${SENZING_RECORD_MAX} -le 0 ]; then
+        RANGES=1
+    fi
+
+    select_range 1
 
     if [ "${CONTAINER_VERSION}" == "latest" ]
     then
-        ${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/stream-producer:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
+        echo -ne "\\033[2K${CONTAINER_NAME} status: pulling...\\r"
+        docker_pull_cached senzing/stream-producer:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
     fi
 
+    # Start a producer for every range, then wait for each.
+
+    READY_SINCE=$(date +%s)
+    for RANGE in $(seq 1 ${RANGES});
+    do
+        select_range ${RANGE}
+        echo -ne "\\033[2K${CONTAINER_NAME} status: starting...\\r"
+        up_range
+    done
+
+    for RANGE in $(seq 1 ${RANGES});
+    do
+        select_range ${RANGE}
+        wait_for_ready ${READY_SINCE} || return 1
+    done
+
+    echo "${SENZING_HORIZONTAL_RULE}"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} ${SENZING_DOCKER_CONTAINER_NAME_STREAM_PRODUCER} is running. (Ranges: ${RANGES}  Shards: ${SENZING_RABBITMQ_SHARDS})"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} Input: ${SENZING_STREAM_PRODUCER_INPUT:-${SENZING_INPUT_URL}}"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} Logs:"
+    for RANGE in $(seq 1 ${RANGES});
+    do
+        select_range ${RANGE}
+        echo "${SENZING_HORIZONTAL_RULE:0:2}   ${CONTAINER_LOG}  (${CONTAINER_INPUT_URL##*/} ${CONTAINER_RECORD_MIN:-1}-${CONTAINER_RECORD_MAX:-all} to ${CONTAINER_QUEUE})"
+    done
+    echo "${SENZING_HORIZONTAL_RULE:0:2}   and/or run 'docker logs ${SENZING_DOCKER_CONTAINER_NAME_STREAM_PRODUCER}'"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} For more information:"
+    echo "${SENZING_HORIZONTAL_RULE:0:2} ${SENZING_REFERENCE_URL}#senzing-stream-producer"
+    echo "${SENZING_HORIZONTAL_RULE}"
+}
+
+function up_range {
     ${SENZING_SUDO} docker run \\
         --detach \\
-        --env SENZING_INPUT_URL=${SENZING_INPUT_URL} \\
+        --env SENZING_INPUT_URL=${CONTAINER_INPUT_URL} \\
         --env SENZING_RABBITMQ_HOST=${SENZING_DOCKER_HOST_IP_ADDR} \\
         --env SENZING_RABBITMQ_PASSWORD=${SENZING_RABBITMQ_PASSWORD} \\
         --env SENZING_RABBITMQ_PORT=${SENZING_DOCKER_PORT_RABBITMQ} \\
-        --env SENZING_RABBITMQ_QUEUE=${SENZING_RABBITMQ_QUEUE} \\
+        --env SENZING_RABBITMQ_QUEUE=${CONTAINER_QUEUE} \\
         --env SENZING_RABBITMQ_USERNAME=${SENZING_RABBITMQ_USERNAME} \\
-        --env SENZING_RABBITMQ_USE_EXISTING_ENTITIES="False" \\
-        --env SENZING_RECORD_MAX=${SENZING_RECORD_MAX} \\
-        --env SENZING_RECORD_MONITOR=1000 \\
+        --env SENZING_RABBITMQ_USE_EXISTING_ENTITIES=${SENZING_RABBITMQ_USE_EXISTING_ENTITIES} \\
+        ${CONTAINER_RECORD_MAX:+--env SENZING_RECORD_MAX=${CONTAINER_RECORD_MAX}} \\
+        ${CONTAINER_RECORD_MIN:+--env SENZING_RECORD_MIN=${CONTAINER_RECORD_MIN}} \\
+        --env SENZING_RECORD_MONITOR=${SENZING_RECORD_MONITOR} \\
         --env SENZING_SUBCOMMAND=json-to-rabbitmq \\
         --interactive \\
         --name ${CONTAINER_NAME} \\
         --rm \\
         --tty \\
         --user $(id -u):$(id -g) \\
+        ${CONTAINER_VOLUME:+--volume ${CONTAINER_VOLUME}} \\
         ${SENZING_DOCKER_RUN_PARAMETERS_GLOBAL} \\
         ${SENZING_DOCKER_RUN_PARAMETERS_STREAM_PRODUCER} \\
         ${SENZING_NETWORK_PARAMETER} \\
         ${SENZING_PRIVILEGED_PARAMETER} \\
         senzing/stream-producer:${CONTAINER_VERSION} \\
         >> ${CONTAINER_LOG} 2>&1
+}
+
+# Bring down every range's producer that exists, whatever the current number of ranges.
 
-    COUNTER=0
-    COUNTER_NOTICE=5
-    TIME_STRING=".."
-    CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    while [ "${CONTAINER_STATUS}" != "running" ]; do
-        COUNTER=$((${COUNTER}+1))
-        if [ "${COUNTER}" -eq "${COUNTER_NOTICE}" ]; then
-            echo -ne "\033[2K"
-            echo ""
-            echo "To see what is happening behind-the-scenes, view the log at"
-            echo "${CONTAINER_LOG}"
-            echo "and/or run 'docker logs ${CONTAINER_NAME}'"
-            echo ""
+function down {
+    for CONTAINER_NAME in $(${SENZING_SUDO} docker ps --all --filter "name=^${SENZING_DOCKER_CONTAINER_NAME_STREAM_PRODUCER}(-[0-9]+)?$" --format '{{.Names}}');
+    do
+        CONTAINER_LOG="${SENZING_LOG_STREAM_PRODUCER%.log}-${CONTAINER_NAME#${SENZING_DOCKER_CONTAINER_NAME_STREAM_PRODUCER}-}.log"
+        if [ "${CONTAINER_NAME}" == "${SENZING_DOCKER_CONTAINER_NAME_STREAM_PRODUCER}" ]; then
+            CONTAINER_LOG="${SENZING_LOG_STREAM_PRODUCER}"
         fi
-        TIME_STRING="${TIME_STRING}."
-        echo -ne "\033[2K${CONTAINER_NAME} status: ${CONTAINER_STATUS}${TIME_STRING}\r"
-        sleep 5
-        CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
+        down_range &
     done
+    wait
+}
 
-    echo "${SENZING_HORIZONTAL_RULE}"
-    echo "${SENZING_HORIZONTAL_RULE:0:2} ${CONTAINER_NAME} is running."
-    echo "${SENZING_HORIZONTAL_RULE:0:2} Logs:"
-    echo "${SENZING_HORIZONTAL_RULE:0:2}   ${CONTAINER_LOG}"
-    echo "${SENZING_HORIZONTAL_RULE:0:2}   and/or run 'docker logs ${CONTAINER_NAME}'"
-    echo "${SENZING_HORIZONTAL_RULE:0:2} For more information:"
-    echo "${SENZING_HORIZONTAL_RULE:0:2} ${SENZING_REFERENCE_URL}#senzing-stream-producer"
-    echo "${SENZING_HORIZONTAL_RULE}"
-}
-
-function down {
+function down_range {
     ${SENZING_SUDO} docker stop ${CONTAINER_NAME} >> ${CONTAINER_LOG} 2>&1
     ${SENZING_SUDO} docker rm   ${CONTAINER_NAME} >> ${CONTAINER_LOG} 2>&1
 }
 
 function usage {
-    echo "usage: $0 [up | down | restart]"
+    echo "usage: $0 [up | down | restart] [--input FILE_OR_DIRECTORY] [--ranges N] [--record-max N]"
     echo "For more information:"
     echo "${SENZING_REFERENCE_URL}#senzing-stream-producer"
 }
@@ -2822,16 +4501,39 @@ function usage {
 
 SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
 source ${SCRIPT_DIR}/docker-environment-vars.sh
+source ${SCRIPT_DIR}/docker-functions.sh
 
-CONTAINER_LOG="${SENZING_LOG_STREAM_PRODUCER}"
-CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_STREAM_PRODUCER}"
 CONTAINER_VERSION="${SENZING_DOCKER_IMAGE_VERSION_STREAM_PRODUCER}"
 
-if [ "$1" == "up" ]; then
+# Options override docker-environment-vars.sh for this run.
+
+ACTION=$1
+shift
+while [ $# -gt 0 ]; do
+    case "$1" in
+        --input) SENZING_STREAM_PRODUCER_INPUT=$2 ;;
+        --ranges) SENZING_STREAM_PRODUCER_RANGES=$2 ;;
+        --record-max) SENZING_RECORD_MAX=$2 ;;
+        *) usage; exit 1 ;;
+    esac
+    shift 2
+done
+
+if ! [[ "${SENZING_STREAM_PRODUCER_RANGES}" =~ ^[1-9][0-9]*$ ]]; then
+    echo "Number of ranges must be a positive integer. Ranges: ${SENZING_STREAM_PRODUCER_RANGES}"
+    exit 1
+fi
+
+if ! [[ "${SENZING_RECORD_MAX}" =~ ^[0-9]+$ ]]; then
+    echo "Maximum number of records must be a non-negative integer. Records: ${SENZING_RECORD_MAX}"
+    exit 1
+fi
+
+if [ "${ACTION}" == "up" ]; then
     up
-elif [ "$1" == "down" ]; then
+elif [ "${ACTION}" == "down" ]; then
     down
-elif [ "$1" == "restart" ]; then
+elif [ "${ACTION}" == "restart" ]; then
     down
     up
 else
@@ -2851,9 +4553,10 @@ function up {
 
     if [ "${CONTAINER_VERSION}" == "latest" ]
     then
-        ${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/entity-search-web-app:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
+        docker_pull_cached senzing/entity-search-web-app:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
     fi
 
+    READY_SINCE=$(date +%s)
     ${SENZING_SUDO} docker run \\
         --detach \\
         --env SENZING_API_SERVER_URL=${SENZING_API_SERVER_URL} \\
@@ -2879,25 +4582,7 @@ function up {
         senzing/entity-search-web-app:${CONTAINER_VERSION} \\
         >> ${CONTAINER_LOG} 2>&1
 
-    COUNTER=0
-    COUNTER_NOTICE=5
-    TIME_STRING=".."
-    CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    while [ "${CONTAINER_STATUS}" != "running" ]; do
-        COUNTER=$((${COUNTER}+1))
-        if [ "${COUNTER}" -eq "${COUNTER_NOTICE}" ]; then
-            echo -ne "\033[2K"
-            echo ""
-            echo "To see what is happening behind-the-scenes, view the log at"
-            echo "${CONTAINER_LOG}"
-            echo "and/or run 'docker logs ${CONTAINER_NAME}'"
-            echo ""
-        fi
-        TIME_STRING="${TIME_STRING}."
-        echo -ne "\033[2K${CONTAINER_NAME} status: ${CONTAINER_STATUS}${TIME_STRING}\r"
-        sleep 5
-        CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    done
+    wait_for_ready ${READY_SINCE} probe_http http://${SENZING_DOCKER_HOST_IP_ADDR}:${CONTAINER_PORT} || return 1
 
     echo "${SENZING_HORIZONTAL_RULE}"
     echo "${SENZING_HORIZONTAL_RULE:0:2} ${CONTAINER_NAME} running on http://${SENZING_DOCKER_HOST_IP_ADDR}:${CONTAINER_PORT}"
@@ -2929,6 +4614,7 @@ function usage {
 
 SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
 source ${SCRIPT_DIR}/docker-environment-vars.sh
+source ${SCRIPT_DIR}/docker-functions.sh
 
 CONTAINER_LOG="${SENZING_LOG_WEBAPP}"
 CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_ENTITY_SEARCH_WEB_APP}"
@@ -2957,7 +4643,7 @@ def file_senzing_webapp_demo():
 function init {
     if [ "${SENZING_DOCKER_IMAGE_VERSION_INIT_CONTAINER}" == "latest" ]
     then
-        ${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/init-container:${SENZING_DOCKER_IMAGE_VERSION_INIT_CONTAINER} >> ${CONTAINER_LOG} 2>&1
+        docker_pull_cached senzing/init-container:${SENZING_DOCKER_IMAGE_VERSION_INIT_CONTAINER} >> ${CONTAINER_LOG} 2>&1
     fi
 
     ${SENZING_SUDO} docker run \
@@ -2988,9 +4674,10 @@ function up {
 
     if [ "${CONTAINER_VERSION}" == "latest" ]
     then
-        ${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/web-app-demo:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
+        docker_pull_cached senzing/web-app-demo:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
     fi
 
+    READY_SINCE=$(date +%s)
     ${SENZING_SUDO} docker run \\
         --detach \\
         --env SENZING_DATABASE_URL=${SENZING_DATABASE_URL} \\
@@ -3013,26 +4700,7 @@ function up {
         senzing/web-app-demo:${CONTAINER_VERSION} \\
         >> ${CONTAINER_LOG} 2>&1
 
-    COUNTER=0
-    COUNTER_NOTICE=5
-    TIME_STRING=".."
-    CONTAINER_STATUS="$(${SENZING_SUDO} docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    while [ "${CONTAINER_STATUS}" != "running" ]; do
-        COUNTER=$((${COUNTER}+1))
-        if [ "${COUNTER}" -eq "${COUNTER_NOTICE}" ]; then
-            echo -ne "[2K"
-            echo ""
-            echo "To see what is happening behind-the-scenes, view the log at"
-            echo "${CONTAINER_LOG}"
-            echo "and/or run 'docker logs ${CONTAINER_NAME}'"
-            echo ""
-        fi
-        TIME_STRING="${TIME_STRING}."
-        echo -ne "[2K${CONTAINER_NAME} status: ${CONTAINER_STATUS}${TIME_STRING}
-"
-        sleep 5
-        CONTAINER_STATUS="$(${SENZING_SUDO} docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    done
+    wait_for_ready ${READY_SINCE} probe_http http://${SENZING_DOCKER_HOST_IP_ADDR}:${SENZING_DOCKER_PORT_SENZING_API_SERVER}/heartbeat || return 1
 
     echo "${SENZING_HORIZONTAL_RULE}"
     echo "${SENZING_HORIZONTAL_RULE:0:2} entity-search-web-app running on http://${SENZING_DOCKER_HOST_IP_ADDR}:${CONTAINER_PORT}"
@@ -3067,6 +4735,7 @@ function usage {
 
 SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
 source ${SCRIPT_DIR}/docker-environment-vars.sh
+source ${SCRIPT_DIR}/docker-functions.sh
 
 CONTAINER_LOG="${SENZING_LOG_WEB_APP_DEMO}"
 CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_WEB_APP_DEMO}"
@@ -3108,9 +4777,10 @@ function up {
 
     if [ "${CONTAINER_VERSION}" == "latest" ]
     then
-        ${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/xterm:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
+        docker_pull_cached senzing/xterm:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
     fi
 
+    READY_SINCE=$(date +%s)
     ${SENZING_SUDO} docker run \\
         --detach \\
         --interactive \\
@@ -3133,25 +4803,7 @@ function up {
         senzing/xterm:${CONTAINER_VERSION} \\
         >> ${CONTAINER_LOG} 2>&1
 
-    COUNTER=0
-    COUNTER_NOTICE=5
-    TIME_STRING=".."
-    CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    while [ "${CONTAINER_STATUS}" != "running" ]; do
-        COUNTER=$((${COUNTER}+1))
-        if [ "${COUNTER}" -eq "${COUNTER_NOTICE}" ]; then
-            echo -ne "\033[2K"
-            echo ""
-            echo "To see what is happening behind-the-scenes, view the log at"
-            echo "${CONTAINER_LOG}"
-            echo "and/or run 'docker logs ${CONTAINER_NAME}'"
-            echo ""
-        fi
-        TIME_STRING="${TIME_STRING}."
-        echo -ne "\033[2K${CONTAINER_NAME} status: ${CONTAINER_STATUS}${TIME_STRING}\r"
-        sleep 5
-        CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    done
+    wait_for_ready ${READY_SINCE} || return 1
 
     echo "${SENZING_HORIZONTAL_RULE}"
     echo "${SENZING_HORIZONTAL_RULE:0:2} ${CONTAINER_NAME} running on http://${SENZING_DOCKER_HOST_IP_ADDR}:${CONTAINER_PORT}"
@@ -3185,6 +4837,7 @@ function usage {
 
 SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
 source ${SCRIPT_DIR}/docker-environment-vars.sh
+source ${SCRIPT_DIR}/docker-functions.sh
 
 CONTAINER_LOG="${SENZING_LOG_XTERM}"
 CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_XTERM}"
@@ -3215,7 +4868,7 @@ function up {
 
     if [ "${CONTAINER_VERSION}" == "latest" ]
     then
-        ${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/senzing/yum:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
+        docker_pull_cached senzing/yum:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
     fi
 
     # Remove symbolic links.
@@ -3240,26 +4893,6 @@ function up {
         senzing/yum:${CONTAINER_VERSION} \\
         >> ${CONTAINER_LOG} 2>&1
 
-    COUNTER=0
-    COUNTER_NOTICE=5
-    TIME_STRING=".."
-    CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    while [ "${CONTAINER_STATUS}" != "running" ]; do
-        COUNTER=$((${COUNTER}+1))
-        if [ "${COUNTER}" -eq "${COUNTER_NOTICE}" ]; then
-            echo -ne "\033[2K"
-            echo ""
-            echo "To see what is happening behind-the-scenes, view the log at"
-            echo "${CONTAINER_LOG}"
-            echo "and/or run 'docker logs ${CONTAINER_NAME}'"
-            echo ""
-        fi
-        TIME_STRING="${TIME_STRING}."
-        echo -ne "\033[2K${CONTAINER_NAME} status: ${CONTAINER_STATUS}${TIME_STRING}\r"
-        sleep 5
-        CONTAINER_STATUS="$( docker container inspect -f '{{.State.Status}}' ${CONTAINER_NAME})"
-    done
-
     # Create symbolic links to timestamped directories.
 
     TIMESTAMP=$(date +%s)
@@ -3290,6 +4923,7 @@ function usage {
 
 SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
 source ${SCRIPT_DIR}/docker-environment-vars.sh
+source ${SCRIPT_DIR}/docker-functions.sh
 
 CONTAINER_LOG="${SENZING_LOG_YUM}"
 CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_YUM}"
@@ -3319,7 +4953,7 @@ function up {
 
     if [ "${CONTAINER_VERSION}" == "latest" ]
     then
-        ${SENZING_SUDO} docker pull ${SENZING_DOCKER_REGISTRY_URL}/swaggerapi/swagger-ui:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
+        docker_pull_cached swaggerapi/swagger-ui:${CONTAINER_VERSION} >> ${CONTAINER_LOG} 2>&1
     fi
 
     ${SENZING_SUDO} docker run \\
@@ -3360,6 +4994,7 @@ function usage {
 
 SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
 source ${SCRIPT_DIR}/docker-environment-vars.sh
+source ${SCRIPT_DIR}/docker-functions.sh
 
 CONTAINER_LOG="${SENZING_LOG_SWAGGERAPI_SWAGGER_UI}"
 CONTAINER_NAME="${SENZING_DOCKER_CONTAINER_NAME_SWAGGERAPI_SWAGGER_UI}"
@@ -3379,11 +5014,309 @@ fi
 """
     return 0
 
+# -----------------------------------------------------------------------------
+# Template registry
+# -----------------------------------------------------------------------------
+
+# The file_* templates above are parsed once, when this program is loaded.
+# Templates listed here are rendered like str.format(), so literal braces are written "{{" and "}}".
+# All other templates are written verbatim.
+
+formatted_templates = [
+    "file_docker_environment_vars",
+    "file_senzing_info",
+]
+
+
+def compile_template(name, text, formatted):
+    ''' Parse a template.  Return the parsed parts and the variables it needs. '''
+
+    if not formatted:
+        return {
+            "parts": [(text, None, None, None)],
+            "text": text,
+            "variables": frozenset(),
+        }
+
+    try:
+        parts = list(string.Formatter().parse(text))
+    except ValueError as err:
+        raise ValueError("Template {0}: {1}".format(name, err))
+
+    variables = set()
+    for literal_text, field_name, format_spec, conversion in parts:
+        if field_name is None:
+            continue
+        if not field_name.isidentifier() or "{" in (format_spec or ""):
+            raise ValueError("Template {0}: unsupported field {{{1}}}".format(name, field_name))
+        variables.add(field_name)
+
+    return {
+        "parts": parts,
+        "variables": frozenset(variables),
+    }
+
+
+def compile_templates():
+    ''' Compile every file_* template. '''
+
+    result = {}
+    for name, function in sorted(globals().items()):
+        if name.startswith("file_") and callable(function) and function.__doc__:
+            result[name] = compile_template(name, function.__doc__, name in formatted_templates)
+    return result
+
+
+template_registry = compile_templates()
+
+
+def render_template(name, variables):
+    ''' Render a compiled template.  Variables must already have been checked. '''
+
+    # Verbatim templates are the same for every project.
+
+    template = template_registry[name]
+    if "text" in template:
+        return template["text"]
+
+    conversions = {
+        "a": ascii,
+        "r": repr,
+        "s": str,
+    }
+    result = []
+    for literal_text, field_name, format_spec, conversion in template["parts"]:
+        result.append(literal_text)
+        if field_name is not None:
+            value = variables[field_name]
+            if conversion:
+                value = conversions[conversion](value)
+            result.append(format(value, format_spec))
+    return "".join(result)
+
+
+def render_templates(templates, variables):
+    ''' Render {filename: file_* function} into {filename: content}.
+        All templates are checked for missing variables before any is rendered.
+    '''
+
+    for filename, function in sorted(templates.items()):
+        missing = template_registry[function.__name__]["variables"] - set(variables)
+        if missing:
+            exit_error(707, function.__name__, filename, ", ".join(sorted(missing)))
+
+    return {filename: render_template(function.__name__, variables) for filename, function in templates.items()}
+
 # -----------------------------------------------------------------------------
 # Utility functions
 # -----------------------------------------------------------------------------
 
 
+def get_interface_ip_addr(interface):
+    ''' Return the IPv4 address of a network interface, or None.  Linux only; no packets are sent. '''
+
+    SIOCGIFADDR = 0x8915
+    my_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        request = struct.pack('256s', interface[:15].encode('utf-8'))
+        return socket.inet_ntoa(fcntl.ioctl(my_socket.fileno(), SIOCGIFADDR, request)[20:24])
+    except OSError:
+        return None
+    finally:
+        my_socket.close()
+
+
+def get_default_route_interface():
+    ''' Return the interface of the default route with the lowest metric, from /proc/net/route. '''
+
+    result = None
+    lowest_metric = None
+    try:
+        with open("/proc/net/route", 'r') as file:
+            lines = file.read().splitlines()[1:]
+    except OSError:
+        return None
+    for line in lines:
+        fields = line.split()
+        if len(fields) < 8:
+            continue
+        interface, destination, flags, metric, mask = fields[0], fields[1], int(fields[3], 16), int(fields[6]), fields[7]
+        route_is_up = flags & 0x1
+        if destination == "00000000" and mask == "00000000" and route_is_up:
+            if lowest_metric is None or metric < lowest_metric:
+                result = interface
+                lowest_metric = metric
+    return result
+
+
+def get_ip_addr_is_local(ip_addr):
+    ''' Return True if ip_addr is assigned to this host.  Binding only succeeds for a local address. '''
+
+    my_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        my_socket.bind((ip_addr, 0))
+        return True
+    except (OSError, ValueError):
+        return False
+    finally:
+        my_socket.close()
+
+
+def discover_docker_host_ip_addr():
+    ''' Find the host IP address without network traffic.  Return (ip_addr, source) or (None, None).
+        In order: the default route interface, the docker bridge, the address of the host name.
+    '''
+
+    if sys.platform.startswith("linux"):
+        interface = get_default_route_interface()
+        if interface:
+            ip_addr = get_interface_ip_addr(interface)
+            if ip_addr:
+                return ip_addr, "default route interface {0}".format(interface)
+        ip_addr = get_interface_ip_addr("docker0")
+        if ip_addr:
+            return ip_addr, "docker bridge interface docker0"
+
+    try:
+        ip_addr = socket.gethostbyname(socket.gethostname())
+        if not ip_addr.startswith("127."):
+            return ip_addr, "host name {0}".format(socket.gethostname())
+    except OSError:
+        pass
+
+    return None, None
+
+
+def get_docker_host_ip_addr(project_dir):
+    ''' Return the IP address of the docker host.
+        The address is cached in <project>/var/docker-host-ip-addr, and reused while it is still assigned to this host.
+    '''
+
+    cache_filename = "{0}/var/docker-host-ip-addr".format(project_dir)
+
+    if os.path.exists(cache_filename):
+        with open(cache_filename, 'r') as file:
+            ip_addr = file.read().strip()
+        if ip_addr and get_ip_addr_is_local(ip_addr):
+            logging.info(message_info(136, ip_addr, cache_filename))
+            return ip_addr
+
+    ip_addr, source = discover_docker_host_ip_addr()
+    if not ip_addr:
+        exit_error(710)
+    logging.info(message_info(136, ip_addr, source))
+
+    os.makedirs(os.path.dirname(cache_filename), exist_ok=True)
+    write_file_atomically(cache_filename, "{0}\n".format(ip_addr))
+    return ip_addr
+
+
+def get_host_memory_in_mb():
+    ''' Return the physical memory of the host in megabytes. '''
+    return int(os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') / (1024 * 1024))
+
+
+def get_storage_is_rotational(path):
+    ''' Return True if the block device holding path is a spinning disk.  Unknown devices are assumed to be SSD. '''
+    try:
+        device = os.stat(path).st_dev
+        sys_block_path = os.path.realpath("/sys/dev/block/{0}:{1}".format(os.major(device), os.minor(device)))
+
+        # A partition has no "queue" directory.  Its parent device does.
+
+        for candidate in [sys_block_path, os.path.dirname(sys_block_path)]:
+            rotational_filename = "{0}/queue/rotational".format(candidate)
+            if os.path.exists(rotational_filename):
+                with open(rotational_filename, 'r') as rotational_file:
+                    return rotational_file.read().strip() == "1"
+    except:
+        pass
+    return False
+
+
+def get_postgres_parameters(config):
+    ''' Return "-c name=value" flags for the PostgreSQL container sized to the host.
+        Senzing loads are insert-heavy, so WAL and checkpoints are spread out.
+    '''
+
+    project_dir = config.get("project_dir")
+    memory_in_mb = config.get("postgres_memory_in_mb") or get_host_memory_in_mb()
+    if config.get("database_cluster"):
+        memory_in_mb = memory_in_mb // (1 + len(postgres_cluster_instances))
+    cpu_count = os.cpu_count() or 1
+    threads_per_process = config.get("stream_loader_threads_per_process") or cpu_count
+    is_rotational = get_storage_is_rotational(project_dir if os.path.exists(project_dir) else os.path.dirname(project_dir))
+
+    # Each stream-loader thread holds a connection.  Leave room for other services and a second loader.
+
+    max_connections = max(100, (2 * threads_per_process) + 50)
+    shared_buffers_in_mb = max(128, memory_in_mb // 4)
+    work_mem_in_mb = max(4, (memory_in_mb - shared_buffers_in_mb) // (3 * max_connections))
+
+    parameters = {
+        "checkpoint_completion_target": "0.9",
+        "checkpoint_timeout": "15min",
+        "effective_cache_size": "{0}MB".format(max(128, (memory_in_mb * 3) // 4)),
+        "effective_io_concurrency": "2" if is_rotational else "200",
+        "maintenance_work_mem": "{0}MB".format(min(2048, max(64, memory_in_mb // 16))),
+        "max_connections": max_connections,
+        "max_parallel_workers": cpu_count,
+        "max_parallel_workers_per_gather": max(1, min(4, cpu_count // 2)),
+        "max_wal_size": "16GB" if memory_in_mb >= 16384 else "4GB",
+        "max_worker_processes": max(8, cpu_count),
+        "min_wal_size": "1GB",
+        "random_page_cost": "4" if is_rotational else "1.1",
+        "shared_buffers": "{0}MB".format(shared_buffers_in_mb),
+        "synchronous_commit": "off",
+        "wal_buffers": "16MB",
+        "wal_compression": "on",
+        "work_mem": "{0}MB".format(work_mem_in_mb),
+    }
+
+    result = " ".join(["-c {0}={1}".format(key, value) for key, value in parameters.items()])
+    logging.info(message_info(140, memory_in_mb, cpu_count, "rotational" if is_rotational else "solid-state", result))
+    return result
+
+
+def get_rabbitmq_erl_args(config):
+    ''' Return RABBITMQ_SERVER_ADDITIONAL_ERL_ARGS for the RabbitMQ container sized to the host.
+        RabbitMQ shares the host with PostgreSQL, whose shared_buffers take a quarter of memory,
+        so the memory alarm is raised at RabbitMQ's default 40% rather than more.
+    '''
+
+    memory_in_mb = config.get("rabbitmq_memory_in_mb")
+    cpu_count = os.cpu_count() or 1
+
+    # Without --rabbitmq-memory-in-mb, RabbitMQ takes 40% of the memory it sees: the host's, or the container's limit.
+
+    if memory_in_mb:
+        memory = "{0} MB".format(memory_in_mb)
+        memory_high_watermark = "{{absolute,{0}}}".format((memory_in_mb * 4 // 10) * 1024 * 1024)
+    else:
+        memory = "40% of host"
+        memory_high_watermark = "0.4"
+
+    # The disk alarm depends on the volume holding RabbitMQ data: 5% of it, from RabbitMQ's 50 MB default to 10 GB.
+
+    rabbitmq_dir = config.get("rabbitmq_dir") or "{0}/var/rabbitmq".format(config.get("project_dir"))
+    while not os.path.exists(rabbitmq_dir) and os.path.dirname(rabbitmq_dir) != rabbitmq_dir:
+        rabbitmq_dir = os.path.dirname(rabbitmq_dir)
+    disk_size_in_bytes = shutil.disk_usage(rabbitmq_dir).total
+    disk_free_limit_in_bytes = min(10 * 1024 ** 3, max(50 * 1024 ** 2, disk_size_in_bytes // 20))
+
+    parameters = [
+        "+S {0}:{0}".format(cpu_count),
+        "+A {0}".format(min(1024, max(128, 16 * cpu_count))),
+        "-rabbit vm_memory_high_watermark {0}".format(memory_high_watermark),
+        "-rabbit vm_memory_high_watermark_paging_ratio 0.9",
+        "-rabbit disk_free_limit {0}".format(disk_free_limit_in_bytes),
+    ]
+
+    result = " ".join(parameters)
+    logging.info(message_info(143, memory, cpu_count, config.get("rabbitmq_queue_type"), result))
+    return result
+
+
 def inspect_g2module_ini():
 
     g2module_ini_for_docker = {
@@ -3479,45 +5412,129 @@ def log_files():
     logging.info(message_info(101))
 
 
+def clone_file(source, target):
+    ''' Create target as a copy-on-write clone of source.  Raises OSError if unsupported. '''
+
+    if not sys.platform.startswith("linux"):
+        raise OSError(errno.EOPNOTSUPP, "Reflink not supported on {0}".format(sys.platform))
+
+    with open(source, 'rb') as source_file:
+        with open(target, 'wb') as target_file:
+            try:
+                fcntl.ioctl(target_file.fileno(), FICLONE, source_file.fileno())
+            except OSError:
+                target_file.close()
+                os.remove(target)
+                raise
+    shutil.copystat(source, target)
+
+
+def project_copy_etc_file(source, target):
+    ''' Place a copy of source at target.  Return "cloned" or "copied". '''
+
+    # The copy is made under a temporary name, then renamed over target,
+    # so target is never missing or partially written.
+
+    temporary = "{0}/.{1}.{2}.tmp".format(os.path.dirname(target), os.path.basename(target), os.getpid())
+    if os.path.lexists(temporary):
+        os.remove(temporary)
+
+    # Containers may write to files in docker-etc, so never share an inode with <project>/etc.
+    # A copy-on-write clone shares storage until either file is written, else a copy.
+
+    try:
+        clone_file(source, temporary)
+        result = "cloned"
+    except OSError:
+        shutil.copy2(source, temporary)
+        result = "copied"
+
+    os.replace(temporary, target)
+    return result
+
+
 def project_copy_etc(project_dir):
 
     # Synthesize variables.
 
     host_etc = "{0}/etc".format(project_dir)
     docker_etc = "{0}/docker-etc".format(project_dir)
-    docker_etc_old = "{0}/docker-etc.{1}".format(project_dir, int(time.time()))
+    counts = {
+        "cloned": 0,
+        "copied": 0,
+        "unchanged": 0,
+        "removed": 0,
+    }
 
-    # If directory exists, back it up.
+    # Files being replaced or removed that differ from <project>/etc are backed up.
 
-    if os.path.exists(docker_etc):
-        logging.info(message_info(161, docker_etc_old, docker_etc))
-        shutil.move(docker_etc, docker_etc_old)
+    backup = backup_begin("docker-etc")
+    directories = set()
 
-    # Copy directory.
+    # Synchronize <project>/docker-etc with <project>/etc.
 
     try:
         logging.info(message_info(164, docker_etc, host_etc))
-        shutil.copytree(host_etc, docker_etc)
-    except shutil.Error as err:
-        exit_error(760, host_etc, docker_etc, err)
+        host_files = set()
+        for directory, subdirectories, filenames in os.walk(host_etc):
+            relative_directory = os.path.relpath(directory, host_etc)
+            os.makedirs(os.path.normpath(os.path.join(docker_etc, relative_directory)), exist_ok=True)
+            for filename in filenames:
+                relative_path = os.path.normpath(os.path.join(relative_directory, filename))
+                host_files.add(relative_path)
+                if relative_path in docker_etc_modified_files:
+                    continue
+                source = os.path.join(host_etc, relative_path)
+                target = os.path.join(docker_etc, relative_path)
+
+                # Skip files whose size and modification time have not changed.
+
+                if os.path.lexists(target):
+                    source_stat = os.stat(source)
+                    target_stat = os.lstat(target)
+                    if stat.S_ISREG(target_stat.st_mode) \
+                            and target_stat.st_size == source_stat.st_size \
+                            and target_stat.st_mtime_ns == source_stat.st_mtime_ns:
+                        counts["unchanged"] += 1
+                        continue
+                    backup_add_file(project_dir, backup, target, relative_path, keep=True)
+
+                counts[project_copy_etc_file(source, target)] += 1
+                directories.add(os.path.dirname(target))
+
+        # Remove files that are no longer in <project>/etc.
+
+        for directory, subdirectories, filenames in os.walk(docker_etc, topdown=False):
+            relative_directory = os.path.relpath(directory, docker_etc)
+            for filename in filenames:
+                relative_path = os.path.normpath(os.path.join(relative_directory, filename))
+                if relative_path not in host_files:
+                    backup_add_file(project_dir, backup, os.path.join(directory, filename), relative_path)
+                    counts["removed"] += 1
+                    directories.add(directory)
+            if not os.path.isdir(os.path.join(host_etc, relative_directory)) and not os.listdir(directory):
+                os.rmdir(directory)
+                directories.add(os.path.dirname(directory))
+
+        for directory in sorted(directories):
+            if os.path.isdir(directory):
+                fsync_directory(directory)
+        backup_commit(project_dir, backup)
+
     except OSError as err:
         exit_error(761, host_etc, docker_etc, err)
 
+    logging.info(message_info(169, docker_etc, host_etc, counts["cloned"], counts["copied"], counts["unchanged"], counts["removed"]))
+
 
 def project_create_docker_bin_directory(project_dir):
 
-    # Specify output directory and backup directory.
+    # Specify output directory.
 
     output_directory = "{0}/docker-bin".format(project_dir)
-    backup_directory = "{0}.{1}".format(output_directory, int(time.time()))
-
-    # If output directory exists, back it up.
 
-    if os.path.exists(output_directory):
-        logging.info(message_info(161, backup_directory, output_directory))
-        shutil.move(output_directory, backup_directory)
-
-    # Make .../docker-bin directory.
+    # Make .../docker-bin directory.  Existing files are reconciled by
+    # project_create_docker_bin_files().
 
     try:
         os.makedirs(output_directory, exist_ok=True)
@@ -3525,30 +5542,118 @@ def project_create_docker_bin_directory(project_dir):
         exit_error(702, output_directory, err)
 
 
-def project_create_docker_bin_files(project_dir, docker_bin_files):
+def get_content_hash(content):
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
 
-    # Specify output directory and backup directory.
+
+def get_file_hash(filename):
+    result = None
+    if os.path.exists(filename):
+        with open(filename, 'r', newline='') as file:
+            result = get_content_hash(file.read())
+    return result
+
+
+def get_docker_bin_manifest(project_dir):
+    result = {}
+    filename = "{0}/docker-bin/{1}".format(project_dir, DOCKER_BIN_MANIFEST)
+    if os.path.exists(filename):
+        try:
+            with open(filename, 'r') as file:
+                result = json.load(file).get("files", {})
+        except ValueError:
+            result = {}
+    return result
+
+
+def project_save_docker_bin_manifest(project_dir, manifest, directories=None):
+    filename = "{0}/docker-bin/{1}".format(project_dir, DOCKER_BIN_MANIFEST)
+    content = {
+        "version": __version__,
+        "files": dict(sorted(manifest.items())),
+    }
+    write_file_atomically(filename, json.dumps(content, indent=2) + "\n", directories=directories)
+
+
+def project_create_docker_bin_files(project_dir, docker_bin_contents, overwrite_edited=False):
+
+    # Specify output directory.
 
     output_directory = "{0}/docker-bin".format(project_dir)
+    backup = backup_begin("docker-bin")
+    directories = set()
+
+    # The manifest records the hash of each file as last generated.
+    # A file whose on-disk hash differs from the manifest was edited by hand.
 
-    # Write files from function docstrings.
+    old_manifest = get_docker_bin_manifest(project_dir)
+    new_manifest = {}
 
-    for filename, function in docker_bin_files.items():
+    # Write rendered templates, but only when the rendered output has changed.
+
+    for filename, content in sorted(docker_bin_contents.items()):
         full_filename = "{0}/{1}".format(output_directory, filename)
-        if not os.path.exists(full_filename):
+        content_hash = get_content_hash(content)
+        file_hash = get_file_hash(full_filename)
+        manifest_hash = old_manifest.get(filename)
+
+        if file_hash is None:
             logging.info(message_info(165, full_filename))
-            with open(full_filename, 'w') as file:
-                file.write(function.__doc__)
+        elif file_hash == content_hash:
+            logging.debug(message_debug(166, full_filename))
+            new_manifest[filename] = content_hash
             os.chmod(full_filename, 0o755)
+            continue
+        elif file_hash == manifest_hash:
+            logging.info(message_info(167, full_filename))
+        elif manifest_hash is not None and not overwrite_edited:
+            logging.warning(message_warning(356, full_filename))
+            new_manifest[filename] = manifest_hash
+            continue
         else:
-            logging.info(message_info(163, full_filename))
+            backup_add_file(project_dir, backup, full_filename, filename, keep=True)
+            logging.info(message_info(167, full_filename))
 
+        write_file_atomically(full_filename, content, mode=0o755, directories=directories)
+        new_manifest[filename] = content_hash
 
-def project_create_docker_environment_vars(project_dir, project_name, docker_host_ip_addr, sql_connection):
+    # Remove files that were generated previously but are no longer generated.
 
-    # Specify output directory and backup directory.
+    for filename, manifest_hash in sorted(old_manifest.items()):
+        if filename in docker_bin_contents:
+            continue
+        full_filename = "{0}/{1}".format(output_directory, filename)
+        file_hash = get_file_hash(full_filename)
+        if file_hash is None:
+            continue
+        if file_hash == manifest_hash:
+            logging.info(message_info(168, full_filename))
+            os.remove(full_filename)
+            directories.add(output_directory)
+        elif overwrite_edited:
+            logging.info(message_info(168, full_filename))
+            backup_add_file(project_dir, backup, full_filename, filename)
+            directories.add(output_directory)
+        else:
+            logging.warning(message_warning(356, full_filename))
 
-    output_directory = "{0}/docker-bin".format(project_dir)
+    # One directory sync for the whole batch.
+
+    project_save_docker_bin_manifest(project_dir, new_manifest, directories)
+    for directory in sorted(directories):
+        fsync_directory(directory)
+    backup_commit(project_dir, backup)
+
+
+def get_docker_registry_url(config):
+    ''' Return SENZING_DOCKER_REGISTRY_URL: the local pull-through cache if requested, otherwise docker.io. '''
+
+    if config.get("docker_registry_mirror"):
+        return "localhost:${SENZING_DOCKER_PORT_REGISTRY_MIRROR}"
+    return "docker.io"
+
+
+def get_docker_environment_variables(project_dir, project_name, docker_host_ip_addr, sql_connection, config):
 
     # Calculate sql_connection.
 
@@ -3570,6 +5675,18 @@ def project_create_docker_environment_vars(project_dir, project_name, docker_hos
 
     parsed_database_connection = parse_database_connection(sql_connection)
     senzing_database_url = get_g2_database_url(parsed_database_connection)
+    senzing_database_url_direct = senzing_database_url
+    if config.get("database_pooler"):
+        senzing_database_url = get_pgbouncer_database_url(parsed_database_connection, docker_host_ip_addr)
+
+    # If clustered, calculate URLs of the other PostgreSQL instances.
+
+    postgres_instances = ["core"]
+    cluster_database_urls = {}
+    if config.get("database_cluster") and parsed_database_connection.get("scheme") == "postgresql":
+        for instance in postgres_cluster_instances:
+            postgres_instances.append(instance)
+            cluster_database_urls[instance] = get_g2_database_url(get_cluster_database_connection(parsed_database_connection, instance))
 
     schema = parsed_database_connection.get("schema", "")
     if parsed_database_connection.get("scheme", "") == "sqlite3":
@@ -3585,38 +5702,47 @@ def project_create_docker_environment_vars(project_dir, project_name, docker_hos
         "database_protocol": parsed_database_connection.get("scheme", ""),
         "database_username": parsed_database_connection.get("username", ""),
         "docker_host_ip_addr": docker_host_ip_addr,
+        "docker_registry_mirror": "true" if config.get("docker_registry_mirror") else "false",
+        "docker_registry_url": get_docker_registry_url(config),
         "environment_updated": __updated__,
         "environment_version": __version__,
+        "postgres_instances": " ".join(postgres_instances),
+        "postgres_parameters": get_postgres_parameters(config),
         "project_dir": project_dir,
         "project_name": project_name,
+        "rabbitmq_dir": config.get("rabbitmq_dir") or "${SENZING_PROJECT_DIR}/var/rabbitmq",
+        "rabbitmq_erl_args": get_rabbitmq_erl_args(config),
+        "rabbitmq_queue_type": config.get("rabbitmq_queue_type"),
+        "rabbitmq_shards": config.get("rabbitmq_shards"),
+        "rabbitmq_use_existing_entities": "True" if config.get("rabbitmq_queue_type") == "quorum" else "False",
         "senzing_database_url": senzing_database_url,
+        "senzing_database_url_direct": senzing_database_url_direct,
+        "senzing_database_url_libfeat": cluster_database_urls.get("libfeat", ""),
+        "senzing_database_url_res": cluster_database_urls.get("res", ""),
         "senzing_project_dir_suffix": "",
-        "sql_connection": sql_connection
+        "sql_connection": sql_connection,
+        "stream_loader_delay_on_error_in_seconds": config.get("stream_loader_delay_on_error_in_seconds"),
+        "stream_loader_monitoring_period_in_seconds": config.get("stream_loader_monitoring_period_in_seconds"),
+        "stream_loader_prefetch_count": config.get("stream_loader_prefetch_count"),
+        "stream_loader_threads_per_process": config.get("stream_loader_threads_per_process"),
+        "stream_producer_input": config.get("stream_producer_input") or "",
+        "stream_producer_ranges": config.get("stream_producer_ranges"),
+        "stream_producer_record_max": config.get("stream_producer_record_max"),
+        "stream_producer_record_monitor": config.get("stream_producer_record_monitor"),
     }
 
-    filename = "{0}/docker-environment-vars.sh".format(output_directory)
-    with open(filename, 'w') as file:
-        logging.info(message_warning(165, filename))
-        file.write(file_docker_environment_vars.__doc__.format(**variables))
-    os.chmod(filename, 0o755)
-
-    filename = "{0}/senzing-info.sh".format(output_directory)
-    with open(filename, 'w') as file:
-        logging.info(message_warning(165, filename))
-        file.write(file_senzing_info.__doc__.format(**variables))
-    os.chmod(filename, 0o755)
-
+    return variables
 
-def project_create_docker_environment_vars_macos(project_dir, project_name, docker_host_ip_addr, g2_database_url):
 
-    # Specify output directory and backup directory.
-
-    output_directory = "{0}/docker-bin".format(project_dir)
+def get_docker_environment_variables_macos(project_dir, project_name, docker_host_ip_addr, g2_database_url, config):
 
     # Calculate senzing_database_url.
 
     parsed_database_url = parse_database_url(g2_database_url)
     sql_connection = get_sql_connection(parsed_database_url)
+    senzing_database_url = g2_database_url
+    if config.get("database_pooler"):
+        senzing_database_url = get_pgbouncer_database_url(parsed_database_url, docker_host_ip_addr)
 
     schema = parsed_database_url.get("schema", "")
     if parsed_database_url.get("scheme", "") == "sqlite3":
@@ -3632,151 +5758,1357 @@ def project_create_docker_environment_vars_macos(project_dir, project_name, dock
         "database_protocol": parsed_database_url.get("protocol", ""),
         "database_username": parsed_database_url.get("username", ""),
         "docker_host_ip_addr": docker_host_ip_addr,
+        "docker_registry_mirror": "true" if config.get("docker_registry_mirror") else "false",
+        "docker_registry_url": get_docker_registry_url(config),
         "environment_updated": __updated__,
         "environment_version": __version__,
+        "postgres_instances": "core",
+        "postgres_parameters": get_postgres_parameters(config),
         "project_dir": project_dir,
         "project_name": project_name,
-        "senzing_database_url": g2_database_url,
+        "rabbitmq_dir": config.get("rabbitmq_dir") or "${SENZING_PROJECT_DIR}/var/rabbitmq",
+        "rabbitmq_erl_args": get_rabbitmq_erl_args(config),
+        "rabbitmq_queue_type": config.get("rabbitmq_queue_type"),
+        "rabbitmq_shards": config.get("rabbitmq_shards"),
+        "rabbitmq_use_existing_entities": "True" if config.get("rabbitmq_queue_type") == "quorum" else "False",
+        "senzing_database_url": senzing_database_url,
+        "senzing_database_url_direct": g2_database_url,
+        "senzing_database_url_libfeat": "",
+        "senzing_database_url_res": "",
         "senzing_project_dir_suffix": "/g2",
-        "sql_connection": sql_connection
+        "sql_connection": sql_connection,
+        "stream_loader_delay_on_error_in_seconds": config.get("stream_loader_delay_on_error_in_seconds"),
+        "stream_loader_monitoring_period_in_seconds": config.get("stream_loader_monitoring_period_in_seconds"),
+        "stream_loader_prefetch_count": config.get("stream_loader_prefetch_count"),
+        "stream_loader_threads_per_process": config.get("stream_loader_threads_per_process"),
+        "stream_producer_input": config.get("stream_producer_input") or "",
+        "stream_producer_ranges": config.get("stream_producer_ranges"),
+        "stream_producer_record_max": config.get("stream_producer_record_max"),
+        "stream_producer_record_monitor": config.get("stream_producer_record_monitor"),
+    }
+
+    return variables
+
+
+def project_create_setupenv_docker(config):
+
+    # Pull configuration variables
+
+    project_dir = config.get("project_dir")
+
+    output_filename = "{0}/docker-setupEnv".format(project_dir)
+
+    docstring = """#! /usr/bin/env bash
+
+export SENZING_PROJECT_DIR={project_dir}
+
+export SENZING_DATA_DIR=${{SENZING_PROJECT_DIR}}/data
+export SENZING_DATA_VERSION_DIR=${{SENZING_PROJECT_DIR}}/data
+export SENZING_ETC_DIR=${{SENZING_PROJECT_DIR}}/docker-etc
+export SENZING_G2_DIR=${{SENZING_PROJECT_DIR}}
+export SENZING_VAR_DIR=${{SENZING_PROJECT_DIR}}/var
+
+export POSTGRES_DIR=${{SENZING_PROJECT_DIR}}/var/postgres
+export RABBITMQ_DIR=${{SENZING_PROJECT_DIR}}/var/rabbitmq
+
+mkdir -p  ${{SENZING_PROJECT_DIR}}/var/postgres
+chmod 777 ${{SENZING_PROJECT_DIR}}/var/postgres
+
+mkdir -p  ${{SENZING_PROJECT_DIR}}/var/rabbitmq
+chmod 777 ${{SENZING_PROJECT_DIR}}/var/rabbitmq
+
+""".format(project_dir=project_dir)
+
+    # If output file exists and differs, back it up.  It stays in place until replaced.
+
+    if get_file_hash(output_filename) == get_content_hash(docstring):
+        logging.info(message_info(166, output_filename))
+        return
+    backup_path(project_dir, "docker-setupEnv", keep=True)
+
+    logging.info(message_info(165, output_filename))
+    write_file_atomically(output_filename, docstring, mode=0o755)
+
+
+def project_create_var_log_directory(project_dir):
+
+    # Specify output directory and backup directory.
+
+    output_directory = "{0}/var/log".format(project_dir)
+
+    # If output directory exists, back it up.
+
+    backup_path(project_dir, "var/log")
+
+    # Make .../var/log directory.
+
+    try:
+        os.makedirs(output_directory, exist_ok=True)
+    except PermissionError as err:
+        exit_error(702, output_directory, err)
+
+
+def project_modify_G2Module_ini(project_dir, database_cluster=False, sql_connection=None):
+    ''' Write <project>/docker-etc/G2Module.ini: <project>/etc/G2Module.ini with paths for docker.
+        The file is written once, with all modifications, so readers never see an intermediate version.
+    '''
+
+    g2module_ini_for_docker = {
+        "PIPELINE": {
+            "CONFIGPATH": "/etc/opt/senzing",
+            "LICENSEFILE": "/etc/opt/senzing/g2.lic",
+            "RESOURCEPATH": "/opt/senzing/g2/resources",
+            "SUPPORTPATH": "/opt/senzing/data",
+        },
+    }
+
+    # Synthesize variables.
+
+    host_filename = "{0}/etc/G2Module.ini".format(project_dir)
+    filename = "{0}/docker-etc/G2Module.ini".format(project_dir)
+
+    # Read G2Module.ini.
+
+    config_parser = configparser.ConfigParser()
+    config_parser.optionxform = str  # Maintain case of keys.
+    config_parser.read(host_filename)
+
+    #  Verify values.
+
+    logging.info(message_info(102, filename))
+    for section, options in g2module_ini_for_docker.items():
+        for option, docker_value in options.items():
+            try:
+                value = config_parser.get(section, option)
+                if value != docker_value:
+                    config_parser[section][option] = docker_value
+                    logging.info(message_info(103, section, option, value, docker_value))
+                else:
+                    logging.info(message_info(104, section, option, value))
+            except:
+                logging.info(message_info(105, section, option))
+
+    # If needed, modify SQL.CONNECTION
+
+    section = "SQL"
+    option = "CONNECTION"
+    try:
+        old_database_url = config_parser.get(section, option)
+        if old_database_url.find("sqlite") == 0:
+            new_database_url = "sqlite3://na:na@/var/opt/senzing/sqlite/G2C.db"
+            config_parser[section][option] = new_database_url
+            logging.info(message_info(103, section, option, old_database_url, new_database_url))
+    except:
+        logging.info(message_info(105, section, option))
+
+    # Remove SQL.G2CONFIGFILE option.
+
+    config_parser.remove_option('SQL', 'G2CONFIGFILE')
+    logging.info(message_info(106, 'SQL', 'G2CONFIGFILE'))
+
+    # Spread tables over a PostgreSQL cluster.
+
+    if database_cluster:
+        modify_G2Module_ini_cluster(config_parser, sql_connection)
+
+    # Write out contents, if changed.  The previous contents are backed up.
+
+    output = io.StringIO()
+    config_parser.write(output)
+    content = output.getvalue()
+
+    if get_file_hash(filename) == get_content_hash(content):
+        logging.info(message_info(166, filename))
+        return
+
+    backup = backup_begin("docker-etc")
+    if os.path.exists(filename):
+        backup_add_file(project_dir, backup, filename, "G2Module.ini", keep=True)
+    logging.info(message_info(119, filename, ""))
+    write_file_atomically(filename, content)
+    backup_commit(project_dir, backup)
+
+
+def modify_G2Module_ini_cluster(config_parser, sql_connection):
+    ''' Spread the tables in postgres_cluster_instances over their own PostgreSQL databases. '''
+
+    if not sql_connection:
+        try:
+            sql_connection = config_parser.get("SQL", "CONNECTION")
+        except:
+            logging.info(message_info(105, "SQL", "CONNECTION"))
+            return
+
+    parsed_database_connection = parse_database_connection(sql_connection)
+    scheme = parsed_database_connection.get("scheme")
+    if scheme != "postgresql":
+        logging.warning(message_warning(355, scheme))
+        return
+
+    # Add [SQL] BACKEND, [HYBRID] and one cluster section per instance.
+
+    modifications = {
+        "SQL": {
+            "BACKEND": "HYBRID",
+            "CONNECTION": sql_connection,
+        },
+        "HYBRID": {},
+    }
+    for instance, instance_values in postgres_cluster_instances.items():
+        cluster = instance_values.get("cluster")
+        for table in instance_values.get("tables"):
+            modifications["HYBRID"][table] = cluster
+        modifications[cluster] = {
+            "CLUSTER_SIZE": "1",
+            "DB_1": get_sql_connection(get_cluster_database_connection(parsed_database_connection, instance)),
+        }
+
+    for section, options in modifications.items():
+        if not config_parser.has_section(section):
+            config_parser.add_section(section)
+        for option, value in options.items():
+            config_parser[section][option] = value
+            logging.info(message_info(142, section, option, value))
+
+# -----------------------------------------------------------------------------
+# Backups
+# -----------------------------------------------------------------------------
+
+# Backups are kept in <project>/var/backups:
+#   objects/<xx>/<sha256>      Contents of a backed up file.  Stored once, however many backups include it.
+#   snapshots/<backup id>.json  One backup: the path backed up, when, and the object for each file.
+# A path is relative to <project>.  Files in a backup are relative to that path; "." is the path itself.
+
+backup_legacy_paths = [
+    "docker-bin",
+    "docker-etc",
+    "docker-setupEnv",
+    "var/log",
+]
+
+
+def get_backups_dir(project_dir):
+    return "{0}/var/backups".format(project_dir)
+
+
+def get_backup_object_filename(project_dir, sha256):
+    return "{0}/objects/{1}/{2}".format(get_backups_dir(project_dir), sha256[:2], sha256)
+
+
+def get_file_sha256(filename):
+    sha256 = hashlib.sha256()
+    with open(filename, 'rb') as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b''):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def get_backups(project_dir):
+    ''' Return all backups, oldest first. '''
+
+    result = []
+    snapshots_dir = "{0}/snapshots".format(get_backups_dir(project_dir))
+    if os.path.isdir(snapshots_dir):
+        for filename in os.listdir(snapshots_dir):
+            if filename.endswith(".json"):
+                with open("{0}/{1}".format(snapshots_dir, filename), 'r') as file:
+                    result.append(json.load(file))
+    return sorted(result, key=lambda x: (x.get("timestamp"), x.get("id")))
+
+
+def backup_begin(path, timestamp=None):
+    ''' Start a backup of <project>/<path>.  Add files with backup_add_file(), then call backup_commit(). '''
+
+    return {
+        "path": path,
+        "timestamp": int(time.time()) if timestamp is None else timestamp,
+        "files": {},
+        "new_objects": 0,
+    }
+
+
+def backup_add_file(project_dir, backup, filename, relative_path, keep=False):
+    ''' Move filename into the backup as <path>/<relative_path>.  With keep=True, filename is left in place. '''
+
+    file_stat = os.stat(filename)
+    sha256 = get_file_sha256(filename)
+    object_filename = get_backup_object_filename(project_dir, sha256)
+
+    # Identical contents are stored once.
+    # Hard links and symbolic links are copied, so the stored object cannot change later.
+
+    if os.path.exists(object_filename):
+        if not keep:
+            os.remove(filename)
+    else:
+        os.makedirs(os.path.dirname(object_filename), exist_ok=True)
+        if keep or os.path.islink(filename) or file_stat.st_nlink > 1:
+            shutil.copyfile(filename, object_filename)
+            if not keep:
+                os.remove(filename)
+        else:
+            shutil.move(filename, object_filename)
+        backup["new_objects"] += 1
+
+    backup["files"][relative_path] = {
+        "mode": stat.S_IMODE(file_stat.st_mode),
+        "sha256": sha256,
+        "size": file_stat.st_size,
+    }
+
+
+def backup_commit(project_dir, backup):
+    ''' Record the backup.  Return its id, or None if it has no files. '''
+
+    if not backup["files"]:
+        return None
+
+    path = backup["path"]
+
+    # A backup identical to the latest backup of the same path is not recorded again.
+
+    backups = [x for x in get_backups(project_dir) if x.get("path") == path]
+    if backups and backups[-1].get("files") == backup["files"]:
+        logging.info(message_info(181, path, backups[-1].get("id")))
+        return backups[-1].get("id")
+
+    # Write snapshot.
+
+    snapshots_dir = "{0}/snapshots".format(get_backups_dir(project_dir))
+    os.makedirs(snapshots_dir, exist_ok=True)
+    backup_id_prefix = "{0}-{1}".format(backup["timestamp"], path.replace("/", "-"))
+    backup_id = backup_id_prefix
+    suffix = 1
+    while os.path.exists("{0}/{1}.json".format(snapshots_dir, backup_id)):
+        suffix += 1
+        backup_id = "{0}-{1}".format(backup_id_prefix, suffix)
+
+    snapshot = {
+        "id": backup_id,
+        "path": path,
+        "timestamp": backup["timestamp"],
+        "files": backup["files"],
     }
+    write_file_atomically("{0}/{1}.json".format(snapshots_dir, backup_id), json.dumps(snapshot, indent=2, sort_keys=True) + "\n")
+
+    logging.info(message_info(180, backup_id, path, len(backup["files"]), backup["new_objects"]))
+    return backup_id
+
+
+def backup_path(project_dir, path, timestamp=None, source=None, keep=False):
+    ''' Move <project>/<path>, a file or directory, into a backup.  source overrides where it is read from.
+        With keep=True, a file is left in place.
+    '''
+
+    if source is None:
+        source = "{0}/{1}".format(project_dir, path)
+    if not os.path.lexists(source):
+        return None
+
+    backup = backup_begin(path, timestamp)
+    if os.path.isdir(source):
+        for directory, subdirectories, filenames in os.walk(source):
+            for filename in filenames:
+                full_filename = os.path.join(directory, filename)
+                backup_add_file(project_dir, backup, full_filename, os.path.relpath(full_filename, source))
+        shutil.rmtree(source)
+    else:
+        backup_add_file(project_dir, backup, source, ".", keep=keep)
+
+    return backup_commit(project_dir, backup)
+
+
+def backups_import_legacy(project_dir):
+    ''' Move <name>.<epoch> backups made by earlier versions into <project>/var/backups. '''
+
+    legacy_backups = []
+
+    # <project>/docker-etc.<epoch>, <project>/var/log.<epoch>, ...
+
+    for path in backup_legacy_paths:
+        parent_dir, name = os.path.split("{0}/{1}".format(project_dir, path))
+        if not os.path.isdir(parent_dir):
+            continue
+        for entry in os.listdir(parent_dir):
+            match = re.fullmatch(re.escape(name) + r"\.([0-9]+)", entry)
+            if match:
+                legacy_backups.append((int(match.group(1)), path, os.path.join(parent_dir, entry)))
+
+    # <project>/docker-bin/<file>.<epoch>
+
+    docker_bin_dir = "{0}/docker-bin".format(project_dir)
+    if os.path.isdir(docker_bin_dir):
+        for entry in os.listdir(docker_bin_dir):
+            match = re.fullmatch(r"(.+\.sh)\.([0-9]+)", entry)
+            if match:
+                legacy_backups.append((int(match.group(2)), "docker-bin/{0}".format(match.group(1)), os.path.join(docker_bin_dir, entry)))
+
+    for timestamp, path, source in sorted(legacy_backups):
+        backup_id = backup_path(project_dir, path, timestamp=timestamp, source=source)
+        logging.info(message_info(185, source, backup_id))
+
+
+def backups_prune(project_dir, keep_count, keep_days):
+    ''' Keep the newest keep_count backups of each path and any younger than keep_days.  Remove the rest. '''
+
+    backups_dir = get_backups_dir(project_dir)
+    cutoff = time.time() - (keep_days * 24 * 60 * 60)
+    kept = []
+    removed = 0
+    count_by_path = {}
+
+    for backup in reversed(get_backups(project_dir)):
+        path = backup.get("path")
+        count_by_path[path] = count_by_path.get(path, 0) + 1
+        if count_by_path[path] <= keep_count or (keep_days > 0 and backup.get("timestamp", 0) >= cutoff):
+            kept.append(backup)
+        else:
+            os.remove("{0}/snapshots/{1}.json".format(backups_dir, backup.get("id")))
+            removed += 1
+
+    # Remove objects no remaining backup refers to.
+
+    referenced = set()
+    for backup in kept:
+        for entry in backup.get("files", {}).values():
+            referenced.add(entry.get("sha256"))
+
+    removed_objects = 0
+    removed_bytes = 0
+    objects_dir = "{0}/objects".format(backups_dir)
+    if os.path.isdir(objects_dir):
+        for directory, subdirectories, filenames in os.walk(objects_dir, topdown=False):
+            for filename in filenames:
+                if filename not in referenced:
+                    full_filename = os.path.join(directory, filename)
+                    removed_bytes += os.path.getsize(full_filename)
+                    os.remove(full_filename)
+                    removed_objects += 1
+            if directory != objects_dir and not os.listdir(directory):
+                os.rmdir(directory)
+
+    logging.info(message_info(183, removed, len(kept), removed_objects, removed_bytes))
+
+
+def backups_restore(project_dir, backup_id):
+    ''' Put the files in a backup back in place.  Files being replaced are backed up first. '''
+
+    backups = {x.get("id"): x for x in get_backups(project_dir)}
+    backup = backups.get(backup_id)
+    if not backup:
+        exit_error(706, backup_id)
+
+    path = backup.get("path")
+    current = backup_begin(path)
+    for relative_path, entry in sorted(backup.get("files", {}).items()):
+        target = os.path.normpath(os.path.join(project_dir, path, relative_path))
+        if os.path.lexists(target):
+            if os.path.isfile(target) and get_file_sha256(target) == entry.get("sha256"):
+                continue
+            backup_add_file(project_dir, current, target, relative_path, keep=True)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(get_backup_object_filename(project_dir, entry.get("sha256")), 'rb') as file:
+            write_file_atomically(target, file.read(), mode=entry.get("mode"))
+        logging.info(message_info(184, target, backup_id))
+    backup_commit(project_dir, current)
+
+# -----------------------------------------------------------------------------
+# Orchestration
+# -----------------------------------------------------------------------------
+
+# Dependencies between the scripts in <project>/docker-bin.
+# A script's "up" is run as soon as the scripts it depends on have come up.
+# The demos bundle their own API server and use neither RabbitMQ nor a stream-loader,
+# so they only need an initialized database.
+
+docker_bin_dependencies = {
+    "portainer.sh": [],
+    "postgres.sh": [],
+    "senzing-api-server.sh": ["senzing-init-container.sh"],
+    "senzing-db2-driver-installer.sh": [],
+    "senzing-debug.sh": ["senzing-init-container.sh"],
+    "senzing-init-container.sh": ["senzing-db2-driver-installer.sh", "senzing-mssql-driver-installer.sh", "senzing-pgbouncer.sh", "senzing-postgresql-init.sh"],
+    "senzing-jupyter.sh": ["senzing-init-container.sh"],
+    "senzing-mssql-driver-installer.sh": [],
+    "senzing-pgbouncer.sh": ["postgres.sh"],
+    "senzing-phppgadmin.sh": ["postgres.sh"],
+    "senzing-postgresql-init.sh": ["postgres.sh"],
+    "senzing-quickstart-demo.sh": ["senzing-init-container.sh"],
+    "senzing-rabbitmq.sh": [],
+    "senzing-registry-mirror.sh": [],
+    "senzing-sqlite-web.sh": ["senzing-init-container.sh"],
+    "senzing-sshd.sh": ["senzing-init-container.sh"],
+    "senzing-stream-loader.sh": ["senzing-init-container.sh", "senzing-rabbitmq.sh"],
+    "senzing-stream-producer.sh": ["senzing-rabbitmq.sh"],
+    "senzing-webapp.sh": ["senzing-api-server.sh"],
+    "senzing-webapp-demo.sh": ["senzing-init-container.sh"],
+    "senzing-xterm.sh": ["senzing-init-container.sh"],
+    "senzing-yum.sh": [],
+    "swagger-ui.sh": [],
+}
+
+# Scripts that run an interactive shell instead of "up" and "down".  "up" refuses them.
+
+docker_bin_interactive_files = [
+    "senzing-console.sh",
+]
+
+# Dependencies that only exist when the Senzing database is the PostgreSQL container.
+
+docker_bin_postgresql_files = [
+    "postgres.sh",
+    "senzing-postgresql-init.sh",
+]
+
+# Dependencies that only exist when the database needs a driver that is not yet installed.
+# {scheme: (script, variable naming the directory the script installs into)}
+
+docker_bin_driver_installer_files = {
+    "db2": ("senzing-db2-driver-installer.sh", "SENZING_OPT_IBM_DIR"),
+    "mssql": ("senzing-mssql-driver-installer.sh", "SENZING_OPT_MICROSOFT_DIR"),
+}
+
+# Dependencies that only exist when SENZING_DATABASE_URL connects through the pooler.
+
+docker_bin_pgbouncer_files = [
+    "senzing-pgbouncer.sh",
+]
+
+# When images are pulled through the pull-through cache, every script depends on it.
+
+docker_bin_registry_mirror_file = "senzing-registry-mirror.sh"
+
+
+def get_project_sql_connection(project_dir):
+    ''' Return SQL.CONNECTION in <project>/docker-etc/G2Module.ini. '''
+
+    filename = "{0}/docker-etc/G2Module.ini".format(project_dir)
+    config_parser = configparser.ConfigParser()
+    config_parser.optionxform = str  # Maintain case of keys.
+    config_parser.read(filename)
+    try:
+        return config_parser.get("SQL", "CONNECTION")
+    except:
+        return ""
+
+
+def get_project_database_scheme(project_dir):
+    ''' Return the scheme of SQL.CONNECTION in <project>/docker-etc/G2Module.ini. '''
+
+    sql_connection = get_project_sql_connection(project_dir)
+    return sql_connection[:sql_connection.find(":")]
+
+
+def get_project_uses_postgres_container(project_dir):
+    ''' Return True if SQL.CONNECTION in <project>/docker-etc/G2Module.ini is the database of postgres.sh. '''
+
+    sql_connection = get_project_sql_connection(project_dir)
+    if not sql_connection.startswith("postgresql:"):
+        return False
+    try:
+        parsed_database_connection = parse_database_connection(sql_connection)
+    except Exception:
+        return False
+
+    # postgres.sh publishes its port on the docker host and is named after the project.
+
+    environment = get_project_environment(project_dir, ["SENZING_DOCKER_HOST_IP_ADDR", "SENZING_DOCKER_PORT_POSTGRES", "SENZING_DOCKER_CONTAINER_NAME_POSTGRES"])
+    hostnames = ["localhost", "127.0.0.1", environment.get("SENZING_DOCKER_HOST_IP_ADDR"), environment.get("SENZING_DOCKER_CONTAINER_NAME_POSTGRES")]
+    return parsed_database_connection.get("hostname") in hostnames \
+        and parsed_database_connection.get("port") == (environment.get("SENZING_DOCKER_PORT_POSTGRES") or "5432")
+
+
+def get_project_driver_installers(project_dir):
+    ''' Return the driver installer scripts the database of <project> needs, unless their drivers are already installed. '''
+
+    script, variable = docker_bin_driver_installer_files.get(get_project_database_scheme(project_dir), (None, None))
+    if not script:
+        return []
+    driver_dir = get_project_environment(project_dir, [variable]).get(variable)
+    if driver_dir and os.path.isdir(driver_dir) and os.listdir(driver_dir):
+        return []
+    return [script]
+
+
+def get_project_uses_pgbouncer(project_dir):
+    ''' Return True if SENZING_DATABASE_URL in <project>/docker-bin/docker-environment-vars.sh differs from the direct URL. '''
+
+    filename = "{0}/docker-bin/docker-environment-vars.sh".format(project_dir)
+    values = {}
+    try:
+        with open(filename, 'r') as file:
+            for line in file:
+                for key in ["SENZING_DATABASE_URL", "SENZING_DATABASE_URL_DIRECT"]:
+                    prefix = "export {0}=".format(key)
+                    if line.startswith(prefix):
+                        values[key] = line[len(prefix):].strip()
+    except OSError:
+        return False
+    return values.get("SENZING_DATABASE_URL", "") != values.get("SENZING_DATABASE_URL_DIRECT", "")
+
+
+def get_project_uses_registry_mirror(project_dir):
+    ''' Return True if <project>/docker-bin/docker-environment-vars.sh pulls images through senzing-registry-mirror.sh. '''
+
+    filename = "{0}/docker-bin/docker-environment-vars.sh".format(project_dir)
+    try:
+        with open(filename, 'r') as file:
+            return "export SENZING_DOCKER_REGISTRY_MIRROR=true\n" in file
+    except OSError:
+        return False
+
+
+def get_docker_bin_graph(services, include_postgresql, include_pgbouncer, include_registry_mirror=False, include_driver_installers=None):
+    ''' Return {script: [dependencies]} for services and everything they depend on.
+        include_driver_installers lists the driver installer scripts to keep as dependencies.
+    '''
+
+    driver_installer_files = [x[0] for x in docker_bin_driver_installer_files.values()]
+    include_driver_installers = include_driver_installers or []
+
+    result = {}
+    pending = list(services)
+    while pending:
+        service = pending.pop()
+        if service in result:
+            continue
+        dependencies = docker_bin_dependencies.get(service, [])
+        if not include_postgresql:
+            dependencies = [x for x in dependencies if x not in docker_bin_postgresql_files]
+        if not include_pgbouncer:
+            dependencies = [x for x in dependencies if x not in docker_bin_pgbouncer_files]
+        dependencies = [x for x in dependencies if x not in driver_installer_files or x in include_driver_installers]
+        if include_registry_mirror and service != docker_bin_registry_mirror_file:
+            dependencies = dependencies + [docker_bin_registry_mirror_file]
+        result[service] = dependencies
+        pending.extend(dependencies)
+    return result
+
+
+def get_project_docker_bin_graph(project_dir, services):
+    ''' Return get_docker_bin_graph() for services, with the optional dependencies <project> is configured for. '''
+
+    return get_docker_bin_graph(
+        services,
+        get_project_uses_postgres_container(project_dir),
+        get_project_uses_pgbouncer(project_dir),
+        get_project_uses_registry_mirror(project_dir),
+        get_project_driver_installers(project_dir),
+    )
+
+
+def run_docker_bin_script(project_dir, filename, action, arguments=None):
+    ''' Run "<project>/docker-bin/<filename> <action> [arguments]". Return (returncode, output, elapsed_time). '''
+
+    start_time = time.time()
+    completed_process = subprocess.run(
+        ["{0}/docker-bin/{1}".format(project_dir, filename), action] + (arguments or []),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        universal_newlines=True,
+    )
+    return completed_process.returncode, completed_process.stdout, time.time() - start_time
+
+
+def run_docker_bin_graph(project_dir, graph, arguments=None):
+    ''' Run "up" for every script in graph, each as soon as its dependencies are up. Return failed scripts.
+        arguments is {script: [arguments]} for scripts that need more than "up".
+    '''
+
+    arguments = arguments or {}
+
+    remaining = {key: set(value) for key, value in graph.items()}
+    succeeded = set()
+    failed = set()
+    running = {}
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(len(graph), 1)) as executor:
+        while remaining or running:
+
+            # Skip scripts that depend on a failed script.
+
+            skipped = True
+            while skipped:
+                skipped = False
+                for service, dependencies in list(remaining.items()):
+                    failed_dependencies = dependencies & failed
+                    if failed_dependencies:
+                        logging.warning(message_warning(353, service, ", ".join(sorted(failed_dependencies))))
+                        failed.add(service)
+                        remaining.pop(service)
+                        skipped = True
+
+            # Start scripts whose dependencies are all up.
+
+            for service in sorted(remaining):
+                if remaining[service] <= succeeded:
+                    remaining.pop(service)
+                    logging.info(message_info(130, service))
+                    running[executor.submit(run_docker_bin_script, project_dir, service, "up", arguments.get(service))] = service
+
+            if not running:
+                break
+
+            # Wait for the next script to finish.
+
+            done, not_done = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                service = running.pop(future)
+                returncode, output, elapsed_time = future.result()
+                logging.debug(message_debug(999, output))
+                if returncode == 0:
+                    logging.info(message_info(131, service, elapsed_time))
+                    succeeded.add(service)
+                else:
+                    logging.error(message_error(703, service, returncode, output))
+                    failed.add(service)
+
+    # Anything still remaining is part of a dependency cycle.
+
+    failed.update(remaining)
+    return failed
+
+# -----------------------------------------------------------------------------
+# Synthetic records
+# -----------------------------------------------------------------------------
+
+# Values synthetic records are made from.  See generate_records().
+
+synthetic_first_names = [
+    "AHMED", "ALEXANDER", "ANA", "ANDREW", "ANNA", "ANTHONY", "BARBARA", "CARLOS", "CATHERINE", "CHARLES",
+    "CHRISTOPHER", "DANIEL", "DAVID", "DEBORAH", "EDWARD", "ELIZABETH", "EMILY", "FATIMA", "FRANCISCO", "GRACE",
+    "HANNAH", "HIROSHI", "IVAN", "JAMES", "JENNIFER", "JESSICA", "JOHN", "JOSE", "JOSEPH", "JULIA",
+    "KATHERINE", "KENNETH", "LAURA", "LEILA", "LINDA", "MARGARET", "MARIA", "MARK", "MATTHEW", "MICHAEL",
+    "MOHAMMED", "NANCY", "NICHOLAS", "OLIVIA", "PATRICIA", "PETER", "PRIYA", "RAJESH", "RICHARD", "ROBERT",
+    "SAMUEL", "SARAH", "SOFIA", "STEPHEN", "SUSAN", "THOMAS", "TIMOTHY", "VICTORIA", "WEI", "WILLIAM",
+]
+
+synthetic_nicknames = {
+    "ALEXANDER": "ALEX", "ANDREW": "ANDY", "ANTHONY": "TONY", "BARBARA": "BARB", "CATHERINE": "CATHY",
+    "CHARLES": "CHUCK", "CHRISTOPHER": "CHRIS", "DANIEL": "DAN", "DAVID": "DAVE", "DEBORAH": "DEBBIE",
+    "EDWARD": "ED", "ELIZABETH": "LIZ", "FRANCISCO": "PACO", "JAMES": "JIM", "JENNIFER": "JEN",
+    "JESSICA": "JESS", "JOHN": "JACK", "JOSEPH": "JOE", "KATHERINE": "KATE", "KENNETH": "KEN",
+    "MARGARET": "PEGGY", "MATTHEW": "MATT", "MICHAEL": "MIKE", "NICHOLAS": "NICK", "PATRICIA": "PATTY",
+    "RICHARD": "DICK", "ROBERT": "BOB", "SAMUEL": "SAM", "STEPHEN": "STEVE", "SUSAN": "SUE",
+    "THOMAS": "TOM", "TIMOTHY": "TIM", "VICTORIA": "VICKY", "WILLIAM": "BILL",
+}
+
+synthetic_last_names = [
+    "ADAMS", "ALI", "ANDERSON", "BAKER", "BROWN", "CHEN", "CLARK", "DAVIS", "DIAZ", "EVANS",
+    "FERNANDEZ", "GARCIA", "GONZALEZ", "GREEN", "HALL", "HARRIS", "HERNANDEZ", "HILL", "JACKSON", "JOHNSON",
+    "JONES", "KHAN", "KIM", "KUMAR", "LEE", "LEWIS", "LOPEZ", "MARTIN", "MARTINEZ", "MILLER",
+    "MOORE", "MORALES", "MURPHY", "NELSON", "NGUYEN", "OKAFOR", "PATEL", "PEREZ", "RAMIREZ", "ROBINSON",
+    "RODRIGUEZ", "ROSSI", "SANCHEZ", "SCOTT", "SHAH", "SINGH", "SMITH", "SUZUKI", "TANAKA", "TAYLOR",
+    "THOMAS", "THOMPSON", "TORRES", "WALKER", "WANG", "WHITE", "WILLIAMS", "WILSON", "WRIGHT", "YOUNG",
+]
+
+synthetic_streets = [
+    "BIRCH", "BROADWAY", "CEDAR", "CHERRY", "CHESTNUT", "ELM", "FOREST", "FRANKLIN", "HICKORY", "HIGHLAND",
+    "HILL", "JACKSON", "JEFFERSON", "LAKE", "LAKEVIEW", "LINCOLN", "MADISON", "MAIN", "MAPLE", "MEADOW",
+    "MILL", "OAK", "PARK", "PINE", "RIDGE", "RIVER", "SPRING", "SUNSET", "WALNUT", "WASHINGTON",
+]
+
+synthetic_street_suffixes = [
+    ("AVENUE", "AVE"),
+    ("BOULEVARD", "BLVD"),
+    ("COURT", "CT"),
+    ("DRIVE", "DR"),
+    ("LANE", "LN"),
+    ("ROAD", "RD"),
+    ("STREET", "ST"),
+    ("WAY", "WAY"),
+]
+
+# (city, state, first 3 digits of postal code, area code)
+
+synthetic_cities = [
+    ("ATLANTA", "GA", "303", "404"), ("AUSTIN", "TX", "787", "512"), ("BALTIMORE", "MD", "212", "410"),
+    ("BOSTON", "MA", "021", "617"), ("CHARLOTTE", "NC", "282", "704"), ("CHICAGO", "IL", "606", "312"),
+    ("CLEVELAND", "OH", "441", "216"), ("DALLAS", "TX", "752", "214"), ("DENVER", "CO", "802", "303"),
+    ("DETROIT", "MI", "482", "313"), ("HOUSTON", "TX", "770", "713"), ("INDIANAPOLIS", "IN", "462", "317"),
+    ("KANSAS CITY", "MO", "641", "816"), ("LAS VEGAS", "NV", "891", "702"), ("LOS ANGELES", "CA", "900", "213"),
+    ("MIAMI", "FL", "331", "305"), ("MINNEAPOLIS", "MN", "554", "612"), ("NASHVILLE", "TN", "372", "615"),
+    ("NEW YORK", "NY", "100", "212"), ("OMAHA", "NE", "681", "402"), ("PHILADELPHIA", "PA", "191", "215"),
+    ("PHOENIX", "AZ", "850", "602"), ("PITTSBURGH", "PA", "152", "412"), ("PORTLAND", "OR", "972", "503"),
+    ("SACRAMENTO", "CA", "958", "916"), ("SALT LAKE CITY", "UT", "841", "801"), ("SAN DIEGO", "CA", "921", "619"),
+    ("SEATTLE", "WA", "981", "206"), ("ST LOUIS", "MO", "631", "314"), ("TAMPA", "FL", "336", "813"),
+]
+
+synthetic_hash_mask = 0xFFFFFFFFFFFFFFFF
+
+
+def get_synthetic_hash(seed, entity_id, salt):
+    ''' Return a 64-bit hash of (seed, entity_id, salt).  A splitmix64 step. '''
+
+    value = (seed * 0x9E3779B97F4A7C15 + entity_id * 0xD1B54A32D192ED03 + salt) & synthetic_hash_mask
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & synthetic_hash_mask
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & synthetic_hash_mask
+    return value ^ (value >> 31)
+
+
+def get_synthetic_entity(seed, entity_id):
+    ''' Return the attributes of entity number entity_id.  They are computed, not stored, so any entity can be revisited. '''
+
+    value = get_synthetic_hash(seed, entity_id, 1)
+    value, first_name = divmod(value, len(synthetic_first_names))
+    value, last_name = divmod(value, len(synthetic_last_names))
+    value, birth = divmod(value, 66 * 12 * 28)
+    value, house_number = divmod(value, 9999)
+    value, street = divmod(value, len(synthetic_streets))
+    value, street_suffix = divmod(value, len(synthetic_street_suffixes))
+    value, data_source = divmod(value, 1 << 16)
+
+    value = get_synthetic_hash(seed, entity_id, 2)
+    value, city = divmod(value, len(synthetic_cities))
+    value, postal_code = divmod(value, 100)
+    value, phone_exchange = divmod(value, 800)
+    value, phone_line = divmod(value, 10000)
+
+    return {
+        "first_name": synthetic_first_names[first_name],
+        "last_name": synthetic_last_names[last_name],
+        "birth_year": 1940 + birth % 66,
+        "birth_month": 1 + birth // 66 % 12,
+        "birth_day": 1 + birth // (66 * 12),
+        "house_number": 1 + house_number,
+        "street": synthetic_streets[street],
+        "street_suffix": synthetic_street_suffixes[street_suffix],
+        "city": synthetic_cities[city],
+        "postal_code": postal_code,
+        "phone_exchange": 200 + phone_exchange,
+        "phone_line": phone_line,
+        "data_source": data_source,
+    }
+
+
+def get_synthetic_record(entity, generator, variant):
+    ''' Return Senzing attributes for entity.  A variant drops or reformats values the way a second source might. '''
+
+    first_name = entity["first_name"]
+    last_name = entity["last_name"]
+    city, state, postal_prefix, area_code = entity["city"]
+    street_suffix, street_suffix_abbreviation = entity["street_suffix"]
+    date_of_birth = "{0}-{1:02d}-{2:02d}".format(entity["birth_year"], entity["birth_month"], entity["birth_day"])
+    phone_number = "{0}-{1}-{2:04d}".format(area_code, entity["phone_exchange"], entity["phone_line"])
+    has_address = True
+
+    if variant:
+        choice = generator.random()
+        if choice < 0.2:
+            first_name = synthetic_nicknames.get(first_name, first_name)
+        elif choice < 0.3:
+            first_name = first_name[0]
+        elif choice < 0.45:
+            position = generator.randrange(len(last_name) - 1)
+            last_name = last_name[:position] + last_name[position + 1] + last_name[position] + last_name[position + 2:]
+
+        choice = generator.random()
+        if choice < 0.2:
+            date_of_birth = None
+        elif choice < 0.4:
+            date_of_birth = "{0:02d}/{1:02d}/{2}".format(entity["birth_month"], entity["birth_day"], entity["birth_year"])
+
+        choice = generator.random()
+        if choice < 0.25:
+            has_address = False
+        elif choice < 0.65:
+            street_suffix = street_suffix_abbreviation
+
+        choice = generator.random()
+        if choice < 0.3:
+            phone_number = None
+        elif choice < 0.6:
+            phone_number = "({0}) {1}-{2:04d}".format(area_code, entity["phone_exchange"], entity["phone_line"])
+
+    result = {
+        "NAME_FIRST": first_name,
+        "NAME_LAST": last_name,
+    }
+    if date_of_birth:
+        result["DATE_OF_BIRTH"] = date_of_birth
+    if has_address:
+        result["ADDR_LINE1"] = "{0} {1} {2}".format(entity["house_number"], entity["street"], street_suffix)
+        result["ADDR_CITY"] = city
+        result["ADDR_STATE"] = state
+        result["ADDR_POSTAL_CODE"] = "{0}{1:02d}".format(postal_prefix, entity["postal_code"])
+    if phone_number:
+        result["PHONE_NUMBER"] = phone_number
+    return result
+
+
+def generate_records(count, seed, duplicate_rate, overlap_rate, data_sources):
+    ''' Yield count synthetic Senzing records as JSON lines.
+
+        A record is a new entity in its home data source,
+        a duplicate: a variant of an earlier entity in its home data source,
+        or an overlap: a variant of an earlier entity in another data source.
+        Entities are recomputed from their number, so memory use does not grow with count.
+    '''
+
+    generator = random.Random(seed)
+    entities = 0
+    for record_id in range(1, count + 1):
+        choice = generator.random()
+        if entities and choice < duplicate_rate + overlap_rate:
+            entity = get_synthetic_entity(seed, generator.randrange(entities))
+            data_source = entity["data_source"] % len(data_sources)
+            if choice >= duplicate_rate and len(data_sources) > 1:
+                data_source = (data_source + 1 + generator.randrange(len(data_sources) - 1)) % len(data_sources)
+            variant = True
+        else:
+            entity = get_synthetic_entity(seed, entities)
+            entities += 1
+            data_source = entity["data_source"] % len(data_sources)
+            variant = False
+        record = {
+            "DATA_SOURCE": data_sources[data_source],
+            "RECORD_ID": str(record_id),
+        }
+        record.update(get_synthetic_record(entity, generator, variant))
+        yield json.dumps(record) + "\n"
+
+
+def write_records(lines, files, chunk_size=1000):
+    ''' Write lines to files, chunk_size lines at a time, round-robin.  Return the number of lines written. '''
+
+    result = 0
+    chunk = []
+    file_index = 0
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) == chunk_size:
+            files[file_index].write("".join(chunk))
+            result += len(chunk)
+            chunk = []
+            file_index = (file_index + 1) % len(files)
+    if chunk:
+        files[file_index].write("".join(chunk))
+        result += len(chunk)
+    return result
+
+
+def open_fifo_for_writing(filename, abandon):
+    ''' Open the named pipe filename for writing once a reader has opened it.  Return None if abandon() is true first. '''
+
+    while True:
+        try:
+            file_descriptor = os.open(filename, os.O_WRONLY | os.O_NONBLOCK)
+        except OSError as err:
+            if err.errno != errno.ENXIO:
+                raise
+            if abandon():
+                return None
+            time.sleep(0.1)
+            continue
+        os.set_blocking(file_descriptor, True)
+        return os.fdopen(file_descriptor, "w")
+
+
+def send_records_to_rabbitmq(project_dir, lines, ranges):
+    ''' Send lines to RabbitMQ through "senzing-stream-producer.sh" reading from named pipes, one per range.
+        Return the number of lines written.
+    '''
+
+    fifo_dir = "{0}/var/stream-producer/generate-records".format(project_dir)
+    shutil.rmtree(fifo_dir, ignore_errors=True)
+    os.makedirs(fifo_dir)
+    fifo_filenames = ["{0}/range-{1:04d}.json".format(fifo_dir, x) for x in range(1, ranges + 1)]
+    for fifo_filename in fifo_filenames:
+        os.mkfifo(fifo_filename, 0o600)
+
+    # Each stream-producer opens its pipe when its container starts.
+    # Give up if senzing-stream-producer.sh fails, or its containers do not open their pipes within a minute of it finishing.
+
+    files = []
+    result = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        producer = executor.submit(run_docker_bin_script, project_dir, "senzing-stream-producer.sh", "up", ["--input", fifo_dir, "--record-max", "0"])
+
+        def abandon():
+            if not producer.done():
+                return False
+            returncode, output, elapsed_time = producer.result()
+            return returncode != 0 or time.time() - producer_start_time - elapsed_time > 60
+
+        producer_start_time = time.time()
+        try:
+            for fifo_filename in fifo_filenames:
+                file = open_fifo_for_writing(fifo_filename, abandon)
+                if file is None:
+                    break
+                files.append(file)
+            if len(files) == len(fifo_filenames):
+                result = write_records(lines, files)
+        except BrokenPipeError:
+            result = 0
+        finally:
+            for file in files:
+                try:
+                    file.close()
+                except BrokenPipeError:
+                    pass
+
+        returncode, output, elapsed_time = producer.result()
+        if returncode != 0:
+            exit_error(703, "senzing-stream-producer.sh", returncode, output)
+
+    shutil.rmtree(fifo_dir, ignore_errors=True)
+    return result
+
+# -----------------------------------------------------------------------------
+# Benchmark
+# -----------------------------------------------------------------------------
+
+# Values of <project>/docker-bin/docker-environment-vars.sh used by benchmark-load.
+
+benchmark_environment_variables = [
+    "SENZING_DOCKER_HOST_IP_ADDR",
+    "SENZING_DOCKER_PORT_RABBITMQ_UI",
+    "SENZING_LOG_STREAM_LOADER",
+    "SENZING_RABBITMQ_PASSWORD",
+    "SENZING_RABBITMQ_QUEUE",
+    "SENZING_RABBITMQ_QUEUE_TYPE",
+    "SENZING_RABBITMQ_SHARDS",
+    "SENZING_RABBITMQ_USERNAME",
+    "SENZING_STREAM_LOADER_DATA_SOURCE",
+    "SENZING_STREAM_LOADER_PREFETCH_COUNT",
+    "SENZING_STREAM_LOADER_REPLICAS",
+    "SENZING_STREAM_LOADER_THREADS_PER_PROCESS",
+    "SENZING_STREAM_PRODUCER_RANGES",
+]
+
+# Senzing message ids ending in "E" are errors, e.g. "senzing-50070123E".
+
+benchmark_loader_error_pattern = re.compile(rb"senzing-[0-9]{8}E")
+
+# Number of records, evenly spaced through the dataset, whose latency is estimated.
+
+benchmark_latency_points = 1000
+
+
+def get_project_environment(project_dir, names):
+    ''' Return {name: value} for names in <project>/docker-bin/docker-environment-vars.sh, as bash expands them. '''
+
+    completed_process = subprocess.run(
+        ["bash", "-c", 'source "$0" > /dev/null 2>&1; for NAME in "$@"; do echo "${!NAME}"; done', "{0}/docker-bin/docker-environment-vars.sh".format(project_dir)] + names,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    return dict(zip(names, completed_process.stdout.split("\n")))
+
+
+def write_benchmark_dataset(filename, records, seed, data_source):
+    ''' Write records synthetic Senzing JSON lines to filename. The same seed gives the same records. '''
+
+    lines = generate_records(
+        records,
+        seed,
+        configuration_locator["generate_records_duplicate_rate"]["default"],
+        configuration_locator["generate_records_overlap_rate"]["default"],
+        [data_source],
+    )
+    write_file_atomically(filename, "".join(lines))
+
+
+def get_rabbitmq_queue_totals(environment):
+    ''' Return (published, messages) summed over SENZING_RABBITMQ_QUEUE and its shards, from the RabbitMQ management API. '''
+
+    url = "http://{0}:{1}/api/queues/%2F?columns=name,messages,message_stats.publish".format(
+        environment.get("SENZING_DOCKER_HOST_IP_ADDR"),
+        environment.get("SENZING_DOCKER_PORT_RABBITMQ_UI"),
+    )
+    credentials = "{0}:{1}".format(environment.get("SENZING_RABBITMQ_USERNAME"), environment.get("SENZING_RABBITMQ_PASSWORD"))
+    request = urllib.request.Request(url, headers={"Authorization": "Basic {0}".format(base64.b64encode(credentials.encode()).decode())})
+    with urllib.request.urlopen(request, timeout=10) as response:
+        queues = json.loads(response.read().decode())
+
+    queue_pattern = re.compile("{0}(-[0-9]+)?".format(re.escape(environment.get("SENZING_RABBITMQ_QUEUE"))))
+    published = 0
+    messages = 0
+    for queue in queues:
+        if queue_pattern.fullmatch(queue.get("name", "")):
+            published += queue.get("message_stats", {}).get("publish", 0)
+            messages += queue.get("messages", 0)
+    return published, messages
+
 
-    filename = "{0}/docker-environment-vars.sh".format(output_directory)
-    with open(filename, 'w') as file:
-        logging.info(message_warning(165, filename))
-        file.write(file_docker_environment_vars.__doc__.format(**variables))
-    os.chmod(filename, 0o755)
+def get_loader_log_offsets(environment):
+    ''' Return {filename: size} for the logs of every stream-loader replica. '''
 
-    filename = "{0}/senzing-info.sh".format(output_directory)
-    with open(filename, 'w') as file:
-        logging.info(message_warning(165, filename))
-        file.write(file_senzing_info.__doc__.format(**variables))
-    os.chmod(filename, 0o755)
+    log = environment.get("SENZING_LOG_STREAM_LOADER")
+    directory = os.path.dirname(log)
+    replica_pattern = re.compile("{0}(-[0-9]+)?\\.log".format(re.escape(os.path.basename(log)[:-len(".log")])))
+    filenames = [log]
+    if os.path.isdir(directory):
+        filenames += ["{0}/{1}".format(directory, x) for x in sorted(os.listdir(directory)) if replica_pattern.fullmatch(x) and x != os.path.basename(log)]
+    return {x: os.path.getsize(x) if os.path.exists(x) else 0 for x in filenames}
 
 
-def project_create_setupenv_docker(config):
+def count_loader_log_errors(offsets):
+    ''' Count error messages written to stream-loader logs after offsets. Advance offsets past them. '''
 
-    # Pull configuration variables
+    result = 0
+    for filename in list(offsets):
+        try:
+            with open(filename, "rb") as file:
+                file.seek(offsets[filename])
+                content = file.read()
+        except OSError:
+            continue
+        offsets[filename] += len(content)
+        result += len(benchmark_loader_error_pattern.findall(content))
+    return result
 
-    project_dir = config.get("project_dir")
 
-    output_filename = "{0}/docker-setupEnv".format(project_dir)
-    backup_filename = "{0}.{1}".format(output_filename, int(time.time()))
+def get_time_at_count(samples, key, count):
+    ''' Return the time samples[key] reached count, interpolated between samples, or None if it never did. '''
 
-    # If output file exists, back it up.
+    previous = {"time": 0.0, key: 0}
+    for sample in samples:
+        if sample[key] >= count:
+            if sample[key] == previous[key]:
+                return sample["time"]
+            fraction = (count - previous[key]) / (sample[key] - previous[key])
+            return previous["time"] + fraction * (sample["time"] - previous["time"])
+        previous = sample
+    return None
 
-    if os.path.exists(output_filename):
-        logging.info(message_info(161, backup_filename, output_filename))
-        shutil.move(output_filename, backup_filename)
 
-    docstring = """#! /usr/bin/env bash
+def get_percentile(values, percent):
+    ''' Return the nearest-rank percentile of sorted values. '''
 
-export SENZING_PROJECT_DIR={project_dir}
+    if not values:
+        return None
+    return values[min(len(values) - 1, max(0, int(round(percent / 100.0 * len(values))) - 1))]
 
-export SENZING_DATA_DIR=${{SENZING_PROJECT_DIR}}/data
-export SENZING_DATA_VERSION_DIR=${{SENZING_PROJECT_DIR}}/data
-export SENZING_ETC_DIR=${{SENZING_PROJECT_DIR}}/docker-etc
-export SENZING_G2_DIR=${{SENZING_PROJECT_DIR}}
-export SENZING_VAR_DIR=${{SENZING_PROJECT_DIR}}/var
 
-export POSTGRES_DIR=${{SENZING_PROJECT_DIR}}/var/postgres
-export RABBITMQ_DIR=${{SENZING_PROJECT_DIR}}/var/rabbitmq
+def get_benchmark_result(samples, records):
+    ''' Summarize samples of {"time", "published", "loaded", "depth", "loader_errors"}.
 
-mkdir -p  ${{SENZING_PROJECT_DIR}}/var/postgres
-chmod 777 ${{SENZING_PROJECT_DIR}}/var/postgres
+        The queue is first in, first out, so record N is loaded when "loaded" reaches N,
+        having been published when "published" reached N.
+        Per-record latency is the time between the two.
+    '''
 
-mkdir -p  ${{SENZING_PROJECT_DIR}}/var/rabbitmq
-chmod 777 ${{SENZING_PROJECT_DIR}}/var/rabbitmq
+    loaded = max([x["loaded"] for x in samples] or [0])
+    published_at = get_time_at_count(samples, "published", records)
+    loaded_at = get_time_at_count(samples, "loaded", records)
+
+    latencies = []
+    for point in range(1, benchmark_latency_points + 1):
+        count = max(1, records * point // benchmark_latency_points)
+        record_loaded_at = get_time_at_count(samples, "loaded", count)
+        record_published_at = get_time_at_count(samples, "published", count)
+        if record_loaded_at is None or record_published_at is None:
+            break
+        latencies.append(max(0.0, record_loaded_at - record_published_at))
+    latencies.sort()
+
+    interval_rates = []
+    previous = {"time": 0.0, "loaded": 0}
+    for sample in samples:
+        if sample["time"] > previous["time"]:
+            interval_rates.append((sample["loaded"] - previous["loaded"]) / (sample["time"] - previous["time"]))
+        previous = sample
+
+    def rounded(value, digits=3):
+        return None if value is None else round(value, digits)
 
-""".format(project_dir=project_dir)
+    return {
+        "completed": loaded_at is not None,
+        "records_loaded": min(loaded, records),
+        "records_per_second": rounded(records / loaded_at if loaded_at else None, 1),
+        "peak_records_per_second": rounded(max(interval_rates or [0.0]), 1),
+        "latency_in_seconds": {
+            "p50": rounded(get_percentile(latencies, 50)),
+            "p99": rounded(get_percentile(latencies, 99)),
+            "max": rounded(latencies[-1] if latencies else None),
+        },
+        "time_to_publish_in_seconds": rounded(published_at),
+        "time_to_load_in_seconds": rounded(loaded_at),
+        "time_to_drain_in_seconds": rounded(loaded_at - published_at if loaded_at is not None and published_at is not None else None),
+        "loader_errors": sum([x["loader_errors"] for x in samples]),
+    }
 
-    logging.info(message_info(165, output_filename))
-    with open(output_filename, "w") as text_file:
-        text_file.write(docstring)
 
-    os.chmod(output_filename, 0o755)
+def run_benchmark_load(project_dir, environment, dataset_filename, records, sample_period_in_seconds, timeout_in_seconds):
+    ''' Send dataset_filename with senzing-stream-producer.sh and sample the queue until it is loaded. Return samples. '''
 
+    # Counters of the management API are cumulative, so sample from a baseline.
 
-def project_create_var_log_directory(project_dir):
+    baseline = None
+    while baseline is None:
+        try:
+            baseline = get_rabbitmq_queue_totals(environment)
+        except (OSError, ValueError) as err:
+            logging.warning(message_warning(358, err))
+            time.sleep(sample_period_in_seconds)
+    baseline_published, baseline_messages = baseline
+    if baseline_messages:
+        logging.warning(message_warning(357, baseline_messages))
+    loader_log_offsets = get_loader_log_offsets(environment)
+
+    # Start producers, and sample while they run.
+
+    samples = []
+    start_time = time.time()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        producer = executor.submit(run_docker_bin_script, project_dir, "senzing-stream-producer.sh", "up", ["--input", dataset_filename, "--record-max", "0"])
+        while time.time() - start_time < timeout_in_seconds:
+            time.sleep(sample_period_in_seconds)
+
+            if producer.done():
+                returncode, output, elapsed_time = producer.result()
+                if returncode != 0:
+                    logging.error(message_error(703, "senzing-stream-producer.sh", returncode, output))
+                    break
 
-    # Specify output directory and backup directory.
+            try:
+                published, messages = get_rabbitmq_queue_totals(environment)
+            except (OSError, ValueError) as err:
+                logging.warning(message_warning(358, err))
+                continue
+
+            sample = {
+                "time": round(time.time() - start_time, 3),
+                "published": published - baseline_published,
+                "loaded": (published - messages) - (baseline_published - baseline_messages),
+                "depth": messages,
+                "loader_errors": count_loader_log_errors(loader_log_offsets),
+            }
+            samples.append(sample)
+            logging.info(message_info(145, sample["time"], sample["published"], sample["loaded"], sample["depth"]))
+
+            if sample["loaded"] >= records and sample["depth"] == 0:
+                break
+
+    return samples
 
-    output_directory = "{0}/var/log".format(project_dir)
-    backup_directory = "{0}.{1}".format(output_directory, int(time.time()))
+# -----------------------------------------------------------------------------
+# Project generation
+# -----------------------------------------------------------------------------
 
-    # If output directory exists, back it up.
 
-    if os.path.exists(output_directory):
-        logging.info(message_info(161, backup_directory, output_directory))
-        shutil.move(output_directory, backup_directory)
+def project_add_docker_support_linux(config, docker_bin_files):
+    ''' Add docker support to the project in config["project_dir"]. '''
 
-    # Make .../docker-bin directory.
+    # Pull configuration variables.
 
-    try:
-        os.makedirs(output_directory, exist_ok=True)
-    except PermissionError as err:
-        exit_error(702, output_directory, err)
+    project_dir = config.get("project_dir")
+    project_name = config.get("project_name")
+    docker_host_ip_addr = config.get("docker_host_ip_addr") or get_docker_host_ip_addr(project_dir)
+    sql_connection = config.get("sql_connection")
 
+    # Do work.
 
-def project_modify_G2Module_ini(project_dir):
+    project_copy_etc(project_dir)
+    project_modify_G2Module_ini(project_dir, config.get("database_cluster"), sql_connection)
+    project_create_setupenv_docker(config)
+    project_create_docker_bin_directory(project_dir)
+    project_create_var_log_directory(project_dir)
+    variables = get_docker_environment_variables(project_dir, project_name, docker_host_ip_addr, sql_connection, config)
+    project_create_docker_bin_files(project_dir, render_templates(docker_bin_files, variables), config.get("overwrite_edited"))
+    backups_prune(project_dir, config.get("backup_keep_count"), config.get("backup_keep_days"))
 
-    g2module_ini_for_docker = {
-        "PIPELINE": {
-            "CONFIGPATH": "/etc/opt/senzing",
-            "LICENSEFILE": "/etc/opt/senzing/g2.lic",
-            "RESOURCEPATH": "/opt/senzing/g2/resources",
-            "SUPPORTPATH": "/opt/senzing/data",
-        },
-    }
 
-    # Synthesize variables.
+def project_add_docker_support_macos(config, docker_bin_files):
+    ''' Add docker support to the project in config["project_dir"]. '''
 
-    filename = "{0}/docker-etc/G2Module.ini".format(project_dir)
+    # Pull configuration variables.
 
-    # Read G2Module.ini.
+    g2_database_url = config.get("g2_database_url")
+    project_dir = config.get("project_dir")
+    project_name = config.get("project_name")
+    docker_host_ip_addr = config.get("docker_host_ip_addr") or get_docker_host_ip_addr(project_dir)
 
-    config_parser = configparser.ConfigParser()
-    config_parser.optionxform = str  # Maintain case of keys.
-    config_parser.read(filename)
+    # Do work.
 
-    #  Verify values.
+    project_create_docker_bin_directory(project_dir)
+    project_create_var_log_directory(project_dir)
+    variables = get_docker_environment_variables_macos(project_dir, project_name, docker_host_ip_addr, g2_database_url, config)
+    project_create_docker_bin_files(project_dir, render_templates(docker_bin_files, variables), config.get("overwrite_edited"))
+    backups_prune(project_dir, config.get("backup_keep_count"), config.get("backup_keep_days"))
 
-    logging.info(message_info(102, filename))
-    for section, options in g2module_ini_for_docker.items():
-        for option, docker_value in options.items():
-            try:
-                value = config_parser.get(section, option)
-                if value != docker_value:
-                    config_parser[section][option] = docker_value
-                    logging.info(message_info(103, section, option, value, docker_value))
-                else:
-                    logging.info(message_info(104, section, option, value))
-            except:
-                logging.info(message_info(105, section, option))
 
-    # If needed, modify SQL.CONNECTION
+def get_projects(projects_file):
+    ''' Read --projects-file.  Each line is a project directory, or a JSON object of
+        configuration values for one project, e.g. {"project_dir": "/x", "project_name": "x"}.
+        Blank lines and lines starting with "#" are ignored.  "-" reads stdin.
+    '''
 
-    section = "SQL"
-    option = "CONNECTION"
-    try:
-        old_database_url = config_parser.get(section, option)
-        if old_database_url.find("sqlite") == 0:
-            new_database_url = "sqlite3://na:na@/var/opt/senzing/sqlite/G2C.db"
-            config_parser[section][option] = new_database_url
-            logging.info(message_info(103, section, option, old_database_url, new_database_url))
-    except:
-        logging.info(message_info(105, section, option))
+    if projects_file == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(projects_file, 'r') as file:
+            lines = file.read().splitlines()
 
-    # Remove SQL.G2CONFIGFILE option.
+    result = []
+    project_dirs = set()
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("{"):
+            try:
+                project = json.loads(line)
+            except ValueError as err:
+                exit_error(709, projects_file, line_number, err)
+        else:
+            project = {"project_dir": line}
+        unknown_keys = sorted(set(project) - set(configuration_locator))
+        if unknown_keys:
+            exit_error(709, projects_file, line_number, "Unknown configuration keys: {0}".format(", ".join(unknown_keys)))
+        if not project.get("project_dir"):
+            exit_error(709, projects_file, line_number, "project_dir is missing")
+        project["project_dir"] = os.path.abspath(os.path.expanduser(project["project_dir"]))
+        if project["project_dir"] in project_dirs:
+            exit_error(709, projects_file, line_number, "{0} is listed more than once".format(project["project_dir"]))
+        project_dirs.add(project["project_dir"])
+        result.append(project)
+    return result
 
-    config_parser.remove_option('SQL', 'G2CONFIGFILE')
-    logging.info(message_info(106, 'SQL', 'G2CONFIGFILE'))
 
-    # Write out contents.
+def run_projects(config, add_docker_support, docker_bin_files):
+    ''' Run add_docker_support() for each project in --projects-file using a pool of workers.
+        Configuration is parsed once; each project's values override it and are normalized and validated
+        like command-line options.  Return the projects that failed.
+    '''
 
-    logging.info(message_info(119, filename, ""))
-    with open(filename, 'w') as output_file:
-        config_parser.write(output_file)
+    projects = get_projects(config.get("projects_file"))
+    project_workers = min(config.get("project_workers"), max(len(projects), 1))
+
+    def run_project(project):
+        start_time = time.time()
+        try:
+            project_config = dict(config)
+            project_config.update(project)
+            normalize_configuration(project_config)
+            validate_configuration(project_config)
+            add_docker_support(project_config, docker_bin_files)
+            error = None
+        except SystemExit:
+            error = "See errors above."
+        except Exception as err:
+            error = "{0}: {1}".format(type(err).__name__, err)
+        return error, time.time() - start_time
+
+    start_time = time.time()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=project_workers) as executor:
+        results = list(executor.map(run_project, projects))
+
+    # Summary, in the order of --projects-file.
+
+    failed = []
+    for project, (error, elapsed_time) in zip(projects, results):
+        if error:
+            failed.append(project["project_dir"])
+            logging.error(message_error(723, project["project_dir"], elapsed_time, error))
+        else:
+            logging.info(message_info(133, project["project_dir"], elapsed_time))
+    logging.info(message_info(135, len(projects) - len(failed), len(projects), time.time() - start_time, project_workers))
+    return failed
 
 # -----------------------------------------------------------------------------
 # do_* functions
@@ -3790,23 +7122,19 @@ def do_add_docker_support_linux(args):
     # Get context from CLI, environment variables, and ini files.
 
     config = get_configuration(args)
+    validate_configuration(config)
 
     # Prolog.
 
     logging.info(entry_template(config))
 
-    # Pull configuration variables.
-
-    project_dir = config.get("project_dir")
-    project_name = config.get("project_name")
-    docker_host_ip_addr = config.get("docker_host_ip_addr")
-    sql_connection = config.get("sql_connection")
-
     # Identify files to be created in <project>/docker-bin
 
     docker_bin_files = {
-#        "docker-images-load.sh": file_docker_images_load,
-#        "docker-images-save.sh": file_docker_images_save,
+        "docker-images-load.sh": file_docker_images_load,
+        "docker-images-save.sh": file_docker_images_save,
+        "docker-environment-vars.sh": file_docker_environment_vars,
+        "docker-functions.sh": file_docker_functions,
         "docker-pull-latest.sh": file_docker_pull_latest,
         "portainer.sh": file_portainer,
         "postgres.sh": file_postgres,
@@ -3819,10 +7147,12 @@ def do_add_docker_support_linux(args):
         "senzing-init-container.sh": file_senzing_init_container,
         "senzing-jupyter.sh": file_senzing_jupyter,
         "senzing-mssql-driver-installer.sh": file_senzing_mssql_driver_installer,
+        "senzing-pgbouncer.sh": file_senzing_pgbouncer,
         "senzing-phppgadmin.sh": file_senzing_phppgadmin,
         "senzing-postgresql-init.sh": file_senzing_postgresql_init,
         "senzing-quickstart-demo.sh": file_senzing_quickstart_demo,
         "senzing-rabbitmq.sh": file_senzing_rabbitmq,
+        "senzing-registry-mirror.sh": file_senzing_registry_mirror,
         "senzing-sqlite-web.sh": file_senzing_sqlite_web,
         "senzing-sshd.sh": file_senzing_sshd,
         "senzing-stream-loader.sh": file_senzing_stream_loader,
@@ -3836,18 +7166,19 @@ def do_add_docker_support_linux(args):
 
     # Do work.
 
-    project_copy_etc(project_dir)
-    project_modify_G2Module_ini(project_dir)
-    project_create_setupenv_docker(config)
-    project_create_docker_bin_directory(project_dir)
-    project_create_var_log_directory(project_dir)
-    project_create_docker_environment_vars(project_dir, project_name, docker_host_ip_addr, sql_connection)
-    project_create_docker_bin_files(project_dir, docker_bin_files)
+    failed = []
+    if config.get("projects_file"):
+        failed = run_projects(config, project_add_docker_support_linux, docker_bin_files)
+    else:
+        project_add_docker_support_linux(config, docker_bin_files)
 
     # Epilog.
 
     logging.info(exit_template(config))
 
+    if failed:
+        exit_error(708, ", ".join(failed))
+
 
 def do_add_docker_support_macos(args):
     ''' Do a task. '''
@@ -3855,23 +7186,19 @@ def do_add_docker_support_macos(args):
     # Get context from CLI, environment variables, and ini files.
 
     config = get_configuration(args)
+    validate_configuration(config)
 
     # Prolog.
 
     logging.info(entry_template(config))
 
-    # Pull configuration variables.
-
-    docker_host_ip_addr = config.get("docker_host_ip_addr")
-    g2_database_url = config.get("g2_database_url")
-    project_dir = config.get("project_dir")
-    project_name = config.get("project_name")
-
     # Identify files to be created in <project>/docker-bin
 
     docker_bin_files = {
-#        "docker-images-load.sh": file_docker_images_load,
-#        "docker-images-save.sh": file_docker_images_save,
+        "docker-images-load.sh": file_docker_images_load,
+        "docker-images-save.sh": file_docker_images_save,
+        "docker-environment-vars.sh": file_docker_environment_vars,
+        "docker-functions.sh": file_docker_functions,
         "docker-pull-latest.sh": file_docker_pull_latest,
         "portainer.sh": file_portainer,
         "postgres.sh": file_postgres,
@@ -3884,10 +7211,12 @@ def do_add_docker_support_macos(args):
         "senzing-init-container.sh": file_senzing_init_container,
         "senzing-jupyter.sh": file_senzing_jupyter,
         "senzing-mssql-driver-installer.sh": file_senzing_mssql_driver_installer,
+        "senzing-pgbouncer.sh": file_senzing_pgbouncer,
         "senzing-phppgadmin.sh": file_senzing_phppgadmin,
         "senzing-postgresql-init.sh": file_senzing_postgresql_init,
         "senzing-quickstart-demo.sh": file_senzing_quickstart_demo,
         "senzing-rabbitmq.sh": file_senzing_rabbitmq,
+        "senzing-registry-mirror.sh": file_senzing_registry_mirror,
         "senzing-sqlite-web.sh": file_senzing_sqlite_web,
         "senzing-sshd.sh": file_senzing_sshd,
         "senzing-stream-loader.sh": file_senzing_stream_loader,
@@ -3901,15 +7230,191 @@ def do_add_docker_support_macos(args):
 
     # Do work.
 
-    project_create_docker_bin_directory(project_dir)
-    project_create_var_log_directory(project_dir)
-    project_create_docker_environment_vars_macos(project_dir, project_name, docker_host_ip_addr, g2_database_url)
-    project_create_docker_bin_files(project_dir, docker_bin_files)
+    failed = []
+    if config.get("projects_file"):
+        failed = run_projects(config, project_add_docker_support_macos, docker_bin_files)
+    else:
+        project_add_docker_support_macos(config, docker_bin_files)
+
+    # Epilog.
+
+    logging.info(exit_template(config))
+
+    if failed:
+        exit_error(708, ", ".join(failed))
+
+
+def do_backups_list(args):
+    ''' List backups in <project>/var/backups. '''
+
+    # Get context from CLI, environment variables, and ini files.
+
+    config = get_configuration(args)
+
+    # Prolog.
+
+    logging.info(entry_template(config))
+
+    # Pull configuration variables.
+
+    project_dir = config.get("project_dir")
+
+    # Do work.
+
+    backups = get_backups(project_dir)
+    if not backups:
+        logging.info(message_info(186, get_backups_dir(project_dir)))
+    for backup in backups:
+        files = backup.get("files", {})
+        logging.info(message_info(
+            182,
+            backup.get("id"),
+            time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(backup.get("timestamp", 0))),
+            backup.get("path"),
+            len(files),
+            sum(x.get("size", 0) for x in files.values())))
+
+    # Epilog.
+
+    logging.info(exit_template(config))
+
+
+def do_backups_prune(args):
+    ''' Import legacy backups, then remove backups outside the retention policy. '''
+
+    # Get context from CLI, environment variables, and ini files.
+
+    config = get_configuration(args)
+
+    # Prolog.
+
+    logging.info(entry_template(config))
+
+    # Pull configuration variables.
+
+    project_dir = config.get("project_dir")
+
+    # Do work.
+
+    backups_import_legacy(project_dir)
+    backups_prune(project_dir, config.get("backup_keep_count"), config.get("backup_keep_days"))
+
+    # Epilog.
+
+    logging.info(exit_template(config))
+
+
+def do_backups_restore(args):
+    ''' Restore the files in a backup. '''
+
+    # Get context from CLI, environment variables, and ini files.
+
+    config = get_configuration(args)
+
+    # Prolog.
+
+    logging.info(entry_template(config))
+
+    # Do work.
+
+    backups_restore(config.get("project_dir"), config.get("backup_id"))
+
+    # Epilog.
+
+    logging.info(exit_template(config))
+
+
+def do_benchmark_load(args):
+    ''' Measure loading throughput of <project>/docker-bin and write a JSON report. '''
+
+    # Get context from CLI, environment variables, and ini files.
+
+    config = get_configuration(args)
+    validate_configuration(config)
+
+    # Prolog.
+
+    logging.info(entry_template(config))
+
+    # Pull configuration variables.
+
+    project_dir = config.get("project_dir")
+    loaders = config.get("benchmark_loaders")
+    records = config.get("benchmark_records")
+    report_filename = config.get("benchmark_report")
+    sample_period_in_seconds = config.get("benchmark_sample_period_in_seconds")
+    seed = config.get("benchmark_seed")
+    timeout_in_seconds = config.get("benchmark_timeout_in_seconds")
+
+    environment = get_project_environment(project_dir, benchmark_environment_variables)
+    if not loaders:
+        loaders = int(environment.get("SENZING_STREAM_LOADER_REPLICAS") or 1)
+    benchmark_dir = "{0}/var/benchmark".format(project_dir)
+    os.makedirs(benchmark_dir, exist_ok=True)
+    started = time.strftime("%Y-%m-%dT%H:%M:%S%z")
+    if not report_filename:
+        report_filename = "{0}/benchmark-load-{1}.json".format(benchmark_dir, time.strftime("%Y%m%d%H%M%S"))
+
+    # Synthetic datasets are kept, so runs of the same size and seed send the same records.
+
+    dataset_filename = "{0}/dataset-{1}-{2}.json".format(benchmark_dir, records, seed)
+    if not os.path.exists(dataset_filename):
+        write_benchmark_dataset(dataset_filename, records, seed, environment.get("SENZING_STREAM_LOADER_DATA_SOURCE") or "TEST")
+    logging.info(message_info(144, records, dataset_filename))
+
+    # Bring up the database, RabbitMQ, and stream-loaders.
+
+    services = ["senzing-stream-loader.sh"]
+    database_scheme = get_project_database_scheme(project_dir)
+    include_pgbouncer = get_project_uses_pgbouncer(project_dir)
+    graph = get_project_docker_bin_graph(project_dir, services)
+    failed = run_docker_bin_graph(project_dir, graph, {"senzing-stream-loader.sh": ["--replicas", str(loaders)]})
+    if failed:
+        exit_error(705, ", ".join(sorted(failed)))
+
+    # Send the dataset and sample until it is loaded.
+
+    samples = run_benchmark_load(project_dir, environment, dataset_filename, records, sample_period_in_seconds, timeout_in_seconds)
+    result = get_benchmark_result(samples, records)
+
+    # Write report.
+
+    report = {
+        "benchmark": "load",
+        "started": started,
+        "project_dir": project_dir,
+        "program_version": __version__,
+        "configuration": {
+            "records": records,
+            "seed": seed,
+            "dataset": dataset_filename,
+            "database": database_scheme,
+            "database_pooler": include_pgbouncer,
+            "loaders": loaders,
+            "loader_threads_per_process": int(environment.get("SENZING_STREAM_LOADER_THREADS_PER_PROCESS") or 1),
+            "loader_prefetch_count": int(environment.get("SENZING_STREAM_LOADER_PREFETCH_COUNT") or 1),
+            "producer_ranges": int(environment.get("SENZING_STREAM_PRODUCER_RANGES") or 1),
+            "rabbitmq_queue_type": environment.get("SENZING_RABBITMQ_QUEUE_TYPE"),
+            "rabbitmq_shards": int(environment.get("SENZING_RABBITMQ_SHARDS") or 1),
+            "sample_period_in_seconds": sample_period_in_seconds,
+        },
+        "result": result,
+        "samples": samples,
+    }
+    write_file_atomically(report_filename, json.dumps(report, indent=4) + "\n")
+
+    if result.get("completed"):
+        latency = result.get("latency_in_seconds")
+        logging.info(message_info(146, records, result.get("records_per_second"), latency.get("p50"), latency.get("p99"), result.get("time_to_drain_in_seconds")))
+    logging.info(message_info(147, report_filename))
 
     # Epilog.
 
     logging.info(exit_template(config))
 
+    if not result.get("completed"):
+        exit_error(718, timeout_in_seconds, result.get("records_loaded"), records, report_filename)
+
 
 def do_docker_acceptance_test(args):
     ''' For use with Docker acceptance testing. '''
@@ -3956,6 +7461,77 @@ def do_docker_host(args):
     logging.info(exit_template(config))
 
 
+def do_generate_records(args):
+    ''' Generate synthetic Senzing records to a JSON lines file or into RabbitMQ. '''
+
+    # Get context from CLI, environment variables, and ini files.
+
+    config = get_configuration(args)
+    validate_configuration(config)
+
+    # Prolog.  stdout may be the records, so only log.
+
+    logging.info(entry_template(config))
+
+    # Pull configuration variables.
+
+    project_dir = config.get("project_dir")
+    count = config.get("generate_records_count")
+    output = config.get("generate_records_output")
+    ranges = config.get("generate_records_ranges")
+
+    lines = generate_records(
+        count,
+        config.get("generate_records_seed"),
+        config.get("generate_records_duplicate_rate"),
+        config.get("generate_records_overlap_rate"),
+        config.get("generate_records_data_sources"),
+    )
+
+    # Do work.
+
+    start_time = time.time()
+    if config.get("generate_records_rabbitmq"):
+        environment = get_project_environment(project_dir, ["SENZING_RABBITMQ_QUEUE", "SENZING_STREAM_PRODUCER_RANGES"])
+        if not ranges:
+            ranges = int(environment.get("SENZING_STREAM_PRODUCER_RANGES") or 1)
+
+        # Bring up what senzing-stream-producer.sh depends on.
+
+        graph = get_project_docker_bin_graph(project_dir, ["senzing-stream-producer.sh"])
+        graph.pop("senzing-stream-producer.sh")
+        failed = run_docker_bin_graph(project_dir, graph)
+        if failed:
+            exit_error(705, ", ".join(sorted(failed)))
+
+        written = send_records_to_rabbitmq(project_dir, lines, ranges)
+        if written < count:
+            exit_error(722, count)
+        destination = environment.get("SENZING_RABBITMQ_QUEUE")
+    elif output == "-":
+        try:
+            written = write_records(lines, [sys.stdout])
+            sys.stdout.flush()
+        except BrokenPipeError:
+
+            # The reader, e.g. "head", stopped reading.  Python flushes stdout again at exit, so point it at devnull.
+
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            exit_silently()
+        destination = "stdout"
+    else:
+        with open(output, "w") as file:
+            written = write_records(lines, [file])
+        destination = output
+
+    elapsed_time = time.time() - start_time
+    logging.info(message_info(148, written, elapsed_time, written / max(elapsed_time, 0.001), destination))
+
+    # Epilog.
+
+    logging.info(exit_template(config))
+
+
 def do_sleep(args):
     ''' Sleep.  Used for debugging. '''
 
@@ -3988,6 +7564,51 @@ def do_sleep(args):
     logging.info(exit_template(config))
 
 
+def do_up(args):
+    ''' Bring up services in <project>/docker-bin. Independent services are started concurrently. '''
+
+    # Get context from CLI, environment variables, and ini files.
+
+    config = get_configuration(args)
+
+    # Prolog.
+
+    logging.info(entry_template(config))
+
+    # Pull configuration variables.
+
+    project_dir = config.get("project_dir")
+    services = config.get("services")
+
+    # Normalize and verify service names.  "stream-loader" is "senzing-stream-loader.sh".
+
+    normalized_services = []
+    for service in services:
+        candidates = [service, "{0}.sh".format(service), "senzing-{0}.sh".format(service)]
+        interactive_matches = [x for x in candidates if x in docker_bin_interactive_files]
+        if interactive_matches:
+            exit_error(724, interactive_matches[0], "{0}/docker-bin/{1}".format(project_dir, interactive_matches[0]))
+        matches = [x for x in candidates if x in docker_bin_dependencies]
+        if not matches:
+            exit_error(704, service, ", ".join(sorted(docker_bin_dependencies)))
+        normalized_services.append(matches[0])
+    services = normalized_services
+
+    # Do work.
+
+    graph = get_project_docker_bin_graph(project_dir, services)
+    start_time = time.time()
+    failed = run_docker_bin_graph(project_dir, graph)
+    logging.info(message_info(132, len(graph) - len(failed), time.time() - start_time))
+
+    # Epilog.
+
+    logging.info(exit_template(config))
+
+    if failed:
+        exit_error(705, ", ".join(sorted(failed)))
+
+
 def do_version(args):
     ''' Log version information. '''
 